@@ -0,0 +1,69 @@
+"""Capacity simulation: fill rate, stranded seats and split parties per night.
+
+Runs :func:`~src.core.simulation.run_simulation` for each automatic
+allocation strategy over the same seeded nights, spread across worker
+processes, and prints the mean, standard deviation and range of each metric.
+
+Usage
+-----
+``python -m benchmarks.capacity_simulation``                     default run
+``python -m benchmarks.capacity_simulation --nights 2000 -j 8``  bigger run
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+from src.core.simulation import METRICS, SimulationSpec, run_simulation
+from src.core.strategies import ALLOCATORS
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point.
+
+    :param argv: Arguments (default: ``sys.argv[1:]``).
+    :type argv: Optional[list[str]]
+    :return: Process exit status.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=26, help="rows in the house")
+    parser.add_argument("--cols", type=int, default=50, help="seats per row")
+    parser.add_argument("--nights", type=int, default=200, help="nights to simulate")
+    parser.add_argument(
+        "--demand", type=float, default=1.0, help="mean demand/capacity"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="run seed")
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="worker processes (all CPUs)"
+    )
+    parser.add_argument(
+        "--allocator",
+        action="append",
+        choices=sorted(ALLOCATORS),
+        help="strategy to simulate (repeatable; default: all)",
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        f"{'allocator':<10} {'metric':<15} {'mean':>9} {'stdev':>9} "
+        f"{'min':>7} {'max':>7}"
+    )
+    for name in args.allocator or sorted(ALLOCATORS):
+        spec = SimulationSpec(args.rows, args.cols, demand=args.demand, allocator=name)
+        start = time.perf_counter()
+        summary = run_simulation(spec, args.nights, args.seed, args.workers)
+        elapsed = time.perf_counter() - start
+        for metric in METRICS:
+            s = summary.stats[metric]
+            print(
+                f"{name:<10} {metric:<15} {s.mean:>9.3f} {s.stdev:>9.3f} "
+                f"{s.low:>7.2f} {s.high:>7.2f}"
+            )
+        print(f"{name:<10} {summary.nights} nights in {elapsed:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+"""Memory footprint benchmark: bytes per seat and bytes per booking.
+
+Builds :class:`~src.models.entities.Theater`, :class:`~src.models.context.AppContext`
+and :class:`~src.models.entities.Booking` populations for several house sizes
+and occupancies, for each occupancy backend (the list-of-lists grid, and the
+NumPy store when NumPy is installed), then measures retained memory two ways:
+
+* ``tracemalloc`` — bytes still allocated after construction (includes
+  allocator overhead, excludes objects that already existed, e.g. interned
+  strings);
+* a ``sys.getsizeof`` walker — the deep size of everything reachable from the
+  context (deterministic for a given Python version, so it is what baselines
+  are compared on).
+
+Usage
+-----
+``python -m benchmarks.memory_footprint``            print the report
+``python -m benchmarks.memory_footprint --update``   refresh the baseline
+``python -m benchmarks.memory_footprint --check``    fail on regressions
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+from dataclasses import asdict, dataclass
+from importlib.util import find_spec
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.core.occupancy import occupancy_factory
+from src.core.services.booking import BookingService
+from src.core.workload import WorkloadModel, fill_to_occupancy
+from src.models.context import AppContext
+from src.models.entities import Theater
+
+
+def _numpy_theater(title: str, rows: int, cols: int) -> Theater:
+    """Build a theater mirrored into the NumPy occupancy store."""
+    factory = occupancy_factory("numpy")
+    assert factory is not None
+    return Theater(title=title, rows=rows, cols=cols, occupancy=factory(rows, cols))
+
+
+#: Occupancy backends under test: name -> theater factory ``(title, rows, cols)``.
+BACKENDS: Dict[str, Callable[[str, int, int], Theater]] = {
+    "grid": lambda title, rows, cols: Theater(title=title, rows=rows, cols=cols),
+    "numpy": _numpy_theater,
+}
+#: Package each optional backend needs; backends without it are skipped.
+REQUIRES: Dict[str, str] = {"numpy": "numpy"}
+
+SIZES: Tuple[Tuple[int, int], ...] = ((8, 10), (26, 50))
+OCCUPANCIES: Tuple[float, ...] = (0.0, 0.5, 0.9)
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "memory.json")
+# Allowed growth of a metric over its baseline before --check fails.
+TOLERANCE = 0.10
+
+
+# One flat record per cell, stored as-is in the baseline JSON.
+@dataclass(frozen=True, slots=True)
+class Measurement:  # pylint: disable=too-many-instance-attributes
+    """One benchmark cell.
+
+    :param backend: Occupancy backend name.
+    :type backend: str
+    :param rows: Rows in the house.
+    :type rows: int
+    :param cols: Seats per row.
+    :type cols: int
+    :param occupancy: Target sold fraction.
+    :type occupancy: float
+    :param bookings: Bookings committed.
+    :type bookings: int
+    :param seat_bytes: Deep size of the empty theater per seat.
+    :type seat_bytes: float
+    :param booking_bytes: Deep size added per booking (0 when no bookings).
+    :type booking_bytes: float
+    :param traced_seat_bytes: ``tracemalloc`` retained bytes per seat (empty).
+    :type traced_seat_bytes: float
+    :param traced_booking_bytes: ``tracemalloc`` retained bytes per booking.
+    :type traced_booking_bytes: float
+    """
+
+    backend: str
+    rows: int
+    cols: int
+    occupancy: float
+    bookings: int
+    seat_bytes: float
+    booking_bytes: float
+    traced_seat_bytes: float
+    traced_booking_bytes: float
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used in the baseline file."""
+        return f"{self.backend}:{self.rows}x{self.cols}@{self.occupancy:g}"
+
+
+def deep_sizeof(root: Any) -> int:
+    """Return the summed :func:`sys.getsizeof` of everything reachable from *root*.
+
+    Each object is counted once. Classes, modules and functions are not
+    followed, since they are shared by every instance.
+
+    :param root: Object graph root.
+    :type root: Any
+    :return: Size in bytes.
+    :rtype: int
+    """
+    seen: set[int] = set()
+    stack: List[Any] = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, (type, type(sys), type(deep_sizeof))):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        else:
+            slots = getattr(type(obj), "__slots__", ())
+            stack.extend(getattr(obj, s) for s in slots if hasattr(obj, s))
+            if hasattr(obj, "__dict__"):
+                stack.append(obj.__dict__)
+    return total
+
+
+def _traced(build: Callable[[], Any]) -> Tuple[Any, int]:
+    """Run *build* and return its result with the bytes it left allocated."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return result, after - before
+
+
+def measure(
+    backend: str, rows: int, cols: int, occupancy: float, seed: int = 7
+) -> Measurement:
+    """Measure one ``(backend, size, occupancy)`` cell.
+
+    :param backend: Key of :data:`BACKENDS`.
+    :type backend: str
+    :param rows: Rows in the house.
+    :type rows: int
+    :param cols: Seats per row.
+    :type cols: int
+    :param occupancy: Target sold fraction.
+    :type occupancy: float
+    :param seed: Workload seed.
+    :type seed: int
+    :return: Measurement.
+    :rtype: Measurement
+    """
+    factory = BACKENDS[backend]
+    seats = rows * cols
+    factory("Bench", 1, 1)  # untraced, so one-time imports are not charged
+
+    empty, empty_traced = _traced(
+        lambda: AppContext(theater=factory("Bench", rows, cols))
+    )
+    empty_deep = deep_sizeof(empty)
+
+    def _fill() -> AppContext:
+        ctx = AppContext(theater=factory("Bench", rows, cols))
+        fill_to_occupancy(
+            ctx, BookingService(), occupancy, WorkloadModel(), random.Random(seed)
+        )
+        return ctx
+
+    full, full_traced = _traced(_fill)
+    n = len(full.bookings)
+    return Measurement(
+        backend=backend,
+        rows=rows,
+        cols=cols,
+        occupancy=occupancy,
+        bookings=n,
+        seat_bytes=round(empty_deep / seats, 2),
+        booking_bytes=round((deep_sizeof(full) - empty_deep) / n, 2) if n else 0.0,
+        traced_seat_bytes=round(empty_traced / seats, 2),
+        traced_booking_bytes=round((full_traced - empty_traced) / n, 2) if n else 0.0,
+    )
+
+
+def installed_backends() -> List[str]:
+    """Return the backends of :data:`BACKENDS` whose dependencies are installed.
+
+    :return: Backend names, in :data:`BACKENDS` order.
+    :rtype: list[str]
+    """
+    return [b for b in BACKENDS if b not in REQUIRES or find_spec(REQUIRES[b])]
+
+
+def run(
+    backends: Optional[Iterable[str]] = None,
+    sizes: Iterable[Tuple[int, int]] = SIZES,
+    occupancies: Iterable[float] = OCCUPANCIES,
+) -> List[Measurement]:
+    """Measure every combination of backend, size and occupancy.
+
+    :param backends: Backend names (default: :func:`installed_backends`).
+    :type backends: Optional[Iterable[str]]
+    :param sizes: ``(rows, cols)`` pairs.
+    :type sizes: Iterable[tuple[int, int]]
+    :param occupancies: Target sold fractions.
+    :type occupancies: Iterable[float]
+    :return: Measurements in iteration order.
+    :rtype: list[Measurement]
+    """
+    names = list(backends) if backends is not None else installed_backends()
+    occ = list(occupancies)
+    return [measure(b, r, c, o) for b in names for r, c in sizes for o in occ]
+
+
+def compare(
+    results: Iterable[Measurement],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float = TOLERANCE,
+) -> List[str]:
+    """Return human-readable regressions of *results* against *baseline*.
+
+    Only the deterministic ``getsizeof`` metrics are compared.
+
+    :param results: Fresh measurements.
+    :type results: Iterable[Measurement]
+    :param baseline: Mapping ``key -> measurement dict`` as stored on disk.
+    :type baseline: dict[str, dict[str, Any]]
+    :param tolerance: Allowed relative growth.
+    :type tolerance: float
+    :return: One message per regressed metric (empty if none).
+    :rtype: list[str]
+    """
+    problems: List[str] = []
+    for m in results:
+        base = baseline.get(m.key)
+        if base is None:
+            continue
+        for metric in ("seat_bytes", "booking_bytes"):
+            old, new = base[metric], getattr(m, metric)
+            if old and new > old * (1.0 + tolerance):
+                problems.append(f"{m.key} {metric}: {old} -> {new}")
+    return problems
+
+
+def _format(results: Iterable[Measurement]) -> str:
+    """Render measurements as an aligned text table."""
+    lines = [
+        f"{'cell':<22} {'bookings':>8} {'B/seat':>8} {'B/booking':>10} "
+        f"{'traced B/seat':>14} {'traced B/booking':>17}"
+    ]
+    for m in results:
+        lines.append(
+            f"{m.key:<22} {m.bookings:>8} {m.seat_bytes:>8} {m.booking_bytes:>10} "
+            f"{m.traced_seat_bytes:>14} {m.traced_booking_bytes:>17}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point.
+
+    :param argv: Arguments (default: ``sys.argv[1:]``).
+    :type argv: Optional[list[str]]
+    :return: Process exit status.
+    :rtype: int
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--update", action="store_true", help="rewrite the baseline")
+    parser.add_argument("--check", action="store_true", help="fail on regressions")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON path")
+    args = parser.parse_args(argv)
+
+    results = run()
+    print(_format(results))
+    for name in sorted(set(BACKENDS) - set(installed_backends())):
+        print(f"Skipped the {name} backend: {REQUIRES[name]} is not installed.")
+
+    if args.update:
+        # Entries of skipped backends are kept.
+        baseline: Dict[str, Any] = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, encoding="utf-8") as fh:
+                baseline = json.load(fh)
+        baseline.update((m.key, asdict(m)) for m in results)
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump(baseline, fh, indent=2)
+            fh.write("\n")
+        print(f"Baseline written to {args.baseline}")
+    if args.check:
+        with open(args.baseline, encoding="utf-8") as fh:
+            problems = compare(results, json.load(fh))
+        for p in problems:
+            print(f"REGRESSION {p}")
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
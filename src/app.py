@@ -9,13 +9,24 @@ All functions and classes here avoid business logic; they are orchestration only
 from typing import Dict, List
 
 from src.cli.command import Command, IO
+from src.cli.dashboard import Dashboard
 from src.cli.io import ConsoleIO
 from src.cli.registry import get_commands
-from src.core.renderers.ascii_renderer import AsciiRenderer
+from src.config import ProfileSettings, RenderSettings, Settings, load_settings
+from src.core.export import Exporter
+from src.core.layout import load_layout
+from src.core.occupancy import occupancy_factory
+from src.core.profiling import Profiler
+from src.core.renderers.base import Renderer
+from src.core.renderers.cached import CachingRenderer
+from src.core.renderers.factory import make_renderer
+from src.core.schedule import load_schedule, single_screening
+from src.core.search import SeatSearchIndex
 from src.core.services.booking import BookingService
+from src.core.tracing import Tracer, open_tracer
 from src.core.validators import parse_init_line
 from src.models.context import AppContext
-from src.models.entities import Theater
+from src.models.schedule import Schedule
 
 
 def _render_menu(commands: List[Command], ctx: AppContext, io: IO) -> None:
@@ -34,34 +45,83 @@ def _render_menu(commands: List[Command], ctx: AppContext, io: IO) -> None:
         io.write(cmd.display_label(ctx))
 
 
-def run_app() -> None:
-    """Program entry point.
+def _dispatch(
+    cmd: Command, ctx: AppContext, io: IO, tracer: Tracer, profiler: Profiler
+) -> None:
+    """Run *cmd* inside a root trace span and the profiler, if armed.
 
-    - Prompt user for ``[Title] [Rows] [SeatsPerRow]``.
-    - Build command objects (Book, Check, Exit).
-    - Loop on user selection and dispatch to the chosen command.
+    :param cmd: Selected command.
+    :type cmd: Command
+    :param ctx: Application context.
+    :type ctx: AppContext
+    :param io: IO adapter.
+    :type io: IO
+    :param tracer: Tracer owning the command span.
+    :type tracer: Tracer
+    :param profiler: On-demand profiler.
+    :type profiler: Profiler
     """
-    io: IO = ConsoleIO()
+    report = profiler.last_report
+    with tracer.span("command", command=cmd.meta.label, screen=ctx.theater.title):
+        with profiler.capture(cmd.meta.label):
+            cmd.run(ctx, io)
+    if profiler.last_report != report:
+        io.write(f"Profile report written to {profiler.last_report}")
+
+
+def _open_schedule(settings: Settings, io: IO) -> Schedule:
+    """Load the ``GIC_SCHEDULE`` file, or prompt for a single screening.
 
-    # Initialization
+    :param settings: Runtime settings.
+    :type settings: Settings
+    :param io: IO adapter used for the startup prompt.
+    :type io: IO
+    :return: Schedule with at least one screening.
+    :rtype: Schedule
+    """
+    allocator = settings.allocation.allocator
+    if settings.schedule_path:
+        return load_schedule(settings.schedule_path, allocator)
+    layout = load_layout(settings.layout_path) if settings.layout_path else None
     while True:
         init = io.prompt("Please enter [Title] [Rows] [SeatsPerRow]:\n> ")
         try:
-            title, rows, cols = parse_init_line(init)
-            break
+            return single_screening(
+                *parse_init_line(init), layout=layout, allocator=allocator
+            )
         except ValueError as exc:
             io.write(str(exc))
 
-    theater = Theater(title=title, rows=rows, cols=cols)
-    ctx = AppContext(theater=theater)
 
-    # Dependencies for commands
-    renderer = AsciiRenderer()
-    service = BookingService()
-    commands: List[Command] = get_commands(renderer=renderer, service=service)
-    index: Dict[str, Command] = {cmd.meta.key: cmd for cmd in commands}
+def _open_first_screening(schedule: Schedule) -> AppContext:
+    """Return a context on the first screening of *schedule*."""
+    first = next(iter(schedule))
+    ctx = AppContext(theater=schedule.materialise(first.key))
+    schedule.activate(ctx, first.key)
+    return ctx
+
+
+def _make_profiler(settings: ProfileSettings) -> Profiler:
+    """Return the profiler, armed for the first commands if configured."""
+    profiler = Profiler(out_dir=settings.out_dir)
+    if settings.commands:
+        profiler.arm(settings.commands, cpu=settings.cpu, memory=settings.memory)
+    return profiler
+
+
+def _make_renderer(settings: RenderSettings) -> Renderer:
+    """Return the configured seat map renderer, cached if enabled."""
+    renderer: Renderer = make_renderer(settings.renderer)
+    if settings.cache_size:
+        renderer = CachingRenderer(renderer, maxsize=settings.cache_size)
+    return renderer
 
-    # Main loop
+
+def _main_loop(
+    commands: List[Command], ctx: AppContext, io: IO, tracer: Tracer, profiler: Profiler
+) -> None:
+    """Show the menu and dispatch selections until a command exits."""
+    index: Dict[str, Command] = {cmd.meta.key: cmd for cmd in commands}
     while True:
         _render_menu(commands, ctx, io)
         choice = io.prompt("Please enter your selection:\n> ").strip()
@@ -69,4 +129,61 @@ def run_app() -> None:
         if not cmd:
             io.write("Invalid selection. Please choose one of the listed options.")
             continue
-        cmd.run(ctx, io)
+        _dispatch(cmd, ctx, io, tracer, profiler)
+
+
+def run_app() -> None:
+    """Program entry point.
+
+    - Prompt user for ``[Title] [Rows] [SeatsPerRow]`` (or load the schedule
+      named by ``GIC_SCHEDULE``).
+    - Build command objects (Book, Check, Exit, ...).
+    - Loop on user selection and dispatch to the chosen command.
+
+    Runtime settings (tracing, profiling, ...) are read from ``GIC_*`` environment
+    variables, see :func:`src.config.load_settings`. An invalid value is
+    reported on one line and the program exits with status 1.
+    """
+    io: IO = ConsoleIO()
+    try:
+        settings = load_settings()
+        occupancy = occupancy_factory(settings.allocation.occupancy)
+    except (ValueError, ImportError) as exc:
+        io.write(f"Invalid configuration: {exc}")
+        raise SystemExit(1) from None
+
+    schedule = _open_schedule(settings, io)
+    schedule.occupancy = occupancy
+    ctx = _open_first_screening(schedule)
+
+    # Dependencies for commands
+    tracing = settings.tracing
+    tracer = open_tracer(tracing.path, tracing.sample_rate, tracing.queue_size)
+    profiler = _make_profiler(settings.profiling)
+    rules = settings.allocation.spacing
+    service = BookingService(tracer=tracer, rules=rules)
+    search = SeatSearchIndex(schedule, service.events, rules=rules)
+    dashboard = Dashboard(
+        service,
+        screens=lambda: [(s.label(), s.theater) for s in schedule.materialised()],
+    )
+    exporter = Exporter(schedule)
+    commands: List[Command] = get_commands(
+        renderer=_make_renderer(settings.rendering),
+        service=service,
+        profiler=profiler,
+        dashboard=dashboard,
+        schedule=schedule,
+        search=search,
+        exporter=exporter,
+    )
+
+    try:
+        _main_loop(commands, ctx, io, tracer, profiler)
+    finally:
+        exporter.wait()  # let a running export finish its file
+        dashboard.stop()
+        search.close()
+        service.events.close()
+        profiler.close()
+        tracer.close()
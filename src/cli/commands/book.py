@@ -1,14 +1,19 @@
 """Book tickets command."""
 
 from dataclasses import dataclass, field
+from typing import Optional
 
 from src.cli.command import Command, CommandMeta, IO
-from src.core.renderers.base import Renderer
+from src.cli.io import LineCountingIO
+from src.core.errors import RuleViolation
+from src.core.renderers.base import Renderer, render_map
+from src.core.renderers.diff import DiffRenderer
 from src.core.services.booking import BookingService
 from src.core.validators import parse_ticket_count, validate_start_seat
 from src.models.context import AppContext
 from src.models.entities import Seat
 from src.core.seat_utils import parse_seat_code
+from src.core.tracing import annotate
 
 
 @dataclass(slots=True)
@@ -21,11 +26,17 @@ class BookContext:
     :type provisional_id: str
     :param preview_seats: Current preview seats for confirmation or reseat.
     :type preview_seats: list[Seat]
+    :param last_map: Latest seat map frame shown to the operator.
+    :type last_map: Optional[str]
+    :param map_end: Output line count right after the last full frame.
+    :type map_end: int
     """
 
     requested_tickets: int = 0
     provisional_id: str = ""
     preview_seats: list[Seat] = field(default_factory=list)
+    last_map: Optional[str] = None
+    map_end: int = 0
 
 
 class BookCommand(Command):
@@ -53,11 +64,16 @@ class BookCommand(Command):
 
         :param ctx: Application context.
         :type ctx: AppContext
-        :return: Menu label with title and available seats.
+        :return: Menu label with title, available seats and the largest
+            group that can still sit together in one row.
         :rtype: str
         """
         available = ctx.theater.available()
-        return f"[{self.meta.key}] {self.meta.label} for {ctx.theater.title} ({available} seats available)"
+        together = self._svc.preview_table(ctx).largest_group()
+        return (
+            f"[{self.meta.key}] {self.meta.label} for {ctx.theater.title} "
+            f"({available} seats available) [max {together} together]"
+        )
 
     def run(self, ctx: AppContext, io: IO) -> None:
         """Run the booking flow.
@@ -68,8 +84,13 @@ class BookCommand(Command):
         2. Show default auto-allocation preview.
         3. Allow manual reseat from a start seat (optional).
         4. Commit on acceptance.
+
+        Reseat previews only send the rows that changed since the previous
+        preview (rewritten in place on a terminal), see :class:`DiffRenderer`.
         """
         flow = BookContext()
+        io = LineCountingIO(io)
+        differ = DiffRenderer(ansi=io.isatty())
 
         while True:
             raw = io.prompt(
@@ -82,6 +103,7 @@ class BookCommand(Command):
             except ValueError as exc:
                 io.write(str(exc))
                 continue
+            annotate(party_size=flow.requested_tickets)
 
             try:
                 preview = self._svc.preview_auto(ctx, flow.requested_tickets)
@@ -101,7 +123,11 @@ class BookCommand(Command):
             )
             io.write(f"Booking id: {flow.provisional_id}")
             io.write("Selected seats:")
-            io.write(self._r.seat_map(ctx.theater, preview_seats=flow.preview_seats))
+            flow.last_map = render_map(
+                self._r, ctx.theater, preview_seats=flow.preview_seats
+            )
+            io.write(flow.last_map)
+            flow.map_end = io.lines
 
             # Reseat loop
             while True:
@@ -117,9 +143,10 @@ class BookCommand(Command):
 
                 try:
                     start_seat = parse_seat_code(raw_pos)
-                    validate_start_seat(ctx.theater, start_seat)
-                except ValueError as exc:
+                    validate_start_seat(ctx.theater, start_seat, self._svc.rules)
+                except (ValueError, RuleViolation) as exc:
                     io.write(str(exc))
+                    self._suggest(ctx, io, flow.requested_tickets)
                     continue
 
                 mpreview = self._svc.preview_manual(
@@ -129,10 +156,56 @@ class BookCommand(Command):
                     io.write(
                         "Unable to allocate from that position. Please try another start seat or press Enter to accept the suggestion."
                     )
+                    self._suggest(ctx, io, flow.requested_tickets)
                     continue
 
                 flow.preview_seats = mpreview
                 io.write("Updated selection:")
-                io.write(
-                    self._r.seat_map(ctx.theater, preview_seats=flow.preview_seats)
-                )
+                self._show_update(ctx, io, flow, differ)
+
+    def _suggest(self, ctx: AppContext, io: IO, k: int) -> None:
+        """Write the start seats a manual reseat of ``k`` seats would accept.
+
+        :param ctx: Application context.
+        :type ctx: AppContext
+        :param io: IO adapter.
+        :type io: IO
+        :param k: Party size.
+        :type k: int
+        """
+        starts = self._svc.suggest_start_seats(ctx, k)
+        if starts:
+            codes = ", ".join(s.seat.code() for s in starts)
+            io.write(f"Start seats that fit {k}: {codes}")
+
+    def _show_update(
+        self,
+        ctx: AppContext,
+        io: LineCountingIO,
+        flow: BookContext,
+        differ: DiffRenderer,
+    ) -> None:
+        """Show the new preview as a diff against the previous frame.
+
+        :param ctx: Application context.
+        :type ctx: AppContext
+        :param io: Line-counting IO adapter.
+        :type io: LineCountingIO
+        :param flow: Booking flow state (updated in place).
+        :type flow: BookContext
+        :param differ: Frame differ for this session.
+        :type differ: DiffRenderer
+        """
+        frame = render_map(self._r, ctx.theater, preview_seats=flow.preview_seats)
+        update = differ.update(
+            flow.last_map, frame, io.lines - flow.map_end, io.height()
+        )
+        flow.last_map = frame
+        if update.full:
+            io.write(update.text)
+            flow.map_end = io.lines
+        elif differ.ansi:
+            # In-place rewrite: the cursor ends where it started.
+            io.inner.write(update.text)
+        else:
+            io.write(update.text)
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 from src.cli.command import Command, CommandMeta, IO
-from src.core.renderers.base import Renderer
+from src.core.renderers.base import Renderer, render_map
 from src.core.services.booking import BookingService
 from src.core.validators import parse_booking_id
 from src.models.context import AppContext
@@ -75,4 +75,11 @@ class CheckCommand(Command):
                 io.write("Booking id not found. Please try again.")
                 continue
 
-            io.write(self._r.seat_map(ctx.theater, current_booking_id=flow.last_id))
+            io.write(
+                render_map(
+                    self._r,
+                    ctx.theater,
+                    current_booking_id=flow.last_id,
+                    focus=ctx.bookings[flow.last_id].seats,
+                )
+            )
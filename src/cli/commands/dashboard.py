@@ -0,0 +1,65 @@
+"""Live dashboard command."""
+
+from src.cli.command import Command, CommandMeta, IO
+from src.cli.dashboard import Dashboard
+from src.models.context import AppContext
+
+
+class DashboardCommand(Command):
+    """Start or stop the live occupancy dashboard on another terminal."""
+
+    meta = CommandMeta(
+        key="4",
+        label="Live dashboard",
+        help="Show auto-refreshing seat maps on a lobby or manager terminal.",
+    )
+
+    def __init__(self, dashboard: Dashboard) -> None:
+        """Create the command with the shared dashboard.
+
+        :param dashboard: Dashboard driven by booking commits.
+        :type dashboard: Dashboard
+        """
+        self._dashboard = dashboard
+
+    def display_label(self, ctx: AppContext) -> str:  # noqa: ARG002
+        """Return the menu label, noting where the dashboard is live.
+
+        :param ctx: Application context (unused).
+        :type ctx: AppContext
+        :return: Menu label.
+        :rtype: str
+        """
+        label = f"[{self.meta.key}] {self.meta.label}"
+        if self._dashboard.running:
+            label += f" (live on {self._dashboard.target})"
+        return label
+
+    def run(self, ctx: AppContext, io: IO) -> None:  # noqa: ARG002
+        """Stop a running dashboard, or prompt for an output and start one.
+
+        :param ctx: Application context (unused).
+        :type ctx: AppContext
+        :param io: IO adapter.
+        :type io: IO
+        """
+        if self._dashboard.running:
+            target = self._dashboard.target
+            self._dashboard.stop()
+            io.write(f"Dashboard on {target} stopped.")
+            return
+        while True:
+            path = io.prompt(
+                "Enter the terminal or file to show the dashboard on "
+                "(e.g. /dev/pts/2), or enter blank to go back to main menu:\n> "
+            ).strip()
+            if path == "":
+                return
+            try:
+                stream = open(path, "w", encoding="utf-8")
+            except OSError as exc:
+                io.write(f"Cannot open '{path}': {exc.strerror or exc}.")
+                continue
+            self._dashboard.start(stream, path, owns_stream=True)
+            io.write(f"Dashboard is live on {path}.")
+            return
@@ -8,7 +8,7 @@ class ExitCommand(Command):
     """Terminate the application gracefully."""
 
     meta = CommandMeta(
-        key="3",
+        key="10",
         label="Exit",
         help="Quit the application.",
     )
@@ -0,0 +1,68 @@
+"""Export command."""
+
+from src.cli.command import Command, CommandMeta, IO
+from src.core.export import Exporter
+from src.core.validators import parse_export_request
+from src.models.context import AppContext
+
+
+class ExportCommand(Command):
+    """Export bookings or occupancy summaries to CSV / JSON lines."""
+
+    meta = CommandMeta(
+        key="9",
+        label="Export bookings or occupancy",
+        help="Stream every booking, or occupancy per screening, to a CSV/JSONL file.",
+    )
+
+    def __init__(self, exporter: Exporter) -> None:
+        """Create the command with the shared background exporter.
+
+        :param exporter: Exporter writing reports off the menu thread.
+        :type exporter: Exporter
+        """
+        self._exporter = exporter
+
+    def display_label(self, ctx: AppContext) -> str:  # noqa: ARG002
+        """Return the menu label with the running or last export.
+
+        :param ctx: Application context (unused).
+        :type ctx: AppContext
+        :return: Menu label.
+        :rtype: str
+        """
+        label = f"[{self.meta.key}] {self.meta.label}"
+        if self._exporter.running:
+            label += f" (exporting to {self._exporter.target})"
+        elif self._exporter.last is not None:
+            label += f" (last: {self._exporter.last.describe()})"
+        return label
+
+    def run(self, ctx: AppContext, io: IO) -> None:  # noqa: ARG002
+        """Prompt for ``[bookings|occupancy] [Path]`` and start the export.
+
+        The export runs in the background; booking can continue meanwhile.
+
+        :param ctx: Application context (unused; every screening is exported).
+        :type ctx: AppContext
+        :param io: IO adapter.
+        :type io: IO
+        """
+        if self._exporter.running:
+            io.write(f"An export to {self._exporter.target} is still running.")
+            return
+        while True:
+            raw = io.prompt(
+                "Enter [bookings|occupancy] [Path] (.csv or .jsonl, optionally .gz) "
+                "to export, or enter blank to go back to main menu:\n> "
+            ).strip()
+            if raw == "":
+                return
+            try:
+                report, path = parse_export_request(raw)
+            except ValueError as exc:
+                io.write(str(exc))
+                continue
+            self._exporter.start(report, path)
+            io.write(f"Exporting {report} to {path} in the background.")
+            return
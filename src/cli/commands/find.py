@@ -0,0 +1,86 @@
+"""Find-seats-anywhere command."""
+
+from src.cli.command import Command, CommandMeta, IO
+from src.core.search import SeatSearchIndex
+from src.core.services.booking import BookingService
+from src.core.validators import parse_ticket_count
+from src.models.context import AppContext
+from src.models.schedule import Schedule
+
+
+class FindSeatsCommand(Command):
+    """Find the best screening of a film for a party sitting together."""
+
+    meta = CommandMeta(
+        key="6",
+        label="Find seats across screenings",
+        help="Search every screening of a title for adjacent seats and book them.",
+    )
+
+    def __init__(
+        self, schedule: Schedule, index: SeatSearchIndex, service: BookingService
+    ) -> None:
+        """Create the command with injected dependencies.
+
+        :param schedule: All screenings of the session.
+        :type schedule: Schedule
+        :param index: Free-seat index over *schedule*.
+        :type index: SeatSearchIndex
+        :param service: Booking service used to commit the found seats.
+        :type service: BookingService
+        """
+        self._schedule = schedule
+        self._index = index
+        self._svc = service
+
+    def display_label(self, ctx: AppContext) -> str:  # noqa: ARG002
+        """Return the static menu label for this command.
+
+        :param ctx: Application context (unused).
+        :type ctx: AppContext
+        :return: Menu label.
+        :rtype: str
+        """
+        return f"[{self.meta.key}] {self.meta.label}"
+
+    def run(self, ctx: AppContext, io: IO) -> None:
+        """Ask for a title and party size, show the best match, offer to book.
+
+        Booking switches the active screening to the one found.
+
+        :param ctx: Application context.
+        :type ctx: AppContext
+        :param io: IO adapter.
+        :type io: IO
+        """
+        title = io.prompt(
+            "Enter film title, or enter blank to go back to main menu:\n> "
+        ).strip()
+        if not title:
+            return
+        while True:
+            try:
+                k = parse_ticket_count(io.prompt("Enter number of seats together:\n> "))
+                break
+            except ValueError as exc:
+                io.write(str(exc))
+
+        found = self._index.find(title, k)
+        if found is None:
+            io.write(f"Sorry, no screening of {title} has {k} seats together.")
+            return
+        seats = found.seats
+        io.write(
+            f"Best match: {found.screening.label()}, seats "
+            f"{seats[0].code()}-{seats[-1].code()} "
+            f"({found.screening.available()} seats available)"
+        )
+        answer = io.prompt(
+            "Enter 'y' to book these seats, or blank to go back to main menu:\n> "
+        )
+        if answer.strip().lower() != "y":
+            return
+        self._schedule.activate(ctx, found.screening.key)
+        booking_id = self._svc.new_provisional_id(ctx)
+        self._svc.commit_booking(ctx, booking_id, seats)
+        io.write(f"Booking id: {booking_id} confirmed.")
@@ -0,0 +1,63 @@
+"""Shared base for the undo and redo commands."""
+
+from abc import abstractmethod
+from typing import Optional
+
+from src.cli.command import Command, IO
+from src.core.history import Operation
+from src.core.services.booking import BookingService
+from src.models.context import AppContext
+
+
+class HistoryCommand(Command):
+    """Step the booking history one operation in a fixed direction.
+
+    Subclasses set :attr:`meta` and :attr:`done`, and implement
+    :meth:`_peek` and :meth:`_step`.
+    """
+
+    #: Past-tense verb used when reporting the step, e.g. ``"Undid"``.
+    done: str
+
+    def __init__(self, service: BookingService) -> None:
+        """Create the command with the booking service owning the history.
+
+        :param service: Booking service.
+        :type service: BookingService
+        """
+        self._svc = service
+
+    @abstractmethod
+    def _peek(self) -> Optional[Operation]:
+        """Return the operation the next step would act on, if any."""
+
+    @abstractmethod
+    def _step(self) -> Optional[Operation]:
+        """Take one step through the history and return its operation."""
+
+    def display_label(self, ctx: AppContext) -> str:  # noqa: ARG002
+        """Return the menu label naming the operation the step would act on.
+
+        :param ctx: Application context (unused).
+        :type ctx: AppContext
+        :return: Menu label.
+        :rtype: str
+        """
+        op = self._peek()
+        name = self.meta.label.lower()
+        what = op.describe() if op is not None else f"nothing to {name}"
+        return f"[{self.meta.key}] {self.meta.label} ({what})"
+
+    def run(self, ctx: AppContext, io: IO) -> None:  # noqa: ARG002
+        """Take one step and report it.
+
+        :param ctx: Application context (unused; the operation knows its screen).
+        :type ctx: AppContext
+        :param io: IO adapter.
+        :type io: IO
+        """
+        op = self._step()
+        if op is None:
+            io.write(f"Nothing to {self.meta.label.lower()}.")
+            return
+        io.write(f"{self.done} {op.describe()} ({op.target.theater.title}).")
@@ -0,0 +1,66 @@
+"""Profile-next-commands command."""
+
+from src.cli.command import Command, CommandMeta, IO
+from src.core.profiling import Profiler
+from src.core.validators import parse_profile_request
+from src.models.context import AppContext
+
+
+class ProfileCommand(Command):
+    """Arm the profiler for the next few menu commands."""
+
+    meta = CommandMeta(
+        key="3",
+        label="Profile next commands",
+        help="Capture cProfile/tracemalloc statistics for the next N commands.",
+    )
+
+    def __init__(self, profiler: Profiler) -> None:
+        """Create the command with the shared profiler.
+
+        :param profiler: Profiler wrapping dispatched commands.
+        :type profiler: Profiler
+        """
+        self._profiler = profiler
+
+    def display_label(self, ctx: AppContext) -> str:  # noqa: ARG002
+        """Return the menu label, noting an armed profiler.
+
+        :param ctx: Application context (unused).
+        :type ctx: AppContext
+        :return: Menu label.
+        :rtype: str
+        """
+        label = f"[{self.meta.key}] {self.meta.label}"
+        if self._profiler.armed:
+            label += f" ({self._profiler.remaining} remaining)"
+        return label
+
+    def run(self, ctx: AppContext, io: IO) -> None:  # noqa: ARG002
+        """Prompt for ``[Commands] [cpu|mem|both]`` and arm the profiler.
+
+        :param ctx: Application context (unused).
+        :type ctx: AppContext
+        :param io: IO adapter.
+        :type io: IO
+        """
+        if self._profiler.last_report:
+            io.write(f"Last profile report: {self._profiler.last_report}")
+        while True:
+            raw = io.prompt(
+                "Enter [Commands] [cpu|mem|both] to profile, "
+                "or enter blank to go back to main menu:\n> "
+            ).strip()
+            if raw == "":
+                return
+            try:
+                count, cpu, memory = parse_profile_request(raw)
+            except ValueError as exc:
+                io.write(str(exc))
+                continue
+            self._profiler.arm(count, cpu=cpu, memory=memory)
+            io.write(
+                f"Profiling the next {count} command(s); "
+                f"report will be written to {self._profiler.out_dir}."
+            )
+            return
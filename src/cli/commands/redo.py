@@ -0,0 +1,24 @@
+"""Redo command."""
+
+from typing import Optional
+
+from src.cli.command import CommandMeta
+from src.cli.commands.history import HistoryCommand
+from src.core.history import Operation
+
+
+class RedoCommand(HistoryCommand):
+    """Re-apply the most recently undone booking or cancellation."""
+
+    meta = CommandMeta(
+        key="8",
+        label="Redo",
+        help="Re-apply the last undone booking or cancellation.",
+    )
+    done = "Redid"
+
+    def _peek(self) -> Optional[Operation]:
+        return self._svc.history.next_redo()
+
+    def _step(self) -> Optional[Operation]:
+        return self._svc.redo()
@@ -0,0 +1,65 @@
+"""Select-screening command."""
+
+from typing import List
+
+from src.cli.command import Command, CommandMeta, IO
+from src.models.context import AppContext
+from src.models.schedule import Schedule, Screening
+
+
+class SelectScreeningCommand(Command):
+    """Switch the screening that booking and checking operate on."""
+
+    meta = CommandMeta(
+        key="5",
+        label="Select screening",
+        help="Choose the screen and showtime to sell tickets for.",
+    )
+
+    def __init__(self, schedule: Schedule) -> None:
+        """Create the command with the shared schedule.
+
+        :param schedule: All screenings of the session.
+        :type schedule: Schedule
+        """
+        self._schedule = schedule
+
+    def display_label(self, ctx: AppContext) -> str:
+        """Return the menu label with the active screening.
+
+        :param ctx: Application context.
+        :type ctx: AppContext
+        :return: Menu label.
+        :rtype: str
+        """
+        label = f"[{self.meta.key}] {self.meta.label}"
+        active = self._schedule.screenings.get(ctx.screening) if ctx.screening else None
+        if active is not None:
+            label += f" (current: {active.label()})"
+        return label
+
+    def run(self, ctx: AppContext, io: IO) -> None:
+        """List the screenings and activate the chosen one.
+
+        :param ctx: Application context.
+        :type ctx: AppContext
+        :param io: IO adapter.
+        :type io: IO
+        """
+        options: List[Screening] = list(self._schedule)
+        for i, screening in enumerate(options, start=1):
+            io.write(
+                f"  [{i}] {screening.label()} ({screening.available()} seats available)"
+            )
+        while True:
+            raw = io.prompt(
+                "Enter screening number, or enter blank to go back to main menu:\n> "
+            ).strip()
+            if raw == "":
+                return
+            if not raw.isdigit() or not 1 <= int(raw) <= len(options):
+                io.write(f"Please enter a number between 1 and {len(options)}.")
+                continue
+            chosen = self._schedule.activate(ctx, options[int(raw) - 1].key)
+            io.write(f"Now selling {chosen.label()}.")
+            return
@@ -0,0 +1,24 @@
+"""Undo command."""
+
+from typing import Optional
+
+from src.cli.command import CommandMeta
+from src.cli.commands.history import HistoryCommand
+from src.core.history import Operation
+
+
+class UndoCommand(HistoryCommand):
+    """Revert the most recent booking or cancellation."""
+
+    meta = CommandMeta(
+        key="7",
+        label="Undo",
+        help="Revert the last confirmed booking or cancellation.",
+    )
+    done = "Undid"
+
+    def _peek(self) -> Optional[Operation]:
+        return self._svc.history.next_undo()
+
+    def _step(self) -> Optional[Operation]:
+        return self._svc.undo()
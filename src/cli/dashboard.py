@@ -0,0 +1,154 @@
+"""Live occupancy dashboard for lobby and floor-manager terminals.
+
+The dashboard shows every screen's availability and seat map on a separate
+terminal (or any text stream) and keeps it current from a background thread.
+It is driven by :class:`~src.core.services.booking.BookingService` events
+(commits and cancellations): between changes the thread is blocked on an
+event, so an idle dashboard costs no CPU. Each redraw sends only the characters
+that changed since the previous frame (see
+:func:`~src.core.renderers.diff.screen_patch`).
+"""
+
+import threading
+from typing import Callable, Iterable, Optional, Sequence, TextIO, Tuple
+
+from src.core.renderers.ascii_renderer import AsciiRenderer
+from src.core.renderers.base import Renderer, render_map
+from src.core.renderers.diff import screen_patch
+from src.core.events import (
+    BookingCancelled,
+    BookingCommitted,
+    BookingEvent,
+    Subscription,
+)
+from src.core.services.booking import BookingService
+from src.models.entities import Theater
+
+
+class Dashboard:
+    """Redraw the seat maps of all screens whenever a booking changes.
+
+    Bursts of changes are coalesced: the thread redraws at most once per
+    *min_interval* seconds and always from the latest state.
+
+    :param service: Booking service whose events trigger redraws.
+    :type service: BookingService
+    :param screens: Returns ``(label, theater)`` pairs to show, in order.
+    :type screens: Callable[[], Iterable[tuple[str, Theater]]]
+    :param renderer: Seat map renderer (a private instance by default, since it
+        is used from the dashboard thread).
+    :type renderer: Optional[Renderer]
+    :param min_interval: Minimum delay between redraws, in seconds.
+    :type min_interval: float
+    """
+
+    def __init__(
+        self,
+        service: BookingService,
+        screens: Callable[[], Iterable[Tuple[str, Theater]]],
+        renderer: Optional[Renderer] = None,
+        min_interval: float = 0.25,
+    ) -> None:
+        self._service = service
+        self._screens = screens
+        self._renderer = renderer if renderer is not None else AsciiRenderer()
+        self.min_interval = min_interval
+        self.target: Optional[str] = None
+        self.frames = 0
+        self._stream: Optional[TextIO] = None
+        self._owns_stream = False
+        self._thread: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+        self._halt = threading.Event()
+        self._last: Optional[str] = None
+        self._sub: Optional[Subscription] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the dashboard thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def frame(self) -> str:
+        """Return the full dashboard text for the current state.
+
+        :return: One panel per screen: a title line with availability, then
+            its seat map (or a viewport for large houses).
+        :rtype: str
+        """
+        panels = []
+        for label, t in self._screens():
+            panels.append(
+                f"{label}: {t.available()} of {t.capacity()} seats available\n"
+                + render_map(self._renderer, t)
+            )
+        return "\n\n".join(panels)
+
+    def start(self, stream: TextIO, target: str, owns_stream: bool = False) -> None:
+        """Draw the dashboard on *stream* and keep it updated.
+
+        :param stream: Terminal (or file) receiving the frames.
+        :type stream: TextIO
+        :param target: Human-readable name of the output, e.g. ``/dev/pts/2``.
+        :type target: str
+        :param owns_stream: Close *stream* when the dashboard stops.
+        :type owns_stream: bool
+        :raises RuntimeError: If the dashboard is already running.
+        """
+        if self.running:
+            raise RuntimeError(f"Dashboard is already running on {self.target}.")
+        self._stream, self._owns_stream, self.target = stream, owns_stream, target
+        self._last = None
+        self._halt.clear()
+        self._wake.set()  # initial full frame
+        self._sub = self._service.events.subscribe(
+            self._on_change, BookingCommitted, BookingCancelled
+        )
+        self._thread = threading.Thread(
+            target=self._loop, name="gic-dashboard", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop redrawing and release the output (no-op if not running)."""
+        if self._sub is not None:
+            self._service.events.unsubscribe(self._sub)
+            self._sub = None
+        if self._thread is not None:
+            self._halt.set()
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+        if self._stream is not None and self._owns_stream:
+            self._stream.close()
+        self._stream = None
+        self.target = None
+
+    def refresh(self) -> None:
+        """Request a redraw (e.g. after a change made outside the service)."""
+        self._wake.set()
+
+    def _on_change(self, events: Sequence[BookingEvent]) -> None:  # noqa: ARG002
+        """Event handler: mark the dashboard stale."""
+        self._wake.set()
+
+    def _loop(self) -> None:
+        """Dashboard thread: sleep until woken, then redraw the changes."""
+        while True:
+            self._wake.wait()
+            if self._halt.is_set():
+                return
+            self._wake.clear()
+            current = self.frame()
+            patch = screen_patch(self._last, current)
+            if patch:
+                try:
+                    self._stream.write(patch)
+                    self._stream.flush()
+                except (OSError, ValueError):
+                    # Terminal went away (closed pty / stream); stop quietly.
+                    return
+                self._last = current
+                self.frames += 1
+            # Throttle: wake-ups during the pause coalesce into one redraw.
+            if self._halt.wait(self.min_interval):
+                return
@@ -1,5 +1,11 @@
 """Console I/O implementation."""
 
+import shutil
+import sys
+from typing import Optional
+
+from src.cli.command import IO
+
 
 class ConsoleIO:
     """Console-backed IO adapter using :func:`input` and :func:`print`."""
@@ -30,3 +36,78 @@ class ConsoleIO:
     def newline(self) -> None:
         """Print a single blank line."""
         print()
+
+    def isatty(self) -> bool:
+        """Return whether output goes to an interactive terminal.
+
+        :return: ``True`` for a TTY.
+        :rtype: bool
+        """
+        return sys.stdout.isatty()
+
+    def height(self) -> Optional[int]:
+        """Return the terminal height in lines, if known.
+
+        :return: Number of lines, or ``None`` when not a terminal.
+        :rtype: Optional[int]
+        """
+        return shutil.get_terminal_size().lines if self.isatty() else None
+
+
+class LineCountingIO:
+    """IO wrapper counting the output lines that reach the screen.
+
+    Each written line and each answered prompt (the user's Enter) advances the
+    counter, which lets callers locate earlier output for in-place updates.
+
+    :param inner: Wrapped IO adapter.
+    :type inner: IO
+    """
+
+    def __init__(self, inner: IO) -> None:
+        self.inner = inner
+        self.lines = 0
+
+    def prompt(self, text: str) -> str:
+        """Prompt through the wrapped IO and count the prompt lines.
+
+        :param text: Prompt text.
+        :type text: str
+        :return: User input line.
+        :rtype: str
+        """
+        answer = self.inner.prompt(text)
+        self.lines += text.count("\n") + 1
+        return answer
+
+    def write(self, text: str) -> None:
+        """Write through the wrapped IO and count the lines.
+
+        :param text: Text to write.
+        :type text: str
+        """
+        self.inner.write(text)
+        self.lines += text.count("\n") + 1
+
+    def newline(self) -> None:
+        """Write a blank line through the wrapped IO."""
+        self.inner.newline()
+        self.lines += 1
+
+    def isatty(self) -> bool:
+        """Return whether the wrapped IO is an interactive terminal.
+
+        :return: ``True`` for a TTY.
+        :rtype: bool
+        """
+        isatty = getattr(self.inner, "isatty", None)
+        return bool(isatty and isatty())
+
+    def height(self) -> Optional[int]:
+        """Return the wrapped IO's terminal height, if known.
+
+        :return: Number of lines, or ``None``.
+        :rtype: Optional[int]
+        """
+        height = getattr(self.inner, "height", None)
+        return height() if height else None
@@ -3,25 +3,62 @@
 from typing import List
 
 from src.cli.command import Command
+from src.cli.dashboard import Dashboard
 from src.cli.commands.book import BookCommand
 from src.cli.commands.check import CheckCommand
+from src.cli.commands.dashboard import DashboardCommand
 from src.cli.commands.exit import ExitCommand
+from src.cli.commands.export import ExportCommand
+from src.cli.commands.find import FindSeatsCommand
+from src.cli.commands.profile import ProfileCommand
+from src.cli.commands.redo import RedoCommand
+from src.cli.commands.screening import SelectScreeningCommand
+from src.cli.commands.undo import UndoCommand
+from src.core.export import Exporter
+from src.core.profiling import Profiler
 from src.core.renderers.base import Renderer
+from src.core.search import SeatSearchIndex
 from src.core.services.booking import BookingService
+from src.models.schedule import Schedule
 
 
-def get_commands(renderer: Renderer, service: BookingService) -> List[Command]:
-    """Return command instances in menu order.
+def get_commands(
+    renderer: Renderer,
+    service: BookingService,
+    profiler: Profiler,
+    dashboard: Dashboard,
+    schedule: Schedule,
+    search: SeatSearchIndex,
+    exporter: Exporter,
+) -> List[Command]:
+    """Return command instances in menu order, numbered from 1, Exit last.
 
     :param renderer: Seat map renderer to inject.
     :type renderer: Renderer
     :param service: Booking service to inject.
     :type service: BookingService
+    :param profiler: Profiler shared with the dispatch loop.
+    :type profiler: Profiler
+    :param dashboard: Live dashboard shared with the application.
+    :type dashboard: Dashboard
+    :param schedule: Screenings the operator can switch between.
+    :type schedule: Schedule
+    :param search: Free-seat index over *schedule*.
+    :type search: SeatSearchIndex
+    :param exporter: Background report exporter.
+    :type exporter: Exporter
     :return: Commands in display order.
     :rtype: list[Command]
     """
     return [
         BookCommand(renderer=renderer, service=service),
         CheckCommand(renderer=renderer, service=service),
-        ExitCommand(),
+        ProfileCommand(profiler=profiler),
+        DashboardCommand(dashboard=dashboard),
+        SelectScreeningCommand(schedule=schedule),
+        FindSeatsCommand(schedule=schedule, index=search, service=service),
+        UndoCommand(service=service),
+        RedoCommand(service=service),
+        ExportCommand(exporter=exporter),
+        ExitCommand(),  # always last; add new options above it
     ]
@@ -0,0 +1,304 @@
+"""Runtime settings read from ``GIC_*`` environment variables.
+
+Settings are resolved once at startup by :func:`src.app.run_app` and passed to
+the components that need them; nothing else reads the environment directly.
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+from src.core.occupancy import OCCUPANCY_BACKENDS
+from src.core.renderers.factory import RENDERERS
+from src.core.spacing import SpacingRules
+from src.core.strategies import ALLOCATORS
+from src.core.validators import parse_profile_request, parse_spacing_rules
+
+
+@dataclass(frozen=True, slots=True)
+class TraceSettings:
+    """Request tracing.
+
+    :param path: JSON-lines trace file; tracing is disabled when ``None``.
+    :type path: Optional[str]
+    :param sample_rate: Fraction of root spans (commands) recorded, ``0..1``.
+    :type sample_rate: float
+    :param queue_size: Bound of the background trace writer queue.
+    :type queue_size: int
+    """
+
+    path: Optional[str] = None
+    sample_rate: float = 1.0
+    queue_size: int = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileSettings:
+    """Profiling from startup.
+
+    :param commands: Number of commands profiled from startup (``0`` = off).
+    :type commands: int
+    :param cpu: Collect :mod:`cProfile` statistics when profiling.
+    :type cpu: bool
+    :param memory: Collect :mod:`tracemalloc` statistics when profiling.
+    :type memory: bool
+    :param out_dir: Directory receiving profile reports.
+    :type out_dir: str
+    """
+
+    commands: int = 0
+    cpu: bool = True
+    memory: bool = False
+    out_dir: str = "."
+
+
+@dataclass(frozen=True, slots=True)
+class RenderSettings:
+    """Seat map output.
+
+    :param renderer: Seat map output format (``ascii``, ``json`` or ``rle``).
+    :type renderer: str
+    :param cache_size: Seat maps kept by the render cache (``0`` = off).
+    :type cache_size: int
+    """
+
+    renderer: str = "ascii"
+    cache_size: int = 64
+
+
+@dataclass(frozen=True, slots=True)
+class AllocationSettings:
+    """Seat allocation and occupancy storage.
+
+    :param allocator: Default automatic allocation strategy (``greedy``,
+        ``best-fit`` or ``cluster``); schedule files can override it per screen.
+    :type allocator: str
+    :param spacing: Distancing rules between parties; ``None`` for none.
+    :type spacing: Optional[SpacingRules]
+    :param occupancy: Occupancy backend (``list`` or ``numpy``).
+    :type occupancy: str
+    """
+
+    allocator: str = "greedy"
+    spacing: Optional[SpacingRules] = None
+    occupancy: str = "list"
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Operator-facing runtime settings, grouped by concern.
+
+    :param tracing: Request tracing.
+    :type tracing: TraceSettings
+    :param profiling: Profiling from startup.
+    :type profiling: ProfileSettings
+    :param rendering: Seat map output.
+    :type rendering: RenderSettings
+    :param allocation: Seat allocation and occupancy storage.
+    :type allocation: AllocationSettings
+    :param layout_path: Auditorium layout file; ``None`` for a full rectangle.
+    :type layout_path: Optional[str]
+    :param schedule_path: JSON schedule of screens and screenings; when set,
+        the startup prompt is skipped.
+    :type schedule_path: Optional[str]
+    """
+
+    tracing: TraceSettings = TraceSettings()
+    profiling: ProfileSettings = ProfileSettings()
+    rendering: RenderSettings = RenderSettings()
+    allocation: AllocationSettings = AllocationSettings()
+    layout_path: Optional[str] = None
+    schedule_path: Optional[str] = None
+
+
+def _float_in_unit_range(name: str, raw: str) -> float:
+    """Parse *raw* as a float in ``0..1``.
+
+    :raises ValueError: If *raw* is not a number in range.
+    """
+    try:
+        value = float(raw)
+    except ValueError as exc:
+        raise ValueError(f"{name} must be a number between 0 and 1.") from exc
+    if not 0.0 <= value <= 1.0:
+        raise ValueError(f"{name} must be a number between 0 and 1.")
+    return value
+
+
+def _positive_int(name: str, raw: str) -> int:
+    """Parse *raw* as a positive integer.
+
+    :raises ValueError: If *raw* is not a positive integer.
+    """
+    if not raw.strip().isdigit() or int(raw) <= 0:
+        raise ValueError(f"{name} must be a positive integer.")
+    return int(raw)
+
+
+def _non_negative_int(name: str, raw: str) -> int:
+    """Parse *raw* as an integer ``>= 0``.
+
+    :raises ValueError: If *raw* is not a non-negative integer.
+    """
+    if not raw.strip().isdigit():
+        raise ValueError(f"{name} must be a non-negative integer.")
+    return int(raw)
+
+
+def _renderer_name(raw: str) -> str:
+    """Normalise *raw* to a key of :data:`RENDERERS`.
+
+    :raises ValueError: If *raw* names no renderer.
+    """
+    name = raw.strip().lower()
+    if name not in RENDERERS:
+        raise ValueError(f"GIC_RENDERER must be one of: {', '.join(RENDERERS)}.")
+    return name
+
+
+def _occupancy_name(raw: str) -> str:
+    """Normalise *raw* to a key of :data:`OCCUPANCY_BACKENDS`.
+
+    The backend itself is only imported when the application starts.
+
+    :raises ValueError: If *raw* names no backend.
+    """
+    name = raw.strip().lower()
+    if name not in OCCUPANCY_BACKENDS:
+        raise ValueError(
+            f"GIC_OCCUPANCY must be one of: {', '.join(OCCUPANCY_BACKENDS)}."
+        )
+    return name
+
+
+def _allocator_name(raw: str) -> str:
+    """Normalise *raw* to a key of :data:`ALLOCATORS`.
+
+    :raises ValueError: If *raw* names no strategy.
+    """
+    name = raw.strip().lower()
+    if name not in ALLOCATORS:
+        raise ValueError(f"GIC_ALLOCATOR must be one of: {', '.join(ALLOCATORS)}.")
+    return name
+
+
+def load_settings(environ: Optional[Mapping[str, str]] = None) -> Settings:
+    """Build :class:`Settings` from environment variables.
+
+    Recognised variables
+    --------------------
+    ``GIC_TRACE_FILE`` :
+        Path of the JSON-lines trace log (enables tracing).
+    ``GIC_TRACE_SAMPLE`` :
+        Head-based sampling rate for traces (default ``1``).
+    ``GIC_TRACE_QUEUE`` :
+        Maximum number of pending trace records (default ``1024``).
+    ``GIC_PROFILE`` :
+        Profile the first *N* commands of the session.
+    ``GIC_PROFILE_MODE`` :
+        ``cpu`` (default), ``mem`` or ``both``.
+    ``GIC_PROFILE_DIR`` :
+        Directory for profile reports (default: current directory).
+    ``GIC_RENDER_CACHE`` :
+        Number of rendered seat maps to cache (default ``64``, ``0`` disables).
+    ``GIC_RENDERER`` :
+        Seat map format: ``ascii`` (default), ``json`` or ``rle``.
+    ``GIC_LAYOUT`` :
+        Text or ``.json`` auditorium layout (aisles, blocked and wheelchair seats).
+    ``GIC_SCHEDULE`` :
+        JSON schedule of screens and showtimes (replaces the startup prompt).
+    ``GIC_SPACING`` :
+        Distancing rules ``<Gap> [behind]``, e.g. ``1 behind``.
+    ``GIC_OCCUPANCY`` :
+        ``list`` (default) or ``numpy`` (needs NumPy; vectorised bulk queries).
+    ``GIC_ALLOCATOR`` :
+        ``greedy`` (default), ``best-fit`` or ``cluster`` automatic seat
+        allocation.
+
+    :param environ: Mapping to read from; defaults to :data:`os.environ`.
+    :type environ: Optional[Mapping[str, str]]
+    :return: Resolved settings.
+    :rtype: Settings
+    :raises ValueError: If a variable holds an invalid value.
+    """
+    env = os.environ if environ is None else environ
+    return Settings(
+        tracing=_trace_settings(env),
+        profiling=_profile_settings(env),
+        rendering=_render_settings(env),
+        allocation=_allocation_settings(env),
+        layout_path=env.get("GIC_LAYOUT") or None,
+        schedule_path=env.get("GIC_SCHEDULE") or None,
+    )
+
+
+def _trace_settings(env: Mapping[str, str]) -> TraceSettings:
+    """Read the ``GIC_TRACE_*`` variables.
+
+    :raises ValueError: If a variable holds an invalid value.
+    """
+    defaults = TraceSettings()
+    sample = env.get("GIC_TRACE_SAMPLE")
+    queue_size = env.get("GIC_TRACE_QUEUE")
+    return TraceSettings(
+        path=env.get("GIC_TRACE_FILE") or None,
+        sample_rate=(
+            _float_in_unit_range("GIC_TRACE_SAMPLE", sample)
+            if sample
+            else defaults.sample_rate
+        ),
+        queue_size=(
+            _positive_int("GIC_TRACE_QUEUE", queue_size)
+            if queue_size
+            else defaults.queue_size
+        ),
+    )
+
+
+def _profile_settings(env: Mapping[str, str]) -> ProfileSettings:
+    """Read the ``GIC_PROFILE*`` variables.
+
+    :raises ValueError: If a variable holds an invalid value.
+    """
+    defaults = ProfileSettings()
+    out_dir = env.get("GIC_PROFILE_DIR") or defaults.out_dir
+    profile = env.get("GIC_PROFILE")
+    if not profile:
+        return ProfileSettings(out_dir=out_dir)
+    mode = env.get("GIC_PROFILE_MODE") or "cpu"
+    commands, cpu, memory = parse_profile_request(f"{profile} {mode}")
+    return ProfileSettings(commands, cpu, memory, out_dir)
+
+
+def _render_settings(env: Mapping[str, str]) -> RenderSettings:
+    """Read ``GIC_RENDERER`` and ``GIC_RENDER_CACHE``.
+
+    :raises ValueError: If a variable holds an invalid value.
+    """
+    defaults = RenderSettings()
+    renderer = env.get("GIC_RENDERER")
+    cache = env.get("GIC_RENDER_CACHE")
+    return RenderSettings(
+        renderer=_renderer_name(renderer) if renderer else defaults.renderer,
+        cache_size=(
+            _non_negative_int("GIC_RENDER_CACHE", cache)
+            if cache
+            else defaults.cache_size
+        ),
+    )
+
+
+def _allocation_settings(env: Mapping[str, str]) -> AllocationSettings:
+    """Read ``GIC_ALLOCATOR``, ``GIC_SPACING`` and ``GIC_OCCUPANCY``.
+
+    :raises ValueError: If a variable holds an invalid value.
+    """
+    defaults = AllocationSettings()
+    allocator = env.get("GIC_ALLOCATOR")
+    spacing = env.get("GIC_SPACING")
+    occupancy = env.get("GIC_OCCUPANCY")
+    return AllocationSettings(
+        allocator=_allocator_name(allocator) if allocator else defaults.allocator,
+        spacing=parse_spacing_rules(spacing) if spacing else defaults.spacing,
+        occupancy=_occupancy_name(occupancy) if occupancy else defaults.occupancy,
+    )
@@ -1,9 +1,23 @@
-"""Seat allocation algorithms (auto and manual)."""
+"""Seat allocation algorithms (auto and manual).
 
-from typing import List, Optional
+Both allocators walk per-row priority orders. For a rectangular theater every
+row shares the centre-out order of :func:`center_col_order`; a
+:class:`~src.models.layout.Layout` is compiled once (see :func:`row_orders`)
+into per-row orders that already leave out missing and blocked seats, so
+those cost nothing when allocating.
+
+Optional :class:`~src.core.spacing.SpacingRules` are applied through one
+forbidden-seat bitset per visited row, so each candidate seat costs a single
+extra bit test.
+"""
+
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
 
 from src.models.entities import Theater, Seat
-from src.core.seat_utils import row_letter_to_index
+from src.models.layout import Layout
+from src.core.seat_utils import row_letter_to_index, seat_pool
+from src.core.spacing import SpacingRules, make_mask
 
 
 def center_col_order(cols: int) -> List[int]:
@@ -49,13 +63,67 @@ def center_col_order(cols: int) -> List[int]:
     return order
 
 
-def auto_allocate(theater: Theater, k: int) -> Optional[List[Seat]]:
+@lru_cache(maxsize=64)
+def _center_order(cols: int) -> Tuple[int, ...]:
+    """Return :func:`center_col_order` as a cached tuple (one per row width)."""
+    return tuple(center_col_order(cols))
+
+
+@lru_cache(maxsize=32)
+def _rectangle_orders(rows: int, cols: int) -> Tuple[Tuple[int, ...], ...]:
+    """Return the same centre-out order for each of *rows* rows."""
+    return (_center_order(cols),) * rows
+
+
+@lru_cache(maxsize=32)
+def compile_layout(layout: Layout) -> Tuple[Tuple[int, ...], ...]:
+    """Compile *layout* into per-row allocation orders.
+
+    Each row's order runs centre-out over the seats that physically exist in
+    that row (so curved or offset rows are centred on their own seats), then
+    drops blocked seats and moves wheelchair spaces to the end.
+
+    :param layout: Auditorium layout.
+    :type layout: Layout
+    :return: For each row index, one-based columns in preference order.
+    :rtype: tuple[tuple[int, ...], ...]
+    """
+    orders = []
+    for r in range(layout.rows):
+        seats = [c for c in range(1, layout.cols + 1) if (r, c) not in layout.missing]
+        centred = [seats[i - 1] for i in _center_order(len(seats))]
+        regular = [c for c in centred if (r, c) not in layout.blocked]
+        orders.append(
+            tuple(c for c in regular if (r, c) not in layout.wheelchair)
+            + tuple(c for c in regular if (r, c) in layout.wheelchair)
+        )
+    return tuple(orders)
+
+
+def row_orders(theater: Theater) -> Sequence[Tuple[int, ...]]:
+    """Return the cached per-row allocation orders of *theater*.
+
+    :param theater: Theater descriptor.
+    :type theater: Theater
+    :return: For each row index, one-based columns in preference order.
+    :rtype: Sequence[tuple[int, ...]]
+    """
+    if theater.layout is None:
+        return _rectangle_orders(theater.rows, theater.cols)
+    return compile_layout(theater.layout)
+
+
+def auto_allocate(
+    theater: Theater, k: int, rules: Optional[SpacingRules] = None
+) -> Optional[List[Seat]]:
     """Allocate ``k`` seats using center-outwards preference per row.
 
     :param theater: Theater context (grid is inspected, not mutated).
     :type theater: Theater
     :param k: Number of seats requested.
     :type k: int
+    :param rules: Distancing rules; seats they forbid are skipped.
+    :type rules: Optional[SpacingRules]
     :return: Proposed seats or ``None`` if insufficient capacity.
     :rtype: Optional[list[Seat]]
     """
@@ -67,14 +135,20 @@ def auto_allocate(theater: Theater, k: int) -> Optional[List[Seat]]:
     proposed: List[Seat] = []
     needed = k
 
+    orders = row_orders(theater)
+    seats = seat_pool(theater.rows, theater.cols)
+    mask = make_mask(theater, rules)
     for row_idx in range(theater.rows):
         if needed == 0:
             break
-        row_letter = chr(ord("A") + row_idx)
-        order = center_col_order(theater.cols)
-        for col in order:
-            if theater.grid[row_idx][col - 1] is None:
-                proposed.append(Seat(row=row_letter, col=col))
+        if not theater.row_free[row_idx]:
+            continue  # full row; skipped without scanning its seats
+        row = theater.grid[row_idx]
+        row_seats = seats[row_idx]
+        forbidden = mask.forbidden(row_idx) if mask else 0
+        for col in orders[row_idx]:
+            if row[col - 1] is None and not (forbidden >> (col - 1) & 1):
+                proposed.append(row_seats[col - 1])
                 needed -= 1
                 if needed == 0:
                     break
@@ -82,7 +156,9 @@ def auto_allocate(theater: Theater, k: int) -> Optional[List[Seat]]:
     return proposed if needed == 0 else None
 
 
-def manual_allocate(theater: Theater, k: int, start: Seat) -> Optional[List[Seat]]:
+def manual_allocate(
+    theater: Theater, k: int, start: Seat, rules: Optional[SpacingRules] = None
+) -> Optional[List[Seat]]:
     """Allocate seats starting from *start* seat, then overflow to next rows.
 
     Strategy
@@ -90,8 +166,10 @@ def manual_allocate(theater: Theater, k: int, start: Seat) -> Optional[List[Seat
     1. In the **start row**, scan **rightwards** from ``start.col`` to the end,
        **collecting any free seats** (do **not** stop at the first occupied seat).
        This matches the “flow to the right” behavior in the requirements.
-    2. If seats still remain, overflow to subsequent rows using
-       :func:`center_col_order` (unchanged).
+    2. If seats still remain, overflow to subsequent rows using their
+       centre-out orders (:func:`row_orders`).
+
+    Seats forbidden by *rules* are skipped in both phases.
 
     :param theater: Theater context (grid is inspected, not mutated).
     :type theater: Theater
@@ -99,6 +177,8 @@ def manual_allocate(theater: Theater, k: int, start: Seat) -> Optional[List[Seat
     :type k: int
     :param start: Starting seat (assumed valid and free by caller).
     :type start: Seat
+    :param rules: Distancing rules; seats they forbid are skipped.
+    :type rules: Optional[SpacingRules]
     :return: Proposed seats or ``None`` if insufficient capacity.
     :rtype: Optional[list[Seat]]
     """
@@ -111,11 +191,17 @@ def manual_allocate(theater: Theater, k: int, start: Seat) -> Optional[List[Seat
     needed = k
     start_row = row_letter_to_index(start.row)
 
+    seats = seat_pool(theater.rows, theater.cols)
+    mask = make_mask(theater, rules)
+
     # Phase 1: same row, rightward contiguous seats
+    forbidden = mask.forbidden(start_row) if mask else 0
     col = start.col
     while col <= theater.cols and needed > 0:
-        if theater.grid[start_row][col - 1] is None:
-            proposed.append(Seat(row=start.row.upper(), col=col))
+        if theater.grid[start_row][col - 1] is None and not (
+            forbidden >> (col - 1) & 1
+        ):
+            proposed.append(seats[start_row][col - 1])
             needed -= 1
         col += 1
 
@@ -123,14 +209,18 @@ def manual_allocate(theater: Theater, k: int, start: Seat) -> Optional[List[Seat
         return proposed
 
     # Phase 2: overflow rows with center-outwards preference
+    orders = row_orders(theater)
     for row_idx in range(start_row + 1, theater.rows):
         if needed == 0:
             break
-        row_letter = chr(ord("A") + row_idx)
-        order = center_col_order(theater.cols)
-        for c in order:
-            if theater.grid[row_idx][c - 1] is None:
-                proposed.append(Seat(row=row_letter, col=c))
+        if not theater.row_free[row_idx]:
+            continue  # full row; skipped without scanning its seats
+        row = theater.grid[row_idx]
+        row_seats = seats[row_idx]
+        forbidden = mask.forbidden(row_idx) if mask else 0
+        for c in orders[row_idx]:
+            if row[c - 1] is None and not (forbidden >> (c - 1) & 1):
+                proposed.append(row_seats[c - 1])
                 needed -= 1
                 if needed == 0:
                     break
@@ -0,0 +1,354 @@
+"""Scored best-fit seat allocation.
+
+Unlike the greedy :func:`~src.core.allocation.auto_allocate`, which fills the
+first row centre-out and overflows, this allocator scores whole placements
+and keeps the cheapest. The cost of a placement adds up
+
+* **centre** — how far the block's middle is from the row's centre line,
+  as a fraction of the row width;
+* **row** — how far the row is from row ``A`` (the greedy allocator's first
+  choice), as a fraction of the depth;
+* **fragment** — single seats left stranded next to the block;
+* **wheelchair** — wheelchair spaces the block uses; and
+* **spread** — extra rows, when no row can seat the whole party together.
+
+Per-layout tables (row costs, row centre lines, wheelchair columns and
+prefix counts) are computed once and cached. Free runs are collected in one
+pass per row that has free seats; full rows are skipped using
+``Theater.row_free``. With a NumPy occupancy store the grid is mapped to
+symbols in one vectorised lookup and runs are found with a regular
+expression instead. Each row's best block for a given size is scored once per
+allocation and reused when a party is split over rows.
+
+Within a run, only the centre cost varies from one start to the next except
+at a few boundaries: the starts that strand a seat at either end of the run,
+and the starts where a wheelchair space enters or leaves the block. Between
+boundaries the centre cost is V-shaped, so each stretch is scored at its ends
+and at the starts nearest the centre line; the result is the same as scoring
+every start.
+"""
+
+import re
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from src.core.allocation import auto_allocate
+from src.core.renderers.base import grid_symbols
+from src.core.seat_utils import seat_pool
+from src.core.spacing import SpacingMask, SpacingRules, make_mask
+from src.models.entities import Seat, Theater
+from src.models.layout import Layout
+
+
+@dataclass(frozen=True, slots=True)
+class FitWeights:
+    """Weights of the placement cost terms (see the module docstring).
+
+    :param centre: Weight of the distance from the centre line.
+    :type centre: float
+    :param row: Weight of the distance from the first row.
+    :type row: float
+    :param fragment: Cost of each stranded single seat.
+    :type fragment: float
+    :param wheelchair: Cost of each wheelchair space used.
+    :type wheelchair: float
+    :param spread: Cost of each row beyond the first.
+    :type spread: float
+    """
+
+    centre: float = 1.0
+    row: float = 0.5
+    fragment: float = 0.75
+    wheelchair: float = 1.0
+    spread: float = 2.0
+
+
+DEFAULT_WEIGHTS = FitWeights()
+
+_FREE_RUN = re.compile(r"\.+")
+
+
+@dataclass(frozen=True, slots=True)
+class FitTables:
+    """Per-layout lookup tables used to score placements.
+
+    :param row_cost: Normalised distance of each row from row ``A``.
+    :type row_cost: tuple[float, ...]
+    :param span: Twice each row's centre line (first plus last seat column).
+    :type span: tuple[int, ...]
+    :param wheelchair: Per row, prefix counts of wheelchair spaces
+        (``wheelchair[r][c]`` counts columns ``1..c``).
+    :type wheelchair: tuple[tuple[int, ...], ...]
+    :param wheelchair_cols: Per row, the sorted columns of wheelchair spaces.
+    :type wheelchair_cols: tuple[tuple[int, ...], ...]
+    """
+
+    row_cost: Tuple[float, ...]
+    span: Tuple[int, ...]
+    wheelchair: Tuple[Tuple[int, ...], ...]
+    wheelchair_cols: Tuple[Tuple[int, ...], ...]
+
+
+@lru_cache(maxsize=32)
+def fit_tables(rows: int, cols: int, layout: Optional[Layout] = None) -> FitTables:
+    """Return the (cached) scoring tables of a house.
+
+    :param rows: Number of rows.
+    :type rows: int
+    :param cols: Seats per row.
+    :type cols: int
+    :param layout: Auditorium shape, if not a full rectangle.
+    :type layout: Optional[Layout]
+    :return: Tables.
+    :rtype: FitTables
+    """
+    depth = max(rows - 1, 1)
+    missing = layout.missing if layout is not None else frozenset()
+    wheel = layout.wheelchair if layout is not None else frozenset()
+    spans = []
+    prefixes = []
+    wheel_cols = []
+    for r in range(rows):
+        seats = [c for c in range(1, cols + 1) if (r, c) not in missing]
+        spans.append(seats[0] + seats[-1] if seats else cols + 1)
+        counts = [0]
+        for c in range(1, cols + 1):
+            counts.append(counts[-1] + ((r, c) in wheel))
+        prefixes.append(tuple(counts))
+        wheel_cols.append(tuple(c for c in range(1, cols + 1) if (r, c) in wheel))
+    return FitTables(
+        row_cost=tuple(r / depth for r in range(rows)),
+        span=tuple(spans),
+        wheelchair=tuple(prefixes),
+        wheelchair_cols=tuple(wheel_cols),
+    )
+
+
+def _free_runs(
+    theater: Theater, rules: Optional[SpacingRules]
+) -> List[List[Tuple[int, int]]]:
+    """Return, per row, the ``(first, last)`` columns of each usable free run.
+
+    Full rows (by ``Theater.row_free``) are skipped without reading them.
+    """
+    mask = make_mask(theater, rules)
+    if theater.occupancy is not None:
+        return _symbol_runs(theater, mask)
+    runs: List[List[Tuple[int, int]]] = []
+    for r, row in enumerate(theater.grid):
+        row_runs: List[Tuple[int, int]] = []
+        runs.append(row_runs)
+        if not theater.row_free[r]:
+            continue
+        forbidden = mask.forbidden(r) if mask else 0
+        first = 0
+        for c, owner in enumerate(row, start=1):
+            if owner is None and not (forbidden >> (c - 1) & 1):
+                if not first:
+                    first = c
+            elif first:
+                row_runs.append((first, c - 1))
+                first = 0
+        if first:
+            row_runs.append((first, len(row)))
+    return runs
+
+
+def _symbol_runs(
+    theater: Theater, mask: Optional[SpacingMask]
+) -> List[List[Tuple[int, int]]]:
+    """Return :func:`_free_runs` from the occupancy store's symbol rows."""
+    runs: List[List[Tuple[int, int]]] = []
+    for r, row in enumerate(grid_symbols(theater, None)):
+        row_runs: List[Tuple[int, int]] = []
+        runs.append(row_runs)
+        if not theater.row_free[r]:
+            continue
+        forbidden = mask.forbidden(r) if mask else 0
+        if forbidden:
+            row = "".join("#" if forbidden >> i & 1 else ch for i, ch in enumerate(row))
+        row_runs.extend((m.start() + 1, m.end()) for m in _FREE_RUN.finditer(row))
+    return runs
+
+
+class _Scorer:
+    """Score blocks of one theater against cached tables and weights."""
+
+    def __init__(self, theater: Theater, weights: FitWeights) -> None:
+        self.cols = theater.cols
+        self.t = fit_tables(theater.rows, theater.cols, theater.layout)
+        self.w = weights
+        # Lower bounds only hold when no term can lower a cost.
+        self.prune = min(weights.centre, weights.row, weights.fragment) >= 0 and (
+            weights.wheelchair >= 0
+        )
+        self._memo: Dict[Tuple[int, int], Optional[Tuple[float, int]]] = {}
+
+    def best_in_row(
+        self, r: int, runs: List[Tuple[int, int]], k: int
+    ) -> Optional[Tuple[float, int]]:
+        """Return ``(cost, start)`` of the cheapest *k*-seat block in row *r*.
+
+        Results are memoised per ``(r, k)`` for the lifetime of the scorer
+        (one allocation), so split placements reuse them.
+        """
+        key = (r, k)
+        if key in self._memo:
+            return self._memo[key]
+        best: Optional[Tuple[float, int]] = None
+        t, w = self.t, self.w
+        span, base = t.span[r], w.row * t.row_cost[r]
+        # Starts whose block is centred on the row's centre line.
+        ideal = (span - k + 1) // 2
+        wheel = t.wheelchair_cols[r]
+        for first, last in runs:
+            lo, hi = first, last - k + 1
+            if hi < lo:
+                continue
+            if best is not None and self.prune:
+                # No block of this run is closer to the centre than this one,
+                # and the remaining terms are never negative.
+                x = min(max((span - k + 1) / 2, lo), hi)
+                if base + w.centre * abs(2 * x + k - 1 - span) / self.cols >= best[0]:
+                    continue
+            inside = wheel[bisect_left(wheel, first) : bisect_right(wheel, last)]
+            for s in _candidates(lo, hi, k, ideal, inside):
+                cost = self.cost(r, s, k, first, last)
+                if best is None or cost < best[0]:
+                    best = (cost, s)
+        self._memo[key] = best
+        return best
+
+    def cost(self, r: int, s: int, k: int, first: int, last: int) -> float:
+        """Return the cost of seats ``s..s+k-1`` inside free run ``first..last``."""
+        t, w = self.t, self.w
+        stranded = (s - first == 1) + (last - (s + k - 1) == 1)
+        wheel = t.wheelchair[r]
+        return (
+            w.centre * abs(2 * s + k - 1 - t.span[r]) / self.cols
+            + w.row * t.row_cost[r]
+            + w.fragment * stranded
+            + w.wheelchair * (wheel[s + k - 1] - wheel[s - 1])
+        )
+
+
+def _candidates(
+    lo: int, hi: int, k: int, ideal: int, wheel: Tuple[int, ...]
+) -> List[int]:
+    """Return the starts in ``lo..hi`` that may hold a run's cheapest block.
+
+    The run is cut where a non-centre term can change (see the module
+    docstring); each stretch contributes its ends and its starts nearest
+    *ideal*.
+    """
+    if not wheel:
+        # Only the starts stranding a seat at either end cut the run.
+        starts = {lo, lo + 1, hi - 1, hi}
+        a, b = lo + 2, hi - 2
+        if a <= b:
+            starts.update((a, b))
+            if a < ideal < b:
+                starts.add(ideal)
+            if a < ideal + 1 < b:
+                starts.add(ideal + 1)
+        return sorted(s for s in starts if lo <= s <= hi)
+    cuts = {lo, lo + 1, lo + 2, hi - 1, hi, hi + 1}
+    for c in wheel:
+        cuts.add(c + 1)  # c leaves the block
+        cuts.add(c - k + 1)  # c enters the block
+    bounds = sorted(c for c in cuts if lo <= c <= hi)
+    bounds.append(hi + 1)
+    starts = set()
+    for a, b in zip(bounds, bounds[1:]):
+        b -= 1
+        starts.update((a, b, min(max(ideal, a), b), min(max(ideal + 1, a), b)))
+    return sorted(starts)
+
+
+def best_fit_allocate(
+    theater: Theater,
+    k: int,
+    rules: Optional[SpacingRules] = None,
+    weights: FitWeights = DEFAULT_WEIGHTS,
+) -> Optional[List[Seat]]:
+    """Allocate ``k`` seats by scoring placements.
+
+    The whole party sits together in one row if any row has room; otherwise
+    it is split over consecutive rows, each row taking the largest block it
+    can. If even that fails (seats scattered), the greedy allocator decides.
+
+    :param theater: Theater context (grid is inspected, not mutated).
+    :type theater: Theater
+    :param k: Number of seats requested.
+    :type k: int
+    :param rules: Distancing rules; seats they forbid are skipped.
+    :type rules: Optional[SpacingRules]
+    :param weights: Cost weights.
+    :type weights: FitWeights
+    :return: Proposed seats or ``None`` if insufficient capacity.
+    :rtype: Optional[list[Seat]]
+    """
+    if k <= 0:
+        return []
+    if k > theater.available():
+        return None
+
+    runs = _free_runs(theater, rules)
+    scorer = _Scorer(theater, weights)
+
+    best: Optional[Tuple[float, int, int]] = None
+    longest = [max((last - first + 1 for first, last in rr), default=0) for rr in runs]
+    row_cost = scorer.t.row_cost
+    for r, row_runs in enumerate(runs):
+        if best is not None and scorer.prune and weights.row * row_cost[r] >= best[0]:
+            break  # row costs only grow towards the back
+        if longest[r] < k:
+            continue
+        found = scorer.best_in_row(r, row_runs, k)
+        if found is not None and (best is None or found[0] < best[0]):
+            best = (found[0], r, found[1])
+    if best is not None:
+        _, r, s = best
+        return list(seat_pool(theater.rows, theater.cols)[r][s - 1 : s - 1 + k])
+
+    split = _best_split(theater, runs, longest, k, scorer)
+    if split is not None:
+        return split
+    return auto_allocate(theater, k, rules)
+
+
+def _best_split(
+    theater: Theater,
+    runs: List[List[Tuple[int, int]]],
+    longest: List[int],
+    k: int,
+    scorer: _Scorer,
+) -> Optional[List[Seat]]:
+    """Return the cheapest placement over consecutive rows, if any."""
+    best: Optional[Tuple[float, List[Tuple[int, int, int]]]] = None
+    for r0 in range(len(runs)):
+        remaining, total, blocks = k, 0.0, []
+        r = r0
+        while remaining and r < len(runs) and longest[r]:
+            size = min(remaining, longest[r])
+            found = scorer.best_in_row(r, runs[r], size)
+            if found is None:
+                break
+            total += found[0]
+            blocks.append((r, found[1], size))
+            remaining -= size
+            r += 1
+        if remaining:
+            continue
+        total += scorer.w.spread * (len(blocks) - 1)
+        if best is None or total < best[0]:
+            best = (total, blocks)
+    if best is None:
+        return None
+    table = seat_pool(theater.rows, theater.cols)
+    seats: List[Seat] = []
+    for r, s, size in best[1]:
+        seats.extend(table[r][s - 1 : s - 1 + size])
+    return seats
@@ -0,0 +1,220 @@
+"""Compact 2D seat allocation for parties that do not fit in one row.
+
+The greedy allocators overflow a large party into the next rows seat by seat,
+so a party of eight can end up spread over the width of two rows. The
+cluster allocator instead looks for an ``h × w`` window of the grid holding
+at least ``k`` free seats (a rectangle, or a near-rectangle when
+``h * w > k``) and seats the party inside it.
+
+Window counts come from a 2D prefix sum of free seats (a
+:class:`FreeSeatPrefix`), so each window is tested in O(1) and each window
+shape in at most O(rows × cols). Shapes are tried from the fewest rows up to
+a roughly square block; within a shape the most central window wins, then
+the one nearest row ``A``. The sums are kept per theater and refreshed from
+``Theater.row_versions``: after a commit, only the rows it touched are
+re-counted and the sums are re-accumulated from the first of them down.
+"""
+
+from itertools import accumulate
+from math import isqrt
+from typing import Dict, List, Optional, Tuple
+
+from src.core.allocation import auto_allocate, center_col_order
+from src.core.seat_utils import seat_pool
+from src.core.spacing import SpacingRules, make_mask
+from src.models.entities import Seat, Theater
+
+
+class FreeSeatPrefix:
+    """2D prefix sums of the free seats of one theater.
+
+    ``table[r][c]`` is the number of free seats in rows ``0..r-1`` and
+    columns ``1..c``. Seats forbidden by *rules* do not count as free.
+
+    :param theater: Theater whose grid is counted (not mutated).
+    :type theater: Theater
+    :param rules: Distancing rules, or ``None``.
+    :type rules: Optional[SpacingRules]
+    """
+
+    def __init__(self, theater: Theater, rules: Optional[SpacingRules] = None) -> None:
+        self.theater = theater
+        self.rules = rules if rules is not None and rules.active() else None
+        self._neighbours = 1 if self.rules is not None and self.rules.no_behind else 0
+        self._stamps: List[Optional[Tuple[int, ...]]] = [None] * theater.rows
+        self._rows: List[List[int]] = [[0] * (theater.cols + 1)] * theater.rows
+        self.table: List[List[int]] = [[0] * (theater.cols + 1)] * (theater.rows + 1)
+
+    def _stamp(self, r: int) -> Tuple[int, ...]:
+        """Return the row versions row *r*'s free seats depend on."""
+        lo = max(r - self._neighbours, 0)
+        return tuple(self.theater.row_versions[lo : r + self._neighbours + 1])
+
+    def refresh(self) -> int:
+        """Bring the sums up to date with the grid.
+
+        :return: Number of rows that were re-counted.
+        :rtype: int
+        """
+        theater = self.theater
+        stale = [r for r in range(theater.rows) if self._stamps[r] != self._stamp(r)]
+        if not stale:
+            return 0
+        mask = make_mask(theater, self.rules)
+        for r in stale:
+            row = theater.grid[r]
+            forbidden = mask.forbidden(r) if mask else 0
+            self._rows[r] = list(
+                accumulate(
+                    (
+                        cell is None and not (forbidden >> i & 1)
+                        for i, cell in enumerate(row)
+                    ),
+                    initial=0,
+                )
+            )
+            self._stamps[r] = self._stamp(r)
+        for r in range(stale[0], theater.rows):
+            above, counts = self.table[r], self._rows[r]
+            self.table[r + 1] = [a + b for a, b in zip(above, counts)]
+        return len(stale)
+
+    def count(self, r0: int, c0: int, h: int, w: int) -> int:
+        """Return the free seats in rows ``r0..r0+h-1``, columns ``c0..c0+w-1``.
+
+        :param r0: Zero-based first row.
+        :type r0: int
+        :param c0: One-based first column.
+        :type c0: int
+        :param h: Window height (rows).
+        :type h: int
+        :param w: Window width (seats).
+        :type w: int
+        :return: Free seat count.
+        :rtype: int
+        """
+        top, bottom = self.table[r0], self.table[r0 + h]
+        left, right = c0 - 1, c0 + w - 1
+        return bottom[right] - top[right] - bottom[left] + top[left]
+
+    def is_free(self, r: int, c: int) -> bool:
+        """Return ``True`` if seat ``c`` of row *r* counts as free."""
+        counts = self._rows[r]
+        return counts[c] > counts[c - 1]
+
+
+class ClusterAllocator:
+    """Allocate a party as one compact block of rows.
+
+    Instances are callables with the signature of
+    :func:`~src.core.allocation.auto_allocate` and keep one
+    :class:`FreeSeatPrefix` per theater and rule set. Cache entries keep a
+    reference to their theater, so an ``id`` is not reused while cached.
+
+    :param maxsize: Maximum theaters whose sums are kept.
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize: int = 64) -> None:
+        self.maxsize = maxsize
+        self._prefixes: Dict[Tuple[int, Optional[SpacingRules]], FreeSeatPrefix] = {}
+
+    def prefix(
+        self, theater: Theater, rules: Optional[SpacingRules] = None
+    ) -> FreeSeatPrefix:
+        """Return the up-to-date prefix sums of *theater*.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param rules: Distancing rules, or ``None``.
+        :type rules: Optional[SpacingRules]
+        :return: Refreshed sums.
+        :rtype: FreeSeatPrefix
+        """
+        key = (id(theater), rules)
+        prefix = self._prefixes.get(key)
+        if prefix is None or prefix.theater is not theater:
+            if len(self._prefixes) >= self.maxsize:
+                self._prefixes.pop(next(iter(self._prefixes)))
+            prefix = self._prefixes[key] = FreeSeatPrefix(theater, rules)
+        prefix.refresh()
+        return prefix
+
+    def __call__(
+        self, theater: Theater, k: int, rules: Optional[SpacingRules] = None
+    ) -> Optional[List[Seat]]:
+        """Allocate ``k`` seats in the most compact central block.
+
+        When no window of any tried shape holds ``k`` free seats, the greedy
+        allocator decides.
+
+        :param theater: Theater context (grid is inspected, not mutated).
+        :type theater: Theater
+        :param k: Number of seats requested.
+        :type k: int
+        :param rules: Distancing rules; seats they forbid are skipped.
+        :type rules: Optional[SpacingRules]
+        :return: Proposed seats or ``None`` if insufficient capacity.
+        :rtype: Optional[list[Seat]]
+        """
+        if k <= 0:
+            return []
+        if k > theater.available():
+            return None
+
+        prefix = self.prefix(theater, rules)
+        min_h = -(-k // theater.cols)
+        max_h = min(theater.rows, max(min_h, isqrt(k - 1) + 1))
+        for h in range(min_h, max_h + 1):
+            w = -(-k // h)
+            window = _central_window(prefix, k, h, w)
+            if window is not None:
+                return _seats_in(prefix, k, window[0], window[1], h, w)
+        return auto_allocate(theater, k, rules)
+
+
+def _central_window(
+    prefix: FreeSeatPrefix, k: int, h: int, w: int
+) -> Optional[Tuple[int, int]]:
+    """Return ``(row, column)`` of the best ``h × w`` window with ``k`` free seats.
+
+    Columns are tried centre-out, so the first fit in a row is that row's
+    most central window and the rest of the row is skipped.
+    """
+    rows, cols = prefix.theater.rows, prefix.theater.cols
+    if w > cols:
+        return None
+    order = center_col_order(cols - w + 1)
+    best: Optional[Tuple[int, int, int]] = None
+    for r0 in range(rows - h + 1):
+        if prefix.count(r0, 1, h, cols) < k:
+            continue  # not enough free seats in these rows at all
+        for c0 in order:
+            if prefix.count(r0, c0, h, w) >= k:
+                off = abs(2 * c0 + w - 1 - (cols + 1))
+                if best is None or off < best[0]:
+                    best = (off, r0, c0)
+                break
+        if best is not None and best[0] <= 1:
+            break  # no later row can be more central
+    return None if best is None else (best[1], best[2])
+
+
+def _seats_in(
+    prefix: FreeSeatPrefix, k: int, r0: int, c0: int, h: int, w: int
+) -> List[Seat]:
+    """Pick ``k`` free seats of a window: front rows first, centre-out."""
+    mid = 2 * c0 + w - 1
+    free = [
+        (r, abs(2 * c - mid), c)
+        for r in range(r0, r0 + h)
+        for c in range(c0, c0 + w)
+        if prefix.is_free(r, c)
+    ]
+    chosen = sorted(sorted(free)[:k], key=lambda t: (t[0], t[2]))
+    table = seat_pool(prefix.theater.rows, prefix.theater.cols)
+    return [table[r][c - 1] for r, _, c in chosen]
+
+
+#: Shared allocator registered as the ``cluster`` strategy.
+cluster_allocate = ClusterAllocator()
@@ -0,0 +1,273 @@
+"""In-process event bus for booking changes.
+
+:class:`~src.core.services.booking.BookingService` publishes a typed event
+after every mutation, so caches, dashboards, persistence or metrics can react
+without polling or diffing ``Theater.grid``. Each event names the screen and
+booking, lists the affected seats as contiguous :class:`SeatRange` runs, and
+carries the theater's grid version after the change.
+
+Subscribers are either
+
+* synchronous — called on the publishing thread, before ``publish`` returns;
+  meant for cheap reactions such as setting a flag; or
+* queued — handed to a background thread through a bounded queue, for slow
+  work (I/O) that must not delay a booking.
+
+Handlers always receive a *sequence* of events. A single publish delivers one
+event; inside :meth:`EventBus.batch` events are buffered and each subscriber
+gets all matching events of the transaction in one call.
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.models.entities import Seat
+
+
+@dataclass(frozen=True, slots=True)
+class SeatRange:
+    """Consecutive seats ``start..end`` (inclusive, one-based) of one row.
+
+    :param row: Row letter.
+    :type row: str
+    :param start: First seat number.
+    :type start: int
+    :param end: Last seat number.
+    :type end: int
+    """
+
+    row: str
+    start: int
+    end: int
+
+
+def seat_ranges(seats: Iterable[Seat]) -> Tuple[SeatRange, ...]:
+    """Collapse seats into sorted contiguous ranges per row.
+
+    :param seats: Seats in any order.
+    :type seats: Iterable[Seat]
+    :return: Ranges ordered by row, then seat number.
+    :rtype: tuple[SeatRange, ...]
+    """
+    ranges: List[SeatRange] = []
+    for row, col in sorted({(s.row.upper(), s.col) for s in seats}):
+        last = ranges[-1] if ranges else None
+        if last is not None and last.row == row and last.end + 1 == col:
+            ranges[-1] = SeatRange(row, last.start, col)
+        else:
+            ranges.append(SeatRange(row, col, col))
+    return tuple(ranges)
+
+
+@dataclass(frozen=True, slots=True)
+class BookingEvent:
+    """Base class of booking change events.
+
+    :param screen: Title of the affected screen.
+    :type screen: str
+    :param booking_id: Booking identifier.
+    :type booking_id: str
+    :param ranges: Affected seats.
+    :type ranges: tuple[SeatRange, ...]
+    :param version: ``Theater.version`` after the change.
+    :type version: int
+    :param screening: ``(screen, showtime)`` of the affected screening when the
+        context is driven by a schedule, else ``None``.
+    :type screening: Optional[tuple[str, str]]
+    """
+
+    screen: str
+    booking_id: str
+    ranges: Tuple[SeatRange, ...]
+    version: int
+    screening: Optional[Tuple[str, str]] = None
+
+
+@dataclass(frozen=True, slots=True)
+class BookingCommitted(BookingEvent):
+    """Seats were assigned to a new booking."""
+
+
+@dataclass(frozen=True, slots=True)
+class BookingCancelled(BookingEvent):
+    """A booking was cancelled and its seats released."""
+
+
+#: Event handler; receives one or more events per call.
+Handler = Callable[[Sequence[BookingEvent]], None]
+
+
+class Subscription:
+    """A registered handler and the event types it receives.
+
+    :param handler: Callback.
+    :type handler: Handler
+    :param types: Event classes delivered (subclasses included).
+    :type types: tuple[type, ...]
+    """
+
+    def __init__(self, handler: Handler, types: Tuple[type, ...]) -> None:
+        self.handler = handler
+        self.types = types
+
+    def matching(self, events: Sequence[BookingEvent]) -> List[BookingEvent]:
+        """Return the events this subscription wants, in order."""
+        return [e for e in events if isinstance(e, self.types)]
+
+    def deliver(self, events: Sequence[BookingEvent]) -> None:
+        """Hand *events* to the handler on the calling thread."""
+        self.handler(events)
+
+    def close(self) -> None:
+        """Release resources (nothing to do for synchronous delivery)."""
+
+
+class QueuedSubscription(Subscription):
+    """Deliver events from a background thread.
+
+    Publishing blocks while the queue is full, so a slow consumer applies
+    back-pressure instead of losing events.
+
+    :param handler: Callback, run on the worker thread.
+    :type handler: Handler
+    :param types: Event classes delivered (subclasses included).
+    :type types: tuple[type, ...]
+    :param maxsize: Bound of the pending-delivery queue.
+    :type maxsize: int
+    """
+
+    _STOP = object()
+
+    def __init__(self, handler: Handler, types: Tuple[type, ...], maxsize: int) -> None:
+        super().__init__(handler, types)
+        self.errors = 0
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize)
+        self._thread = threading.Thread(
+            target=self._drain, name="gic-events", daemon=True
+        )
+        self._thread.start()
+
+    def deliver(self, events: Sequence[BookingEvent]) -> None:
+        """Enqueue *events* for the worker thread."""
+        self._queue.put(events)
+
+    def _drain(self) -> None:
+        """Worker loop: run the handler for each queued delivery."""
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            try:
+                self.handler(item)  # type: ignore[arg-type]
+            except Exception:  # noqa: BLE001 - a bad consumer must not kill the worker
+                self.errors += 1
+
+    def close(self) -> None:
+        """Deliver everything still queued, then stop the worker."""
+        if self._thread.is_alive():
+            self._queue.put(self._STOP)
+            self._thread.join()
+
+
+class EventBus:
+    """Publish booking events to synchronous and queued subscribers."""
+
+    def __init__(self) -> None:
+        self._subs: List[Subscription] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def subscribe(self, handler: Handler, *types: type) -> Subscription:
+        """Call *handler* on the publishing thread for events of *types*.
+
+        Exceptions raised by *handler* propagate to the publisher.
+
+        :param handler: Callback receiving a sequence of events.
+        :type handler: Handler
+        :param types: Event classes to receive (default: all events).
+        :type types: type
+        :return: Subscription, for :meth:`unsubscribe`.
+        :rtype: Subscription
+        """
+        return self._add(Subscription(handler, types or (BookingEvent,)))
+
+    def subscribe_queued(
+        self, handler: Handler, *types: type, maxsize: int = 1024
+    ) -> Subscription:
+        """Call *handler* from a dedicated background thread.
+
+        :param handler: Callback receiving a sequence of events.
+        :type handler: Handler
+        :param types: Event classes to receive (default: all events).
+        :type types: type
+        :param maxsize: Deliveries buffered before publishers block.
+        :type maxsize: int
+        :return: Subscription, for :meth:`unsubscribe`.
+        :rtype: Subscription
+        """
+        return self._add(QueuedSubscription(handler, types or (BookingEvent,), maxsize))
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        """Remove *sub* (flushing it if queued); no-op if already removed.
+
+        :param sub: Subscription returned by :meth:`subscribe`.
+        :type sub: Subscription
+        """
+        with self._lock:
+            if sub not in self._subs:
+                return
+            self._subs = [s for s in self._subs if s is not sub]
+        sub.close()
+
+    def publish(self, event: BookingEvent) -> None:
+        """Deliver *event* now, or buffer it inside :meth:`batch`.
+
+        :param event: Event to publish.
+        :type event: BookingEvent
+        """
+        pending: Optional[List[BookingEvent]] = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending.append(event)
+        else:
+            self._dispatch([event])
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Buffer events published by this thread and deliver them together.
+
+        Nested batches join the outermost one. Buffered events are delivered
+        even if the block raises, since the changes they describe were made.
+        """
+        if getattr(self._local, "pending", None) is not None:
+            yield
+            return
+        self._local.pending = []
+        try:
+            yield
+        finally:
+            events, self._local.pending = self._local.pending, None
+            if events:
+                self._dispatch(events)
+
+    def close(self) -> None:
+        """Flush and stop every queued subscriber."""
+        with self._lock:
+            subs, self._subs = self._subs, []
+        for sub in subs:
+            sub.close()
+
+    def _add(self, sub: Subscription) -> Subscription:
+        """Register *sub* (copy-on-write, so dispatch needs no lock)."""
+        with self._lock:
+            self._subs = self._subs + [sub]
+        return sub
+
+    def _dispatch(self, events: List[BookingEvent]) -> None:
+        """Deliver *events* to every subscriber with at least one match."""
+        for sub in self._subs:
+            wanted = sub.matching(events)
+            if wanted:
+                sub.deliver(wanted)
@@ -0,0 +1,307 @@
+"""Streaming CSV / JSON-lines export of bookings and occupancy summaries.
+
+Reports are produced record by record from generators over the schedule and
+written in one pass through a buffered (optionally gzip-compressed) text
+stream, so memory does not grow with the number of bookings.
+
+Exports run beside booking rather than instead of it. For each screening the
+exporter copies references to its bookings (one C-level list copy, a few
+milliseconds per million bookings) and formats the copy afterwards, so
+commits and cancellations are never waited on and the report is a consistent
+snapshot per screening. :class:`Exporter` runs exports on a background
+thread so the operator can keep booking meanwhile. The file is written under
+a temporary name and renamed when complete, so readers never see a partial
+report.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+
+from src.models.schedule import Schedule
+
+#: One report line, values in the order of the report's fields.
+Record = Tuple[object, ...]
+
+BOOKING_FIELDS = ("screen", "showtime", "title", "booking_id", "seats", "seat_codes")
+OCCUPANCY_FIELDS = (
+    "screen",
+    "showtime",
+    "title",
+    "capacity",
+    "sold",
+    "available",
+    "fill_rate",
+    "bookings",
+)
+
+#: Write buffer size, in bytes.
+BUFFER_SIZE = 1 << 16
+#: gzip level: 6 compresses nearly as well as 9 at a fraction of the cost.
+GZIP_LEVEL = 6
+
+
+def booking_records(schedule: Schedule) -> Iterator[Record]:
+    """Yield one record per booking, screening by screening, in booking order.
+
+    ``seat_codes`` is a list of seat codes such as ``["A01", "A02"]``.
+
+    :param schedule: Screenings to export.
+    :type schedule: Schedule
+    :return: Records in :data:`BOOKING_FIELDS` order.
+    :rtype: Iterator[Record]
+    """
+    for screening in schedule:
+        if not screening.bookings:
+            continue
+        screen, showtime = screening.key
+        title = screening.title
+        for booking in list(screening.bookings.values()):
+            codes = [seat.code() for seat in booking.seats]
+            yield screen, showtime, title, booking.booking_id, len(codes), codes
+
+
+def occupancy_records(schedule: Schedule) -> Iterator[Record]:
+    """Yield one occupancy summary per screening.
+
+    Screenings that were never opened are reported empty without creating
+    their seat grids.
+
+    :param schedule: Screenings to summarise.
+    :type schedule: Schedule
+    :return: Records in :data:`OCCUPANCY_FIELDS` order.
+    :rtype: Iterator[Record]
+    """
+    for screening in schedule:
+        screen, showtime = screening.key
+        capacity = screening.auditorium.capacity()
+        available = screening.available()
+        sold = capacity - available
+        fill_rate = round(sold / capacity, 4) if capacity else 0.0
+        bookings = len(screening.bookings) if screening.bookings else 0
+        yield (
+            screen,
+            showtime,
+            screening.title,
+            capacity,
+            sold,
+            available,
+            fill_rate,
+            bookings,
+        )
+
+
+#: Report name -> (fields, record generator).
+REPORTS: Dict[str, Tuple[Tuple[str, ...], Callable[[Schedule], Iterator[Record]]]] = {
+    "bookings": (BOOKING_FIELDS, booking_records),
+    "occupancy": (OCCUPANCY_FIELDS, occupancy_records),
+}
+
+#: Output formats, by file extension (before an optional ``.gz``).
+FORMATS = {".csv": "csv", ".jsonl": "jsonl"}
+
+
+def export_format(path: str) -> str:
+    """Return the output format named by *path*'s extension.
+
+    :param path: Output path, e.g. ``bookings.csv`` or ``bookings.jsonl.gz``.
+    :type path: str
+    :return: ``csv`` or ``jsonl``.
+    :rtype: str
+    :raises ValueError: On an unsupported extension.
+    """
+    base = path[:-3] if path.lower().endswith(".gz") else path
+    fmt = FORMATS.get(os.path.splitext(base)[1].lower())
+    if fmt is None:
+        raise ValueError("Export file must end in .csv or .jsonl (optionally .gz).")
+    return fmt
+
+
+def open_output(path: str, compress: bool = False) -> TextIO:
+    """Open *path* for buffered UTF-8 text output.
+
+    :param path: File to create or overwrite.
+    :type path: str
+    :param compress: gzip the output.
+    :type compress: bool
+    :return: Text stream; the caller closes it.
+    :rtype: TextIO
+    """
+    if compress:
+        raw = gzip.GzipFile(path, "wb", compresslevel=GZIP_LEVEL)
+        buffered = io.BufferedWriter(raw, BUFFER_SIZE)  # type: ignore[arg-type]
+        return io.TextIOWrapper(buffered, encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="", buffering=BUFFER_SIZE)
+
+
+def write_records(
+    records: Iterable[Record], fields: Tuple[str, ...], stream: TextIO, fmt: str
+) -> int:
+    """Write *records* to *stream* as CSV (with a header) or JSON lines.
+
+    In CSV, list values are written space-separated.
+
+    :param records: Records in *fields* order.
+    :type records: Iterable[Record]
+    :param fields: Field names.
+    :type fields: tuple[str, ...]
+    :param stream: Text output.
+    :type stream: TextIO
+    :param fmt: ``csv`` or ``jsonl``.
+    :type fmt: str
+    :return: Number of records written.
+    :rtype: int
+    """
+    count = 0
+    if fmt == "csv":
+        writer = csv.writer(stream)
+        writer.writerow(fields)
+        for record in records:
+            writer.writerow(" ".join(v) if isinstance(v, list) else v for v in record)
+            count += 1
+    else:
+        write = stream.write
+        encode = json.JSONEncoder(separators=(",", ":")).encode
+        for record in records:
+            write(encode(dict(zip(fields, record))))
+            write("\n")
+            count += 1
+    return count
+
+
+def export_report(schedule: Schedule, report: str, path: str) -> int:
+    """Write *report* of *schedule* to *path* in a single streaming pass.
+
+    :param schedule: Screenings to export.
+    :type schedule: Schedule
+    :param report: A key of :data:`REPORTS`.
+    :type report: str
+    :param path: Output file; its extension selects CSV or JSON lines and a
+        trailing ``.gz`` compresses it.
+    :type path: str
+    :return: Number of records written.
+    :rtype: int
+    :raises ValueError: On an unknown report or unsupported extension.
+    :raises OSError: If the file cannot be written.
+    """
+    if report not in REPORTS:
+        raise ValueError(f"Report must be one of: {', '.join(REPORTS)}.")
+    fmt = export_format(path)
+    fields, records = REPORTS[report]
+    partial = f"{path}.partial"
+    try:
+        with open_output(partial, path.lower().endswith(".gz")) as stream:
+            count = write_records(records(schedule), fields, stream, fmt)
+        os.replace(partial, path)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    return count
+
+
+@dataclass(frozen=True, slots=True)
+class ExportResult:
+    """Outcome of a finished export.
+
+    :param report: Report name.
+    :type report: str
+    :param path: Output file.
+    :type path: str
+    :param records: Records written (``0`` on failure).
+    :type records: int
+    :param seconds: Wall time of the export.
+    :type seconds: float
+    :param error: Failure message, ``None`` on success.
+    :type error: Optional[str]
+    """
+
+    report: str
+    path: str
+    records: int
+    seconds: float
+    error: Optional[str] = None
+
+    def describe(self) -> str:
+        """Return a one-line, operator-facing summary.
+
+        :return: E.g. ``3 bookings records written to out.csv in 0.01 s``.
+        :rtype: str
+        """
+        if self.error is not None:
+            return f"export of {self.report} to {self.path} failed: {self.error}"
+        return (
+            f"{self.records} {self.report} records written to {self.path} "
+            f"in {self.seconds:.2f} s"
+        )
+
+
+class Exporter:
+    """Run one export at a time on a background thread.
+
+    :param schedule: Screenings to export.
+    :type schedule: Schedule
+    """
+
+    def __init__(self, schedule: Schedule) -> None:
+        self._schedule = schedule
+        self._thread: Optional[threading.Thread] = None
+        self.target: Optional[str] = None
+        self.last: Optional[ExportResult] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether an export is in progress."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, report: str, path: str) -> None:
+        """Start exporting *report* to *path*; see :func:`export_report`.
+
+        :param report: A key of :data:`REPORTS`.
+        :type report: str
+        :param path: Output file.
+        :type path: str
+        :raises RuntimeError: If an export is already running.
+        :raises ValueError: On an unknown report or unsupported extension.
+        """
+        if self.running:
+            raise RuntimeError(f"An export to {self.target} is already running.")
+        if report not in REPORTS:
+            raise ValueError(f"Report must be one of: {', '.join(REPORTS)}.")
+        export_format(path)
+        self.target = path
+        self._thread = threading.Thread(
+            target=self._run, args=(report, path), name="gic-export", daemon=True
+        )
+        self._thread.start()
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[ExportResult]:
+        """Wait for the running export, if any, and return the latest result.
+
+        :param timeout: Seconds to wait; ``None`` waits until it finishes.
+        :type timeout: Optional[float]
+        :return: Result of the last finished export.
+        :rtype: Optional[ExportResult]
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.last
+
+    def _run(self, report: str, path: str) -> None:
+        """Export thread: write the report and record the outcome."""
+        start = time.perf_counter()
+        try:
+            count = export_report(self._schedule, report, path)
+        except Exception as exc:  # noqa: BLE001 - reported through ``last``
+            result = ExportResult(
+                report, path, 0, time.perf_counter() - start, str(exc)
+            )
+        else:
+            result = ExportResult(report, path, count, time.perf_counter() - start)
+        self.last = result
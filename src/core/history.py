@@ -0,0 +1,112 @@
+"""Bounded undo/redo log of booking operations.
+
+Each entry records one commit or cancellation together with the booking it
+touched, which is all that is needed to apply its inverse: undoing a commit
+releases the booking's seats, undoing a cancellation assigns them again. Both
+cost time proportional to the booking's size. History is linear, as in an
+editor: recording a new operation drops everything that could be redone, so
+a redone operation always finds its seats in the state it left them.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional
+
+from src.models.context import AppContext
+from src.models.entities import Booking
+
+#: Operations kept by default (older ones can no longer be undone).
+DEFAULT_DEPTH = 50
+
+COMMIT = "commit"
+CANCEL = "cancel"
+
+
+@dataclass(frozen=True, slots=True)
+class Operation:
+    """One recorded booking operation.
+
+    :param kind: :data:`COMMIT` or :data:`CANCEL`.
+    :type kind: str
+    :param booking: Booking that was committed or cancelled.
+    :type booking: Booking
+    :param target: Screen the operation applied to: a context sharing that
+        screen's theater and booking registry, so undo reaches it even after
+        the operator switched screenings.
+    :type target: AppContext
+    """
+
+    kind: str
+    booking: Booking
+    target: AppContext
+
+    def describe(self) -> str:
+        """Return a short operator-facing description.
+
+        :return: E.g. ``booking GIC0002`` or ``cancellation of GIC0002``.
+        :rtype: str
+        """
+        if self.kind == CANCEL:
+            return f"cancellation of {self.booking.booking_id}"
+        return f"booking {self.booking.booking_id}"
+
+
+class OperationLog:
+    """Undo and redo stacks holding at most *depth* operations each.
+
+    :param depth: Maximum operations kept per stack.
+    :type depth: int
+    """
+
+    def __init__(self, depth: int = DEFAULT_DEPTH) -> None:
+        self._undo: Deque[Operation] = deque(maxlen=depth)
+        self._redo: Deque[Operation] = deque(maxlen=depth)
+
+    def record(self, op: Operation) -> None:
+        """Record a new operation and forget the redo stack.
+
+        :param op: Operation just applied.
+        :type op: Operation
+        """
+        self._undo.append(op)
+        self._redo.clear()
+
+    def next_undo(self) -> Optional[Operation]:
+        """Return the operation :meth:`undo` would revert, if any.
+
+        :return: Most recent operation.
+        :rtype: Optional[Operation]
+        """
+        return self._undo[-1] if self._undo else None
+
+    def next_redo(self) -> Optional[Operation]:
+        """Return the operation :meth:`redo` would re-apply, if any.
+
+        :return: Most recently undone operation.
+        :rtype: Optional[Operation]
+        """
+        return self._redo[-1] if self._redo else None
+
+    def undo(self) -> Optional[Operation]:
+        """Move the most recent operation to the redo stack.
+
+        :return: Operation whose inverse the caller must apply.
+        :rtype: Optional[Operation]
+        """
+        if not self._undo:
+            return None
+        op = self._undo.pop()
+        self._redo.append(op)
+        return op
+
+    def redo(self) -> Optional[Operation]:
+        """Move the most recently undone operation back to the undo stack.
+
+        :return: Operation the caller must apply again.
+        :rtype: Optional[Operation]
+        """
+        if not self._redo:
+            return None
+        op = self._redo.pop()
+        self._undo.append(op)
+        return op
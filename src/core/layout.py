@@ -0,0 +1,116 @@
+"""Loading auditorium layouts from text or JSON files.
+
+Text format — one line per row, front row (``A``) first::
+
+    # Lines starting with '#' are comments.
+      ........
+     ..........
+    ww..xx....ww
+
+``.`` is a seat, ``w`` a wheelchair space, ``x`` a blocked seat, and a space
+or ``_`` a position without a seat. Rows shorter than the widest one are
+padded with missing positions (curved rows); an empty line is a row without
+seats.
+
+JSON format::
+
+    {"rows": 3, "cols": 12, "missing": ["A01", "A02"],
+     "blocked": ["C05", "C06"], "wheelchair": ["C01", "C02"]}
+"""
+
+import json
+from typing import Any, Dict, FrozenSet, List, Set
+
+from src.core.seat_utils import MAX_COLS, MAX_ROWS, parse_seat_code, row_letter_to_index
+from src.models.layout import Layout, Position
+
+_KINDS = {".": None, "w": "wheelchair", "x": "blocked", " ": "missing", "_": "missing"}
+
+
+def parse_layout_text(text: str) -> Layout:
+    """Parse the text layout format.
+
+    :param text: File contents.
+    :type text: str
+    :return: Parsed layout.
+    :rtype: Layout
+    :raises ValueError: On unknown characters or an out-of-range size.
+    """
+    lines = [ln.rstrip("\r\n") for ln in text.split("\n")]
+    lines = [ln for ln in lines if not ln.lstrip().startswith("#")]
+    while lines and not lines[-1].strip():
+        lines.pop()
+    while lines and not lines[0].strip():
+        lines.pop(0)
+    if not lines:
+        raise ValueError("Layout has no rows.")
+
+    cols = max(len(ln) for ln in lines)
+    marked: Dict[str, Set[Position]] = {
+        "missing": set(),
+        "blocked": set(),
+        "wheelchair": set(),
+    }
+    for r, line in enumerate(lines):
+        for c, ch in enumerate(line.ljust(cols), start=1):
+            if ch not in _KINDS:
+                raise ValueError(
+                    f"Unknown layout character {ch!r} in row {r + 1}, column {c}."
+                )
+            kind = _KINDS[ch]
+            if kind is not None:
+                marked[kind].add((r, c))
+    return _build(len(lines), cols, marked)
+
+
+def parse_layout_json(data: Dict[str, Any]) -> Layout:
+    """Build a layout from the JSON format (already decoded).
+
+    :param data: Mapping with ``rows``, ``cols`` and optional seat-code lists
+        ``missing``, ``blocked`` and ``wheelchair``.
+    :type data: dict[str, Any]
+    :return: Parsed layout.
+    :rtype: Layout
+    :raises ValueError: On missing keys, bad seat codes or an out-of-range size.
+    """
+    try:
+        rows, cols = int(data["rows"]), int(data["cols"])
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ValueError("Layout JSON needs integer 'rows' and 'cols'.") from exc
+    marked: Dict[str, Set[Position]] = {}
+    for kind in ("missing", "blocked", "wheelchair"):
+        codes: List[str] = data.get(kind, [])
+        seats = [parse_seat_code(code) for code in codes]
+        marked[kind] = {(row_letter_to_index(s.row), s.col) for s in seats}
+    return _build(rows, cols, marked)
+
+
+def load_layout(path: str) -> Layout:
+    """Load a layout file; ``*.json`` files use the JSON format.
+
+    :param path: File path.
+    :type path: str
+    :return: Parsed layout.
+    :rtype: Layout
+    :raises ValueError: If the file is malformed.
+    :raises OSError: If the file cannot be read.
+    """
+    with open(path, encoding="utf-8") as fh:
+        if path.lower().endswith(".json"):
+            try:
+                return parse_layout_json(json.load(fh))
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"Invalid layout JSON: {exc}.") from exc
+        return parse_layout_text(fh.read())
+
+
+def _build(rows: int, cols: int, marked: Dict[str, Set[Position]]) -> Layout:
+    """Validate the size and freeze the position sets into a :class:`Layout`."""
+    if not (1 <= rows <= MAX_ROWS and 1 <= cols <= MAX_COLS):
+        raise ValueError(
+            f"Layout must have 1-{MAX_ROWS} rows and 1-{MAX_COLS} seats per row."
+        )
+    frozen: Dict[str, FrozenSet[Position]] = {
+        k: frozenset(v) for k, v in marked.items()
+    }
+    return Layout(rows=rows, cols=cols, **frozen)
@@ -0,0 +1,123 @@
+"""NumPy occupancy store (optional dependency).
+
+Import this module only through :func:`src.core.occupancy.make_occupancy`, so
+NumPy is loaded only when the backend is selected.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.models.layout import BLOCKED, MISSING
+
+#: Owner handles of the non-booking states; bookings get handles from 1.
+_FREE, _MISSING, _BLOCKED = 0, -1, -2
+
+
+class NumpyOccupancy:
+    """Occupancy as a ``uint8`` free mask and an ``int32`` owner-handle matrix.
+
+    Booking IDs are interned to small positive handles, so "seats of booking
+    X" is one comparison over the matrix.
+
+    :param rows: Number of rows.
+    :type rows: int
+    :param cols: Seats per row.
+    :type cols: int
+    """
+
+    def __init__(self, rows: int, cols: int) -> None:
+        self.free = np.ones((rows, cols), dtype=np.uint8)
+        self.owner = np.zeros((rows, cols), dtype=np.int32)
+        self._handles: Dict[str, int] = {}
+
+    def load(self, grid: Sequence[Sequence[Optional[str]]]) -> None:
+        """Replace the stored state with *grid*.
+
+        :param grid: ``Theater.grid``.
+        :type grid: Sequence[Sequence[Optional[str]]]
+        """
+        self.free.fill(1)
+        self.owner.fill(_FREE)
+        for r, row in enumerate(grid):
+            for c, cell in enumerate(row, start=1):
+                if cell is not None:
+                    self.assign(r, c, cell)
+
+    def assign(self, row_idx: int, col: int, owner: Optional[str]) -> None:
+        """Record the new occupant of one seat.
+
+        :param row_idx: Zero-based row index.
+        :type row_idx: int
+        :param col: One-based column index.
+        :type col: int
+        :param owner: Booking ID, a layout sentinel, or ``None`` for free.
+        :type owner: Optional[str]
+        """
+        self.free[row_idx, col - 1] = owner is None
+        self.owner[row_idx, col - 1] = self._handle(owner)
+
+    def available(self) -> int:
+        """Return the number of free seats.
+
+        :return: Free seat count.
+        :rtype: int
+        """
+        return int(self.free.sum(dtype=np.int64))
+
+    def row_free_counts(self) -> List[int]:
+        """Return the number of free seats of each row.
+
+        :return: One count per row.
+        :rtype: list[int]
+        """
+        return self.free.sum(axis=1, dtype=np.int64).tolist()
+
+    def seats_of(self, owner: str) -> List[Tuple[int, int]]:
+        """Return the seats held by *owner*, row by row.
+
+        :param owner: Booking ID.
+        :type owner: str
+        :return: ``(row index, one-based column)`` pairs.
+        :rtype: list[tuple[int, int]]
+        """
+        handle = self._handles.get(owner)
+        if handle is None:
+            return []
+        rows, cols = np.nonzero(self.owner == handle)
+        return list(zip(rows.tolist(), (cols + 1).tolist()))
+
+    def symbol_rows(self, current_booking_id: Optional[str], symbols: str) -> List[str]:
+        """Map the whole grid to symbols with one table lookup.
+
+        :param current_booking_id: Booking to highlight, if any.
+        :type current_booking_id: Optional[str]
+        :param symbols: Five single-byte symbols: free, missing, blocked,
+            other booking, current booking.
+        :type symbols: str
+        :return: One string per row.
+        :rtype: list[str]
+        """
+        state = np.full(self.owner.shape, 3, dtype=np.uint8)
+        state[self.owner == _FREE] = 0
+        state[self.owner == _MISSING] = 1
+        state[self.owner == _BLOCKED] = 2
+        handle = self._handles.get(current_booking_id or "")
+        if handle is not None:
+            state[self.owner == handle] = 4
+        table = np.frombuffer(symbols.encode("ascii"), dtype=np.uint8)
+        chars = table[state]
+        return [row.tobytes().decode("ascii") for row in chars]
+
+    def _handle(self, owner: Optional[str]) -> int:
+        """Return the matrix value for *owner*, interning new booking IDs."""
+        if owner is None:
+            return _FREE
+        if owner is MISSING:
+            return _MISSING
+        if owner is BLOCKED:
+            return _BLOCKED
+        handle = self._handles.get(owner)
+        if handle is None:
+            handle = self._handles[owner] = len(self._handles) + 1
+        return handle
@@ -0,0 +1,46 @@
+"""Lookup of occupancy stores by name.
+
+``list`` keeps the plain ``Theater.grid`` only. Other backends are imported
+the first time they are selected, so their dependencies are never loaded by
+deployments that do not use them.
+"""
+
+from importlib import import_module
+from typing import Callable, Dict, Optional
+
+from src.models.occupancy import Occupancy
+
+#: Selectable backends: name -> ``"module:Class"`` (``None`` = grid only).
+OCCUPANCY_BACKENDS: Dict[str, Optional[str]] = {
+    "list": None,
+    "numpy": "src.core.numpy_occupancy:NumpyOccupancy",
+}
+
+
+def occupancy_factory(name: str) -> Optional[Callable[[int, int], Occupancy]]:
+    """Return a ``(rows, cols)`` factory for backend *name*.
+
+    :param name: Key of :data:`OCCUPANCY_BACKENDS` (case-insensitive).
+    :type name: str
+    :return: Factory, or ``None`` for the plain grid.
+    :rtype: Optional[Callable[[int, int], Occupancy]]
+    :raises ValueError: If *name* is unknown.
+    :raises ImportError: If the backend's dependency is not installed.
+    """
+    key = name.strip().lower()
+    if key not in OCCUPANCY_BACKENDS:
+        raise ValueError(
+            f"Unknown occupancy backend '{name}'. "
+            f"Choose one of: {', '.join(OCCUPANCY_BACKENDS)}."
+        )
+    target = OCCUPANCY_BACKENDS[key]
+    if target is None:
+        return None
+    module_name, cls_name = target.split(":")
+    try:
+        module = import_module(module_name)
+    except ImportError as exc:
+        raise ImportError(
+            f"The '{key}' occupancy backend needs a missing package: {exc}."
+        ) from exc
+    return getattr(module, cls_name)
@@ -0,0 +1,184 @@
+"""Previews for every party size of one grid version.
+
+The greedy allocator takes the first ``k`` seats of one fixed sequence: free
+seats row by row, each row in its compiled centre-out order (see
+:func:`~src.core.allocation.row_orders`). Spacing rules do not change that,
+because a party's own seats never constrain each other. One pass over that
+order therefore answers the preview for every ``k``: it is a slice of the
+sequence, which is read lazily and only as far as the largest ``k`` asked
+for. Other strategies are memoised per ``k`` instead.
+
+A :class:`PreviewTable` belongs to one theater at one ``Theater.version``;
+any commit or cancellation makes it stale.
+"""
+
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+
+from src.core.allocation import row_orders
+from src.core.seat_utils import seat_pool
+from src.core.spacing import SpacingRules, make_mask
+from src.core.strategies import get_allocator
+from src.models.entities import Seat, Theater
+
+
+def greedy_seats(
+    theater: Theater, rules: Optional[SpacingRules] = None
+) -> Iterator[Seat]:
+    """Yield every seat the greedy allocator may use, in the order it uses them.
+
+    ``auto_allocate(theater, k, rules)`` equals the first ``k`` items when
+    there are at least ``k``. Rows are only read as the iterator advances, so
+    a caller needing a few seats does not scan the whole house.
+
+    :param theater: Theater context (grid is inspected, not mutated).
+    :type theater: Theater
+    :param rules: Distancing rules; seats they forbid are left out.
+    :type rules: Optional[SpacingRules]
+    :return: Seats in allocation order.
+    :rtype: Iterator[Seat]
+    """
+    orders = row_orders(theater)
+    table = seat_pool(theater.rows, theater.cols)
+    mask = make_mask(theater, rules)
+    for row_idx in range(theater.rows):
+        if not theater.row_free[row_idx]:
+            continue
+        row = theater.grid[row_idx]
+        row_seats = table[row_idx]
+        forbidden = mask.forbidden(row_idx) if mask else 0
+        for col in orders[row_idx]:
+            if row[col - 1] is None and not (forbidden >> (col - 1) & 1):
+                yield row_seats[col - 1]
+
+
+def greedy_sequence(
+    theater: Theater, rules: Optional[SpacingRules] = None
+) -> List[Seat]:
+    """Return :func:`greedy_seats` as a list.
+
+    :param theater: Theater context (grid is inspected, not mutated).
+    :type theater: Theater
+    :param rules: Distancing rules; seats they forbid are left out.
+    :type rules: Optional[SpacingRules]
+    :return: Seats in allocation order.
+    :rtype: list[Seat]
+    """
+    return list(greedy_seats(theater, rules))
+
+
+def largest_group(theater: Theater, rules: Optional[SpacingRules] = None) -> int:
+    """Return the most seats one party can get side by side in a single row.
+
+    :param theater: Theater context (grid is inspected, not mutated).
+    :type theater: Theater
+    :param rules: Distancing rules; seats they forbid break a run.
+    :type rules: Optional[SpacingRules]
+    :return: Longest run of usable adjacent seats (``0`` if none).
+    :rtype: int
+    """
+    best = 0
+    mask = make_mask(theater, rules)
+    for row_idx, row in enumerate(theater.grid):
+        if theater.row_free[row_idx] <= best:
+            continue  # cannot beat the best run so far
+        forbidden = mask.forbidden(row_idx) if mask else 0
+        run = 0
+        for i, cell in enumerate(row):
+            if cell is None and not (forbidden >> i & 1):
+                run += 1
+                if run > best:
+                    best = run
+            else:
+                run = 0
+    return best
+
+
+@dataclass(slots=True)
+class PreviewTable:
+    """Lazily built previews of one theater at one grid version.
+
+    :param theater: Theater the previews are for.
+    :type theater: Theater
+    :param allocator: Name of the automatic allocation strategy.
+    :type allocator: str
+    :param rules: Distancing rules applied to every preview.
+    :type rules: Optional[SpacingRules]
+    """
+
+    theater: Theater
+    allocator: str
+    rules: Optional[SpacingRules] = None
+    version: int = field(init=False)
+    _seats: Optional[Iterator[Seat]] = field(init=False, default=None)
+    _prefix: List[Seat] = field(init=False, default_factory=list)
+    _memo: Dict[int, Optional[List[Seat]]] = field(init=False, default_factory=dict)
+    _largest: Optional[int] = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        """Record the grid version the table describes."""
+        self.version = self.theater.version
+
+    def fresh(
+        self, theater: Theater, allocator: str, rules: Optional[SpacingRules]
+    ) -> bool:
+        """Return ``True`` if the table still answers for these arguments.
+
+        :param theater: Theater of the request.
+        :type theater: Theater
+        :param allocator: Strategy of the request.
+        :type allocator: str
+        :param rules: Rules of the request.
+        :type rules: Optional[SpacingRules]
+        :return: Whether cached previews are valid.
+        :rtype: bool
+        """
+        return (
+            self.theater is theater
+            and self.version == theater.version
+            and self.allocator == allocator
+            and self.rules == rules
+        )
+
+    def preview(self, k: int) -> Optional[List[Seat]]:
+        """Return the automatic allocation for ``k`` seats.
+
+        :param k: Number of seats requested.
+        :type k: int
+        :return: Proposed seats (a new list) or ``None`` if not possible.
+        :rtype: Optional[list[Seat]]
+        """
+        if self.allocator == "greedy":
+            return self._greedy_prefix(k)
+        if k not in self._memo:
+            self._memo[k] = get_allocator(self.allocator)(self.theater, k, self.rules)
+        seats = self._memo[k]
+        return None if seats is None else list(seats)
+
+    def _greedy_prefix(self, k: int) -> Optional[List[Seat]]:
+        """Return the first ``k`` greedy seats, extending the prefix if needed.
+
+        The sequence is only read as far as the largest ``k`` asked for, so
+        the first preview after a commit costs what ``auto_allocate`` does.
+        """
+        if k <= 0:
+            return []
+        prefix = self._prefix
+        if k > len(prefix):
+            if self._seats is None:
+                self._seats = greedy_seats(self.theater, self.rules)
+            prefix.extend(islice(self._seats, k - len(prefix)))
+            if k > len(prefix):
+                return None
+        return prefix[:k]
+
+    def largest_group(self) -> int:
+        """Return (and cache) :func:`largest_group` of the theater.
+
+        :return: Most seats bookable side by side in one row.
+        :rtype: int
+        """
+        if self._largest is None:
+            self._largest = largest_group(self.theater, self.rules)
+        return self._largest
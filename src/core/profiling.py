@@ -0,0 +1,166 @@
+"""On-demand profiling of the next *N* dispatched commands.
+
+A :class:`Profiler` starts disarmed and costs one integer check per command.
+Once armed (from the CLI or ``GIC_PROFILE``), it wraps the next *N* commands in
+:mod:`cProfile` and/or :mod:`tracemalloc`, aggregating them into one session.
+When the last command finishes, it writes a text report with the hottest
+functions (by cumulative time) and the top allocation sites, plus the raw
+``.prof`` stats for external viewers.
+"""
+
+import cProfile
+import io
+import itertools
+import os
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+#: Numbers the reports of this process, so reports written in the same second
+#: get distinct names.
+_REPORT_NUMBERS = itertools.count(1)
+
+
+class Profiler:
+    """Capture CPU and/or memory profiles around dispatched commands.
+
+    :param out_dir: Directory receiving the report files.
+    :type out_dir: str
+    :param top: Number of functions and allocation sites listed in reports.
+    :type top: int
+    """
+
+    def __init__(self, out_dir: str = ".", top: int = 30) -> None:
+        self.out_dir = out_dir
+        self.top = top
+        self.remaining = 0
+        self.last_report: Optional[str] = None
+        self._cpu = False
+        self._memory = False
+        self._labels: List[str] = []
+        self._profile: Optional[cProfile.Profile] = None
+        self._started_tracemalloc = False
+        self._capturing = False
+        self._pending: Optional[Tuple[int, bool, bool]] = None
+
+    @property
+    def armed(self) -> bool:
+        """Whether upcoming commands will be profiled."""
+        return self.remaining > 0
+
+    def arm(self, commands: int, cpu: bool = True, memory: bool = False) -> None:
+        """Profile the next *commands* dispatched commands.
+
+        Re-arming while a session is open ends it: the commands captured so
+        far are reported, then a new session starts. When called from inside
+        a profiled command (e.g. the *Profile* menu option itself), the switch
+        happens once that command finishes, so it is counted and reported in
+        the session that profiled it.
+
+        :param commands: Number of commands to capture (``>= 1``).
+        :type commands: int
+        :param cpu: Collect :mod:`cProfile` statistics.
+        :type cpu: bool
+        :param memory: Collect :mod:`tracemalloc` allocation sites.
+        :type memory: bool
+        :raises ValueError: If *commands* is not positive or no mode is chosen.
+        """
+        if commands <= 0:
+            raise ValueError("Number of commands to profile must be positive.")
+        if not (cpu or memory):
+            raise ValueError("Choose at least one of cpu or memory profiling.")
+        if self._capturing:
+            self._pending = (commands, cpu, memory)
+            return
+        if self.remaining and self._labels:
+            self.last_report = self._dump()
+        self._stop_tracemalloc()
+        self.remaining = commands
+        self._cpu = cpu
+        self._memory = memory
+        self._labels = []
+        self._profile = cProfile.Profile() if cpu else None
+
+    @contextmanager
+    def capture(self, label: str) -> Iterator[None]:
+        """Profile the enclosed command if the profiler is armed.
+
+        :param label: Command label recorded in the report.
+        :type label: str
+        :return: Context manager.
+        :rtype: Iterator[None]
+        """
+        if not self.remaining:
+            yield
+            return
+
+        if self._memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self._labels.append(label)
+        if self._profile is not None:
+            self._profile.enable()
+        self._capturing = True
+        try:
+            yield
+        finally:
+            self._capturing = False
+            if self._profile is not None:
+                self._profile.disable()
+            self.remaining -= 1
+            if self.remaining == 0:
+                self.last_report = self._dump()
+            if self._pending is not None:
+                pending, self._pending = self._pending, None
+                self.arm(*pending)
+
+    def close(self) -> Optional[str]:
+        """Write a report for a partially captured session, if any.
+
+        :return: Report path, or ``None`` if nothing was captured.
+        :rtype: Optional[str]
+        """
+        if not self.remaining or not self._labels:
+            self._stop_tracemalloc()
+            return None
+        self.remaining = 0
+        self.last_report = self._dump()
+        return self.last_report
+
+    # ----- reporting -----
+
+    def _dump(self) -> str:
+        """Write the report files for the finished session and return its path."""
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        number = next(_REPORT_NUMBERS)
+        base = os.path.join(self.out_dir, f"gic-profile-{stamp}-{os.getpid()}-{number}")
+        out = io.StringIO()
+        out.write(f"Commands profiled: {', '.join(self._labels)}\n\n")
+
+        if self._profile is not None:
+            self._profile.dump_stats(base + ".prof")
+            stats = pstats.Stats(self._profile, stream=out)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top)
+            self._profile = None
+
+        if self._memory and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            out.write(f"Top {self.top} allocation sites (by size):\n")
+            for stat in snapshot.statistics("lineno")[: self.top]:
+                out.write(f"  {stat}\n")
+            current, peak = tracemalloc.get_traced_memory()
+            out.write(f"Traced memory: current={current} B, peak={peak} B\n")
+        self._stop_tracemalloc()
+
+        path = base + ".txt"
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(out.getvalue())
+        return path
+
+    def _stop_tracemalloc(self) -> None:
+        """Stop :mod:`tracemalloc` if this profiler started it."""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
@@ -1,12 +1,91 @@
-"""ASCII renderer for seat maps."""
+"""ASCII renderer for seat maps.
 
-from typing import Iterable, Optional
+This is the single ASCII implementation; :func:`src.core.render.render_seat_map`
+delegates here. The static parts of a map (banner, divider, row labels, footer,
+an all-empty row) depend only on the house dimensions and
+:class:`~src.models.layout.Layout`, so they are built once per layout and
+reused. Rows are rendered by mapping occupants to symbols in
+bulk (``map`` over the row with a lookup table) rather than testing each cell
+in a Python loop, and preview seats are matched by column index.
+"""
 
-from src.core.renderers.base import Renderer
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from src.core.renderers.base import (
+    RowRenderer,
+    Viewport,
+    grid_symbols,
+    preview_by_row,
+    row_symbols,
+    symbol_lookup,
+)
+from src.core.seat_utils import row_index_to_letter
 from src.models.entities import Seat, Theater
+from src.models.layout import Layout
+
+
+@dataclass(frozen=True, slots=True)
+class _Templates:
+    """Precomputed static pieces of a map for one layout."""
+
+    header: Tuple[str, str]
+    prefixes: Tuple[str, ...]
+    empty_rows: Tuple[str, ...]
+    footer: str
+    # Sellable seats per row (an empty row has exactly this many ``None``).
+    seats: Tuple[int, ...]
+    # Zero-based wheelchair positions per row, shown as ``w`` while free.
+    wheelchair: Tuple[Tuple[int, ...], ...]
+
+
+@lru_cache(maxsize=128)
+def _templates(rows: int, cols: int, layout: Optional[Layout] = None) -> _Templates:
+    """Build the static pieces of a ``rows × cols`` map.
+
+    :param rows: Number of rows.
+    :type rows: int
+    :param cols: Seats per row.
+    :type cols: int
+    :param layout: Auditorium shape, if not a full rectangle.
+    :type layout: Optional[Layout]
+    :return: Templates for the layout.
+    :rtype: _Templates
+    """
+    # Divider width matches row width; keep at least 18 chars for aesthetics.
+    divider_len = 2 * cols + 2
+    # Labels are padded to the widest one (``AA`` and up) so seats line up.
+    width = len(row_index_to_letter(rows - 1))
+    prefixes = tuple(row_index_to_letter(r).ljust(width) + "  " for r in range(rows))
+    if layout is None:
+        empty = " ".join("." * cols)
+        empty_rows = tuple(p + empty for p in prefixes)
+        seats = (cols,) * rows
+        wheelchair: Tuple[Tuple[int, ...], ...] = ((),) * rows
+    else:
+        kinds = {c: " " for c in layout.missing}
+        kinds.update({c: "x" for c in layout.blocked})
+        kinds.update({c: "w" for c in layout.wheelchair})
+        cells = [
+            [kinds.get((r, c), ".") for c in range(1, cols + 1)] for r in range(rows)
+        ]
+        empty_rows = tuple(p + " ".join(row) for p, row in zip(prefixes, cells))
+        seats = tuple(row.count(".") + row.count("w") for row in cells)
+        wheelchair = tuple(
+            tuple(i for i, kind in enumerate(row) if kind == "w") for row in cells
+        )
+    return _Templates(
+        header=("    S C R E E N", "-" * max(divider_len, 18)),
+        prefixes=prefixes,
+        empty_rows=empty_rows,
+        footer=" " * (width + 2) + " ".join(str(i) for i in range(1, cols + 1)),
+        seats=seats,
+        wheelchair=wheelchair,
+    )
 
 
-class AsciiRenderer(Renderer):
+class AsciiRenderer(RowRenderer):
     """Render the theater seat map as monospaced ASCII."""
 
     def seat_map(
@@ -25,6 +104,12 @@ class AsciiRenderer(Renderer):
             Highlight (seats for *current_booking_id* or *preview_seats*).
         ``#`` :
             Booked seat belonging to another booking.
+        ``w`` :
+            Free wheelchair space (layouts only).
+        ``x`` :
+            Blocked seat, never sold (layouts only).
+        blank :
+            No seat at this position (layouts only).
 
         :param theater: Theater descriptor.
         :type theater: Theater
@@ -35,36 +120,171 @@ class AsciiRenderer(Renderer):
         :return: Multi-line string suitable for console output.
         :rtype: str
         """
-        preview_codes = {s.row.upper() + f"{s.col:02d}" for s in (preview_seats or [])}
+        preview = preview_by_row(theater, preview_seats)
+        tpl = _templates(theater.rows, theater.cols, theater.layout)
+        lookup = symbol_lookup(current_booking_id, missing=" ")
+        # An occupancy store maps every seat in one vectorised pass.
+        mapped = None
+        if theater.occupancy is not None:
+            mapped = grid_symbols(theater, current_booking_id, missing=" ")
+        lines = list(tpl.header)
+        # Render rows from back to front (e.g., B then A for 2 rows).
+        for row_idx in range(theater.rows - 1, -1, -1):
+            lines.append(
+                self._row(
+                    tpl,
+                    theater.grid[row_idx],
+                    row_idx,
+                    lookup,
+                    preview.get(row_idx),
+                    mapped[row_idx] if mapped else None,
+                )
+            )
+        lines.append(tpl.footer)
+        return "\n".join(lines)
+
+    def viewport(
+        self,
+        theater: Theater,
+        window: Viewport,
+        current_booking_id: Optional[str] = None,
+        preview_seats: Optional[Iterable[Seat]] = None,
+    ) -> str:
+        """Render the seats inside *window* and summarise the hidden ones.
 
-        lines: list[str] = []
-        lines.append("    S C R E E N")
+        Only the window's cells are visited; free seats outside it are derived
+        from the theater's per-row free counts and running free total.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param window: Visible part of the map.
+        :type window: Viewport
+        :param current_booking_id: Booking ID whose seats should be highlighted.
+        :type current_booking_id: Optional[str]
+        :param preview_seats: Seats to highlight as a draft selection.
+        :type preview_seats: Optional[Iterable[Seat]]
+        :return: Multi-line string suitable for console output.
+        :rtype: str
+        """
+        tpl = _templates(theater.rows, theater.cols, theater.layout)
+        lookup = symbol_lookup(current_booking_id, missing=" ")
+        preview = preview_by_row(theater, preview_seats)
+        r0, r1 = window.row_start, window.row_stop
+        c0, c1 = window.col_start, window.col_stop
 
-        # Divider width matches row width; keep at least 18 chars for aesthetics.
-        divider_len = 2 * theater.cols + 2
-        lines.append("-" * max(divider_len, 18))
+        lines = [tpl.header[0], "-" * max(2 * (c1 - c0) + 2, 18)]
+        window_free = side_free = 0
+        for row_idx in range(r1 - 1, r0 - 1, -1):
+            visible = theater.grid[row_idx][c0:c1]
+            window_free += theater.row_free[row_idx]
+            side_free += theater.row_free[row_idx] - visible.count(None)
+            cells = list(row_symbols(visible, lookup))
+            for i in tpl.wheelchair[row_idx]:
+                if c0 <= i < c1 and cells[i - c0] == ".":
+                    cells[i - c0] = "w"
+            for col in preview.get(row_idx, ()):
+                if c0 < col <= c1:
+                    cells[col - 1 - c0] = "o"
+            lines.append(tpl.prefixes[row_idx] + " ".join(cells))
+        indent = " " * len(tpl.prefixes[-1])
+        lines.append(indent + " ".join(str(i) for i in range(c0 + 1, c1 + 1)))
 
-        # Render rows from back to front (e.g., B then A for 2 rows).
-        for row_idx in range(theater.rows - 1, -1, -1):
-            row_letter = chr(ord("A") + row_idx)
-            cells: list[str] = []
-            for col in range(1, theater.cols + 1):
-                seat_code = f"{row_letter}{col:02d}"
-                occupant = theater.grid[row_idx][col - 1]
-                if seat_code in preview_codes:
-                    char = "o"
-                elif occupant is None:
-                    char = "."
-                else:
-                    char = (
-                        "o"
-                        if (current_booking_id and occupant == current_booking_id)
-                        else "#"
-                    )
-                cells.append(char)
-            lines.append(f"{row_letter}  " + " ".join(cells))
-
-        # Footer numbers aligned under seats.
-        footer_nums = " ".join(str(i) for i in range(1, theater.cols + 1))
-        lines.append(f"   {footer_nums}")
+        first, last = row_index_to_letter(r0), row_index_to_letter(r1 - 1)
+        lines.append(
+            f"Showing rows {first}-{last}, seats {c0 + 1}-{c1} "
+            f"of {theater.rows} rows x {theater.cols} seats."
+        )
+        # Sum the shorter hidden side only; the running total gives the other.
+        if r0 <= theater.rows - r1:
+            front_free = sum(theater.row_free[:r0])
+            back_free = theater.free - window_free - front_free
+        else:
+            back_free = sum(theater.row_free[r1:])
+            front_free = theater.free - window_free - back_free
+        hidden: List[str] = []
+        if r1 < theater.rows:
+            back = f"{row_index_to_letter(r1)}-{row_index_to_letter(theater.rows - 1)}"
+            hidden.append(f"rows {back} ({back_free} free)")
+        if r0 > 0:
+            front = f"A-{row_index_to_letter(r0 - 1)}"
+            hidden.append(f"rows {front} ({front_free} free)")
+        if c1 - c0 < theater.cols:
+            hidden.append(f"other seats in rows {first}-{last} ({side_free} free)")
+        if hidden:
+            lines.append("Not shown: " + ", ".join(hidden) + ".")
         return "\n".join(lines)
+
+    def header_lines(self, theater: Theater) -> List[str]:
+        """Return the ``SCREEN`` banner and the divider.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :return: Header lines.
+        :rtype: list[str]
+        """
+        return list(_templates(theater.rows, theater.cols, theater.layout).header)
+
+    def render_row(
+        self,
+        theater: Theater,
+        row_idx: int,
+        current_booking_id: Optional[str] = None,
+        preview_cols: FrozenSet[int] = frozenset(),
+    ) -> str:
+        """Render one row, e.g. ``"A  . . o o . ."``.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param row_idx: Zero-based row index.
+        :type row_idx: int
+        :param current_booking_id: Booking ID whose seats should be highlighted.
+        :type current_booking_id: Optional[str]
+        :param preview_cols: One-based columns to highlight as a draft selection.
+        :type preview_cols: frozenset[int]
+        :return: Rendered row.
+        :rtype: str
+        """
+        return self._row(
+            _templates(theater.rows, theater.cols, theater.layout),
+            theater.grid[row_idx],
+            row_idx,
+            symbol_lookup(current_booking_id, missing=" "),
+            preview_cols,
+        )
+
+    @staticmethod
+    def _row(
+        tpl: _Templates,
+        row: List[Optional[str]],
+        row_idx: int,
+        lookup: Dict[Optional[str], str],
+        preview_cols: Optional[FrozenSet[int]],
+        symbols: Optional[str] = None,
+    ) -> str:
+        """Render one grid row against the layout templates.
+
+        *symbols*, if given, is the row already mapped by :func:`grid_symbols`.
+        """
+        if not preview_cols and row.count(None) == tpl.seats[row_idx]:
+            return tpl.empty_rows[row_idx]
+        accessible = tpl.wheelchair[row_idx]
+        mapped = symbols if symbols is not None else row_symbols(row, lookup)
+        if not preview_cols and not accessible:
+            return tpl.prefixes[row_idx] + " ".join(mapped)
+        cells = list(mapped)
+        for i in accessible:
+            if cells[i] == ".":
+                cells[i] = "w"
+        for col in preview_cols or ():
+            cells[col - 1] = "o"
+        return tpl.prefixes[row_idx] + " ".join(cells)
+
+    def footer_line(self, theater: Theater) -> str:
+        """Return the seat numbers aligned under the seats.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :return: Footer line.
+        :rtype: str
+        """
+        return _templates(theater.rows, theater.cols, theater.layout).footer
@@ -1,8 +1,59 @@
 """Renderer protocol."""
 
-from typing import Iterable, Optional, Protocol
+import re
+from dataclasses import dataclass
+from itertools import repeat
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    runtime_checkable,
+)
 
+from src.core.seat_utils import row_letter_to_index
 from src.models.entities import Seat, Theater
+from src.models.layout import BLOCKED, MISSING
+
+# Symbol for seats held by any booking other than the highlighted one; the
+# shared iterator supplies the lookup default for every cell of a row.
+_OTHER = repeat("#")
+_FREE_ONLY: Dict[Optional[str], str] = {None: ".", MISSING: "_", BLOCKED: "x"}
+# A maximal run of one repeated symbol.
+_RUN = re.compile(r"(.)\1*")
+
+#: Largest house printed in full; bigger ones are shown through a viewport.
+VIEWPORT_ROWS = 26
+VIEWPORT_COLS = 50
+
+
+@dataclass(frozen=True, slots=True)
+class Viewport:
+    """A rectangular window of the seat map.
+
+    Bounds are zero-based and half-open: rows ``row_start .. row_stop - 1`` and
+    grid columns ``col_start .. col_stop - 1`` (i.e. seats ``col_start + 1`` to
+    ``col_stop``).
+
+    :param row_start: First visible row index.
+    :type row_start: int
+    :param row_stop: One past the last visible row index.
+    :type row_stop: int
+    :param col_start: First visible column index.
+    :type col_start: int
+    :param col_stop: One past the last visible column index.
+    :type col_stop: int
+    """
+
+    row_start: int
+    row_stop: int
+    col_start: int
+    col_stop: int
 
 
 class Renderer(Protocol):
@@ -25,3 +76,307 @@ class Renderer(Protocol):
         :return: Rendered ASCII seat map (or other format in future renderers).
         :rtype: str
         """
+
+    def viewport(
+        self,
+        theater: Theater,
+        window: Viewport,
+        current_booking_id: Optional[str] = None,
+        preview_seats: Optional[Iterable[Seat]] = None,
+    ) -> str:
+        """Return only the seats inside *window*, plus a summary of the rest.
+
+        Implementations must keep the cost proportional to the window, not to
+        the whole house.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param window: Visible part of the map.
+        :type window: Viewport
+        :param current_booking_id: Booking ID to highlight, if any.
+        :type current_booking_id: Optional[str]
+        :param preview_seats: Provisional seats to highlight, if any.
+        :type preview_seats: Optional[Iterable[Seat]]
+        :return: Rendered window.
+        :rtype: str
+        """
+
+
+@runtime_checkable
+class RowRenderer(Renderer, Protocol):
+    """Renderer whose output is a header, one line per row, and a footer.
+
+    Exposing the pieces lets wrappers (caches, diffing) rebuild only the rows
+    that changed. ``seat_map`` must equal the header lines, the rows from back
+    to front, and the footer joined with newlines.
+    """
+
+    def header_lines(self, theater: Theater) -> List[str]:
+        """Return the lines printed above the rows.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :return: Header lines.
+        :rtype: list[str]
+        """
+
+    def render_row(
+        self,
+        theater: Theater,
+        row_idx: int,
+        current_booking_id: Optional[str] = None,
+        preview_cols: FrozenSet[int] = frozenset(),
+    ) -> str:
+        """Return the line for one row.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param row_idx: Zero-based row index.
+        :type row_idx: int
+        :param current_booking_id: Booking ID to highlight, if any.
+        :type current_booking_id: Optional[str]
+        :param preview_cols: One-based columns of this row to highlight.
+        :type preview_cols: frozenset[int]
+        :return: Rendered row.
+        :rtype: str
+        """
+
+    def footer_line(self, theater: Theater) -> str:
+        """Return the line printed below the rows.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :return: Footer line.
+        :rtype: str
+        """
+
+
+@runtime_checkable
+class StreamingRenderer(Renderer, Protocol):
+    """Renderer that can emit a map in chunks instead of one string.
+
+    ``seat_map`` must equal the concatenation of ``iter_seat_map``.
+    """
+
+    def iter_seat_map(
+        self,
+        theater: Theater,
+        current_booking_id: Optional[str] = None,
+        preview_seats: Optional[Iterable[Seat]] = None,
+    ) -> Iterator[str]:
+        """Yield the seat map piece by piece (at most one row per chunk).
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param current_booking_id: Booking ID to highlight, if any.
+        :type current_booking_id: Optional[str]
+        :param preview_seats: Provisional seats to highlight, if any.
+        :type preview_seats: Optional[Iterable[Seat]]
+        :return: Output chunks.
+        :rtype: Iterator[str]
+        """
+
+
+def preview_by_row(
+    theater: Theater, preview_seats: Optional[Iterable[Seat]]
+) -> Dict[int, FrozenSet[int]]:
+    """Group preview seats by zero-based row index.
+
+    Seats outside the theater are ignored, as they match no cell.
+
+    :param theater: Theater descriptor.
+    :type theater: Theater
+    :param preview_seats: Provisional seats, if any.
+    :type preview_seats: Optional[Iterable[Seat]]
+    :return: Mapping ``row_idx → one-based columns``.
+    :rtype: dict[int, frozenset[int]]
+    """
+    rows: Dict[int, set[int]] = {}
+    for s in preview_seats or ():
+        try:
+            row_idx = row_letter_to_index(s.row)
+        except ValueError:
+            continue
+        if 0 <= row_idx < theater.rows and 1 <= s.col <= theater.cols:
+            rows.setdefault(row_idx, set()).add(s.col)
+    return {r: frozenset(cols) for r, cols in rows.items()}
+
+
+def symbol_lookup(
+    current_booking_id: Optional[str], missing: str = "_"
+) -> Dict[Optional[str], str]:
+    """Return the occupant → symbol table for one render.
+
+    Free seats map to ``.``, *current_booking_id* to ``o``, blocked seats to
+    ``x`` and positions without a seat to *missing*; any other occupant falls
+    through to ``#`` (see :func:`row_symbols`).
+
+    :param current_booking_id: Booking ID to highlight, if any.
+    :type current_booking_id: Optional[str]
+    :param missing: Symbol for positions without a seat.
+    :type missing: str
+    :return: Lookup table.
+    :rtype: dict[Optional[str], str]
+    """
+    lookup = _FREE_ONLY if missing == "_" else {**_FREE_ONLY, MISSING: missing}
+    if current_booking_id:
+        return {**lookup, current_booking_id: "o"}
+    return lookup
+
+
+def row_symbols(
+    row: Sequence[Optional[str]], lookup: Dict[Optional[str], str]
+) -> Iterator[str]:
+    """Map a row of occupants to seat symbols in bulk.
+
+    :param row: Occupants of consecutive seats.
+    :type row: Sequence[Optional[str]]
+    :param lookup: Table from :func:`symbol_lookup`.
+    :type lookup: dict[Optional[str], str]
+    :return: One symbol per seat.
+    :rtype: Iterator[str]
+    """
+    return map(lookup.get, row, _OTHER)
+
+
+def grid_symbols(
+    theater: Theater, current_booking_id: Optional[str], missing: str = "_"
+) -> List[str]:
+    """Map the whole grid to symbol strings, one per row.
+
+    With an occupancy store attached to *theater* this is a single vectorised
+    lookup; otherwise each row goes through :func:`row_symbols`.
+
+    :param theater: Theater descriptor.
+    :type theater: Theater
+    :param current_booking_id: Booking ID to highlight, if any.
+    :type current_booking_id: Optional[str]
+    :param missing: Symbol for positions without a seat.
+    :type missing: str
+    :return: One string per row, one character per position.
+    :rtype: list[str]
+    """
+    if theater.occupancy is not None:
+        return theater.occupancy.symbol_rows(current_booking_id, f".{missing}x#o")
+    lookup = symbol_lookup(current_booking_id, missing)
+    return ["".join(row_symbols(row, lookup)) for row in theater.grid]
+
+
+def row_runs(
+    row: Sequence[Optional[str]],
+    lookup: Dict[Optional[str], str],
+    preview_cols: Optional[Iterable[int]] = None,
+    offset: int = 0,
+) -> List[Tuple[int, str]]:
+    """Return a row as ``(length, symbol)`` runs, e.g. ``[(3, "."), (4, "#")]``.
+
+    An all-free row is a single run without visiting its symbols; otherwise the
+    symbols are joined once and split into runs with a regular expression, so
+    the Python-level work is per run rather than per seat.
+
+    :param row: Occupants of consecutive seats.
+    :type row: Sequence[Optional[str]]
+    :param lookup: Table from :func:`symbol_lookup`.
+    :type lookup: dict[Optional[str], str]
+    :param preview_cols: One-based columns to highlight as ``o``.
+    :type preview_cols: Optional[Iterable[int]]
+    :param offset: Column index of ``row[0]`` in the full row (for windows).
+    :type offset: int
+    :return: Runs covering the whole row, left to right.
+    :rtype: list[tuple[int, str]]
+    """
+    if not row:
+        return []
+    if not preview_cols and row.count(None) == len(row):
+        return [(len(row), ".")]
+    cells = list(row_symbols(row, lookup))
+    for col in preview_cols or ():
+        if 0 < col - offset <= len(cells):
+            cells[col - 1 - offset] = "o"
+    return [(m.end() - m.start(), m.group(1)) for m in _RUN.finditer("".join(cells))]
+
+
+def _span(center: float, size: int, limit: int) -> Tuple[int, int]:
+    """Return a ``[start, stop)`` range of *size* centred on *center*.
+
+    The range is clamped to ``0..limit``.
+    """
+    size = min(size, limit)
+    start = int(center - size / 2 + 0.5)
+    start = max(0, min(start, limit - size))
+    return start, start + size
+
+
+def viewport_around(
+    theater: Theater,
+    focus: Optional[Iterable[Seat]] = None,
+    max_rows: int = VIEWPORT_ROWS,
+    max_cols: int = VIEWPORT_COLS,
+) -> Viewport:
+    """Return a window of at most ``max_rows × max_cols`` centred on *focus*.
+
+    Without focus seats the window shows the front rows, centred on the middle
+    of the house.
+
+    :param theater: Theater descriptor.
+    :type theater: Theater
+    :param focus: Seats the window should be centred on (preview or booking).
+    :type focus: Optional[Iterable[Seat]]
+    :param max_rows: Window height.
+    :type max_rows: int
+    :param max_cols: Window width.
+    :type max_cols: int
+    :return: Window clamped to the house.
+    :rtype: Viewport
+    """
+    points = [
+        (r, c - 1) for r, cols in preview_by_row(theater, focus).items() for c in cols
+    ]
+    if points:
+        rows = [p[0] for p in points]
+        cols = [p[1] for p in points]
+        row_center = (min(rows) + max(rows) + 1) / 2
+        col_center = (min(cols) + max(cols) + 1) / 2
+    else:
+        row_center = min(max_rows, theater.rows) / 2
+        col_center = theater.cols / 2
+    r0, r1 = _span(row_center, max_rows, theater.rows)
+    c0, c1 = _span(col_center, max_cols, theater.cols)
+    return Viewport(r0, r1, c0, c1)
+
+
+def render_map(
+    renderer: Renderer,
+    theater: Theater,
+    current_booking_id: Optional[str] = None,
+    preview_seats: Optional[Iterable[Seat]] = None,
+    focus: Optional[Iterable[Seat]] = None,
+    max_rows: int = VIEWPORT_ROWS,
+    max_cols: int = VIEWPORT_COLS,
+) -> str:
+    """Render the full map, or a viewport when the house exceeds the limits.
+
+    :param renderer: Renderer to use.
+    :type renderer: Renderer
+    :param theater: Theater descriptor.
+    :type theater: Theater
+    :param current_booking_id: Booking ID to highlight, if any.
+    :type current_booking_id: Optional[str]
+    :param preview_seats: Provisional seats to highlight, if any.
+    :type preview_seats: Optional[Iterable[Seat]]
+    :param focus: Seats to centre a viewport on (defaults to *preview_seats*).
+    :type focus: Optional[Iterable[Seat]]
+    :param max_rows: Largest number of rows printed in full.
+    :type max_rows: int
+    :param max_cols: Largest number of seats per row printed in full.
+    :type max_cols: int
+    :return: Rendered map or window.
+    :rtype: str
+    """
+    if theater.rows <= max_rows and theater.cols <= max_cols:
+        return renderer.seat_map(theater, current_booking_id, preview_seats)
+    preview_seats = list(preview_seats or ())
+    window = viewport_around(
+        theater, focus if focus is not None else preview_seats, max_rows, max_cols
+    )
+    return renderer.viewport(theater, window, current_booking_id, preview_seats)
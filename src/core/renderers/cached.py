@@ -0,0 +1,164 @@
+"""Caching front for seat map renderers."""
+
+from collections import OrderedDict
+from typing import Any, FrozenSet, Hashable, Iterable, Optional, Tuple
+
+from src.core.renderers.base import Renderer, RowRenderer, Viewport, preview_by_row
+from src.models.entities import Seat, Theater
+
+
+class _LRU:
+    """Minimal bounded LRU mapping.
+
+    :param maxsize: Maximum number of entries (``0`` disables caching).
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value for *key* (marking it recent) or ``None``."""
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store *value*, evicting the least recently used entry if full."""
+        if self.maxsize <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._data.clear()
+
+
+class CachingRenderer(Renderer):
+    """Memoise seat maps per screen, grid version and highlight.
+
+    Whole maps are cached under ``(screen, theater.version, current booking,
+    preview seats)``. When the wrapped renderer is a :class:`RowRenderer`,
+    individual rows are cached too, keyed by the row's own version, so after a
+    commit only the rows it touched are rebuilt.
+
+    Entries keep a reference to their theater, so a screen's ``id`` cannot be
+    recycled while it is cached. Version tracking relies on grid changes going
+    through :meth:`Theater.assign` (as :class:`BookingService` does).
+
+    :param inner: Renderer producing the actual output.
+    :type inner: Renderer
+    :param maxsize: Maximum cached maps.
+    :type maxsize: int
+    :param row_maxsize: Maximum cached rows (defaults to ``64 * maxsize``).
+    :type row_maxsize: Optional[int]
+    """
+
+    def __init__(
+        self, inner: Renderer, maxsize: int = 64, row_maxsize: Optional[int] = None
+    ) -> None:
+        self.inner = inner
+        self._maps = _LRU(maxsize)
+        self._rows = _LRU(64 * maxsize if row_maxsize is None else row_maxsize)
+        self.hits = 0
+        self.misses = 0
+
+    def seat_map(
+        self,
+        theater: Theater,
+        current_booking_id: Optional[str] = None,
+        preview_seats: Optional[Iterable[Seat]] = None,
+    ) -> str:
+        """Return the (possibly cached) seat map.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param current_booking_id: Booking ID to highlight, if any.
+        :type current_booking_id: Optional[str]
+        :param preview_seats: Provisional seats to highlight, if any.
+        :type preview_seats: Optional[Iterable[Seat]]
+        :return: Rendered seat map.
+        :rtype: str
+        """
+        preview_seats = list(preview_seats or ())
+        preview = preview_by_row(theater, preview_seats)
+        preview_key = frozenset(preview.items())
+        key = (id(theater), theater.version, current_booking_id, preview_key)
+        entry: Optional[Tuple[Theater, str]] = self._maps.get(key)
+        if entry is not None and entry[0] is theater:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        if isinstance(self.inner, RowRenderer):
+            text = self._assemble(theater, self.inner, current_booking_id, preview)
+        else:
+            text = self.inner.seat_map(theater, current_booking_id, preview_seats)
+        self._maps.put(key, (theater, text))
+        return text
+
+    def viewport(
+        self,
+        theater: Theater,
+        window: Viewport,
+        current_booking_id: Optional[str] = None,
+        preview_seats: Optional[Iterable[Seat]] = None,
+    ) -> str:
+        """Render a window through the wrapped renderer (not cached).
+
+        Windows are already cheap to build and vary with every preview.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param window: Visible part of the map.
+        :type window: Viewport
+        :param current_booking_id: Booking ID to highlight, if any.
+        :type current_booking_id: Optional[str]
+        :param preview_seats: Provisional seats to highlight, if any.
+        :type preview_seats: Optional[Iterable[Seat]]
+        :return: Rendered window.
+        :rtype: str
+        """
+        return self.inner.viewport(theater, window, current_booking_id, preview_seats)
+
+    def _assemble(
+        self,
+        theater: Theater,
+        inner: RowRenderer,
+        current_booking_id: Optional[str],
+        preview: dict[int, FrozenSet[int]],
+    ) -> str:
+        """Build a map from cached rows, rendering only stale ones."""
+        lines = inner.header_lines(theater)
+        for row_idx in range(theater.rows - 1, -1, -1):
+            cols = preview.get(row_idx, frozenset())
+            key = (
+                id(theater),
+                row_idx,
+                theater.row_versions[row_idx],
+                current_booking_id,
+                cols,
+            )
+            entry = self._rows.get(key)
+            if entry is None or entry[0] is not theater:
+                entry = (
+                    theater,
+                    inner.render_row(theater, row_idx, current_booking_id, cols),
+                )
+                self._rows.put(key, entry)
+            lines.append(entry[1])
+        lines.append(inner.footer_line(theater))
+        return "\n".join(lines)
+
+    def clear(self) -> None:
+        """Drop every cached map and row."""
+        self._maps.clear()
+        self._rows.clear()
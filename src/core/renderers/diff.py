@@ -0,0 +1,173 @@
+"""Incremental output for successive seat map frames.
+
+Reseat previews differ from the previous frame in a handful of rows, so on
+slow links (serial kiosks, remote terminals) re-sending the whole map is the
+dominant cost. :class:`DiffRenderer` turns a new frame into either
+
+* the changed lines only (plain text, each row keeps its row label), or
+* ANSI cursor-addressed rewrites of those lines in place, when the output is
+  an interactive terminal,
+
+and falls back to the full frame when the two frames are not comparable.
+
+:func:`screen_patch` is the full-screen variant used by the live dashboard: it
+addresses the cursor absolutely and rewrites only the changed characters.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class FrameUpdate:
+    """Text to emit for a new frame.
+
+    :param text: Output to write (full frame, changed lines, or ANSI codes).
+    :type text: str
+    :param full: Whether *text* is the whole frame, printed at the cursor.
+    :type full: bool
+    """
+
+    text: str
+    full: bool
+
+
+class DiffRenderer:
+    """Compute the cheapest output that brings a displayed frame up to date.
+
+    :param ansi: Rewrite changed lines in place with ANSI escape codes.
+    :type ansi: bool
+    :param max_changed_ratio: Above this fraction of changed lines, the full
+        frame is sent instead.
+    :type max_changed_ratio: float
+    """
+
+    def __init__(self, ansi: bool = False, max_changed_ratio: float = 0.5) -> None:
+        self.ansi = ansi
+        self.max_changed_ratio = max_changed_ratio
+
+    def changed_lines(
+        self, previous: str, current: str
+    ) -> Optional[List[Tuple[int, str]]]:
+        """Return ``(line index, new text)`` for every line that differs.
+
+        :param previous: Frame currently displayed.
+        :type previous: str
+        :param current: New frame.
+        :type current: str
+        :return: Changed lines, or ``None`` if the frames are not comparable
+            (different shape, different header, or too many changes).
+        :rtype: Optional[list[tuple[int, str]]]
+        """
+        old, new = previous.split("\n"), current.split("\n")
+        if len(old) != len(new) or old[:2] != new[:2]:
+            return None
+        changed = [
+            (i, line) for i, (was, line) in enumerate(zip(old, new)) if was != line
+        ]
+        if len(changed) > len(new) * self.max_changed_ratio:
+            return None
+        return changed
+
+    def update(
+        self,
+        previous: Optional[str],
+        current: str,
+        lines_below: int = 0,
+        screen_height: Optional[int] = None,
+    ) -> FrameUpdate:
+        """Return the output that replaces *previous* with *current*.
+
+        In ANSI mode the cursor is assumed to be *lines_below* lines under the
+        end of the displayed frame; the emitted codes move up to each changed
+        line, rewrite it, and return so that the caller's trailing newline
+        lands where the next output belongs. If the frame may have scrolled
+        off the screen (``frame + lines_below >= screen_height``), the full
+        frame is sent instead.
+
+        :param previous: Frame currently displayed, or ``None`` if none.
+        :type previous: Optional[str]
+        :param current: New frame.
+        :type current: str
+        :param lines_below: Lines written since the displayed frame (ANSI mode).
+        :type lines_below: int
+        :param screen_height: Terminal height in lines, if known.
+        :type screen_height: Optional[int]
+        :return: Output to write and whether it is a full frame.
+        :rtype: FrameUpdate
+        """
+        if previous is None:
+            return FrameUpdate(current, True)
+        changed = self.changed_lines(previous, current)
+        if changed is None:
+            return FrameUpdate(current, True)
+
+        if not self.ansi:
+            text = "\n".join(line for _, line in changed)
+            return FrameUpdate(text or "Seat map unchanged.", False)
+
+        height = current.count("\n") + 1
+        if screen_height is not None and height + lines_below >= screen_height:
+            return FrameUpdate(current, True)
+        # Cursor starts at column 1 of line ``height + lines_below`` (0 = first
+        # frame line) and must end one line above it: the caller's newline
+        # then moves it back down.
+        bottom = height + lines_below
+        parts: List[str] = []
+        cursor = bottom
+        for idx, line in changed:
+            parts.append(_move(idx - cursor) + "\x1b[2K" + line)
+            cursor = idx
+        parts.append(_move(bottom - 1 - cursor))
+        return FrameUpdate("".join(parts), False)
+
+
+def _move(delta: int) -> str:
+    """Return the code moving the cursor to column 1, *delta* lines down.
+
+    A negative *delta* moves the cursor up.
+    """
+    if delta > 0:
+        return f"\x1b[{delta}E"
+    if delta < 0:
+        return f"\x1b[{-delta}F"
+    return "\r"
+
+
+def screen_patch(previous: Optional[str], current: str) -> str:
+    """Return ANSI codes turning a full-screen *previous* frame into *current*.
+
+    The frame is assumed to start at the top-left corner of the terminal.
+    Within each changed line only the span between the first and last
+    differing character is rewritten; a frame of a different height is
+    redrawn after clearing the screen. The cursor is left below the frame.
+
+    :param previous: Frame currently on screen, or ``None`` if none.
+    :type previous: Optional[str]
+    :param current: New frame.
+    :type current: str
+    :return: Escape sequences and text to write (empty if nothing changed).
+    :rtype: str
+    """
+    new = current.split("\n")
+    if previous is None or previous.count("\n") + 1 != len(new):
+        return "\x1b[H\x1b[2J" + current + "\n"
+    parts: List[str] = []
+    for row, (was, line) in enumerate(zip(previous.split("\n"), new), start=1):
+        if was == line:
+            continue
+        start = 0
+        limit = min(len(was), len(line))
+        while start < limit and was[start] == line[start]:
+            start += 1
+        if len(was) == len(line):
+            stop = len(line)
+            while stop > start and was[stop - 1] == line[stop - 1]:
+                stop -= 1
+            parts.append(f"\x1b[{row};{start + 1}H" + line[start:stop])
+        else:
+            # Length changed: rewrite the tail and clear what is left of it.
+            parts.append(f"\x1b[{row};{start + 1}H" + line[start:] + "\x1b[K")
+    if parts:
+        parts.append(f"\x1b[{len(new) + 1};1H")
+    return "".join(parts)
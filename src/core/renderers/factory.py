@@ -0,0 +1,32 @@
+"""Lookup of seat map renderers by name."""
+
+from typing import Callable, Dict
+
+from src.core.renderers.ascii_renderer import AsciiRenderer
+from src.core.renderers.base import Renderer
+from src.core.renderers.json_renderer import JsonRenderer
+from src.core.renderers.rle_renderer import RleRenderer
+
+#: Output formats selectable at startup: name -> renderer factory.
+RENDERERS: Dict[str, Callable[[], Renderer]] = {
+    "ascii": AsciiRenderer,
+    "json": JsonRenderer,
+    "rle": RleRenderer,
+}
+
+
+def make_renderer(name: str) -> Renderer:
+    """Return a new renderer for the output format *name*.
+
+    :param name: Key of :data:`RENDERERS` (case-insensitive).
+    :type name: str
+    :return: Renderer instance.
+    :rtype: Renderer
+    :raises ValueError: If *name* is not a known format.
+    """
+    factory = RENDERERS.get(name.strip().lower())
+    if factory is None:
+        raise ValueError(
+            f"Unknown renderer '{name}'. Choose one of: {', '.join(RENDERERS)}."
+        )
+    return factory()
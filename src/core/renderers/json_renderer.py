@@ -0,0 +1,134 @@
+"""JSON renderer for seat maps.
+
+Emits one JSON object per map::
+
+    {"screen": "Inception", "rows": 8, "cols": 10,
+     "map": {"A": [[3, "."], [4, "o"], [3, "."]], "B": [[2, "#"], [8, "."]]}}
+
+``map`` holds the rows front to back, each as ``[count, symbol]`` runs using
+the ASCII legend (``.`` free, ``o`` highlighted, ``#`` taken), so the payload
+grows with the number of occupancy runs rather than the number of seats. A
+viewport adds ``"window": {"rows": ["C", "F"], "seats": [11, 30]}`` and lists
+only the visible seats. Output is compact (no whitespace) and streamed one row
+at a time by :meth:`JsonRenderer.iter_seat_map`.
+"""
+
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.core.renderers.base import (
+    StreamingRenderer,
+    Viewport,
+    preview_by_row,
+    row_runs,
+    symbol_lookup,
+)
+from src.core.seat_utils import row_index_to_letter
+from src.models.entities import Seat, Theater
+
+_COMPACT = (",", ":")
+
+
+def _dumps(value: Any) -> str:
+    """Serialise *value* as compact JSON."""
+    return json.dumps(value, separators=_COMPACT)
+
+
+def _row_entry(label: str, runs: List[Tuple[int, str]]) -> str:
+    """Return ``"<label>":[[n,"s"],...]`` for one row."""
+    return f'"{label}":[' + ",".join(f'[{n},"{sym}"]' for n, sym in runs) + "]"
+
+
+class JsonRenderer(StreamingRenderer):
+    """Render the seat map as a JSON document."""
+
+    def iter_seat_map(
+        self,
+        theater: Theater,
+        current_booking_id: Optional[str] = None,
+        preview_seats: Optional[Iterable[Seat]] = None,
+    ) -> Iterator[str]:
+        """Yield the document in chunks: the header, one chunk per row, the
+        closing braces.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param current_booking_id: Booking ID whose seats should be highlighted.
+        :type current_booking_id: Optional[str]
+        :param preview_seats: Seats to highlight as a draft selection.
+        :type preview_seats: Optional[Iterable[Seat]]
+        :return: Output chunks.
+        :rtype: Iterator[str]
+        """
+        preview = preview_by_row(theater, preview_seats)
+        lookup = symbol_lookup(current_booking_id)
+        head = {"screen": theater.title, "rows": theater.rows, "cols": theater.cols}
+        yield _dumps(head)[:-1] + ',"map":{'
+        for row_idx, row in enumerate(theater.grid):
+            runs = row_runs(row, lookup, preview.get(row_idx))
+            sep = "," if row_idx else ""
+            yield sep + _row_entry(row_index_to_letter(row_idx), runs)
+        yield "}}"
+
+    def seat_map(
+        self,
+        theater: Theater,
+        current_booking_id: Optional[str] = None,
+        preview_seats: Optional[Iterable[Seat]] = None,
+    ) -> str:
+        """Render the whole map as a JSON string.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param current_booking_id: Booking ID whose seats should be highlighted.
+        :type current_booking_id: Optional[str]
+        :param preview_seats: Seats to highlight as a draft selection.
+        :type preview_seats: Optional[Iterable[Seat]]
+        :return: JSON document.
+        :rtype: str
+        """
+        return "".join(self.iter_seat_map(theater, current_booking_id, preview_seats))
+
+    def viewport(
+        self,
+        theater: Theater,
+        window: Viewport,
+        current_booking_id: Optional[str] = None,
+        preview_seats: Optional[Iterable[Seat]] = None,
+    ) -> str:
+        """Render only the seats inside *window* as a JSON string.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param window: Visible part of the map.
+        :type window: Viewport
+        :param current_booking_id: Booking ID whose seats should be highlighted.
+        :type current_booking_id: Optional[str]
+        :param preview_seats: Seats to highlight as a draft selection.
+        :type preview_seats: Optional[Iterable[Seat]]
+        :return: JSON document.
+        :rtype: str
+        """
+        preview = preview_by_row(theater, preview_seats)
+        lookup = symbol_lookup(current_booking_id)
+        r0, r1 = window.row_start, window.row_stop
+        c0, c1 = window.col_start, window.col_stop
+        head: Dict[str, Any] = {
+            "screen": theater.title,
+            "rows": theater.rows,
+            "cols": theater.cols,
+            "window": {
+                "rows": [row_index_to_letter(r0), row_index_to_letter(r1 - 1)],
+                "seats": [c0 + 1, c1],
+            },
+        }
+        entries = [
+            _row_entry(
+                row_index_to_letter(row_idx),
+                row_runs(
+                    theater.grid[row_idx][c0:c1], lookup, preview.get(row_idx), c0
+                ),
+            )
+            for row_idx in range(r0, r1)
+        ]
+        return _dumps(head)[:-1] + ',"map":{' + ",".join(entries) + "}}"
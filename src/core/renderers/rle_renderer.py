@@ -0,0 +1,120 @@
+"""Run-length encoded renderer for seat maps.
+
+A compact, line-oriented format for scripts and slow links::
+
+    screen: Inception
+    size: 8x10
+    A: 3. 4o 3.
+    B: 2# 8.
+
+Rows are listed front to back. Each one is a sequence of ``<count><symbol>``
+runs using the ASCII legend (``.`` free, ``o`` highlighted, ``#`` taken), so
+the output grows with the number of occupancy runs rather than the number of
+seats. A viewport adds a ``window:`` line and encodes only the visible seats.
+"""
+
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.core.renderers.base import (
+    StreamingRenderer,
+    Viewport,
+    preview_by_row,
+    row_runs,
+    symbol_lookup,
+)
+from src.core.seat_utils import row_index_to_letter
+from src.models.entities import Seat, Theater
+
+
+def _encode(label: str, runs: List[Tuple[int, str]]) -> str:
+    """Return ``"<label>: <count><symbol> ..."`` for one row."""
+    return f"{label}: " + " ".join(f"{n}{sym}" for n, sym in runs)
+
+
+class RleRenderer(StreamingRenderer):
+    """Render the seat map as run-length encoded rows."""
+
+    def iter_seat_map(
+        self,
+        theater: Theater,
+        current_booking_id: Optional[str] = None,
+        preview_seats: Optional[Iterable[Seat]] = None,
+    ) -> Iterator[str]:
+        """Yield the header lines, then one line per row (each ending in ``\\n``
+        except the last).
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param current_booking_id: Booking ID whose seats should be highlighted.
+        :type current_booking_id: Optional[str]
+        :param preview_seats: Seats to highlight as a draft selection.
+        :type preview_seats: Optional[Iterable[Seat]]
+        :return: Output chunks.
+        :rtype: Iterator[str]
+        """
+        preview = preview_by_row(theater, preview_seats)
+        lookup = symbol_lookup(current_booking_id)
+        yield f"screen: {theater.title}\nsize: {theater.rows}x{theater.cols}"
+        for row_idx, row in enumerate(theater.grid):
+            runs = row_runs(row, lookup, preview.get(row_idx))
+            yield "\n" + _encode(row_index_to_letter(row_idx), runs)
+
+    def seat_map(
+        self,
+        theater: Theater,
+        current_booking_id: Optional[str] = None,
+        preview_seats: Optional[Iterable[Seat]] = None,
+    ) -> str:
+        """Render the whole map as run-length encoded text.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param current_booking_id: Booking ID whose seats should be highlighted.
+        :type current_booking_id: Optional[str]
+        :param preview_seats: Seats to highlight as a draft selection.
+        :type preview_seats: Optional[Iterable[Seat]]
+        :return: Encoded seat map.
+        :rtype: str
+        """
+        return "".join(self.iter_seat_map(theater, current_booking_id, preview_seats))
+
+    def viewport(
+        self,
+        theater: Theater,
+        window: Viewport,
+        current_booking_id: Optional[str] = None,
+        preview_seats: Optional[Iterable[Seat]] = None,
+    ) -> str:
+        """Encode only the seats inside *window*.
+
+        The ``window:`` line gives the visible rows and seat numbers, e.g.
+        ``window: C-F 11-30``; the runs of each row start at the first visible
+        seat.
+
+        :param theater: Theater descriptor.
+        :type theater: Theater
+        :param window: Visible part of the map.
+        :type window: Viewport
+        :param current_booking_id: Booking ID whose seats should be highlighted.
+        :type current_booking_id: Optional[str]
+        :param preview_seats: Seats to highlight as a draft selection.
+        :type preview_seats: Optional[Iterable[Seat]]
+        :return: Encoded window.
+        :rtype: str
+        """
+        preview = preview_by_row(theater, preview_seats)
+        lookup = symbol_lookup(current_booking_id)
+        r0, r1 = window.row_start, window.row_stop
+        c0, c1 = window.col_start, window.col_stop
+        lines = [
+            f"screen: {theater.title}",
+            f"size: {theater.rows}x{theater.cols}",
+            f"window: {row_index_to_letter(r0)}-{row_index_to_letter(r1 - 1)} "
+            f"{c0 + 1}-{c1}",
+        ]
+        for row_idx in range(r0, r1):
+            runs = row_runs(
+                theater.grid[row_idx][c0:c1], lookup, preview.get(row_idx), c0
+            )
+            lines.append(_encode(row_index_to_letter(row_idx), runs))
+        return "\n".join(lines)
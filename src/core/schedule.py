@@ -0,0 +1,117 @@
+"""Building screening schedules from files or the startup prompt.
+
+Schedule files are JSON::
+
+    {"screens": [{"name": "1", "rows": 8, "cols": 10},
+                 {"name": "2", "rows": 12, "cols": 20, "layout": "hall2.txt",
+                  "allocator": "best-fit"}],
+     "screenings": [{"screen": "1", "showtime": "Mon 19:30", "title": "Inception"},
+                    {"screen": "2", "showtime": "Mon 20:00", "title": "Dune"}]}
+
+Layout paths are relative to the schedule file. Each layout file is loaded
+once and shared by every screening on that screen. ``allocator`` picks the
+screen's automatic allocation strategy (default: the configured one).
+"""
+
+import json
+import os
+from typing import Any, Dict, Optional
+
+from src.core.layout import load_layout
+from src.core.strategies import get_allocator
+from src.core.validators import parse_init_line
+from src.models.layout import Layout
+from src.models.schedule import Schedule
+
+#: Screen name and showtime used when the app is started from the prompt.
+DEFAULT_SCREEN = "1"
+DEFAULT_SHOWTIME = "now"
+
+
+def single_screening(
+    title: str,
+    rows: int,
+    cols: int,
+    layout: Optional[Layout] = None,
+    allocator: str = "greedy",
+) -> Schedule:
+    """Return a schedule with one screen showing *title*.
+
+    :param title: Film title.
+    :type title: str
+    :param rows: Number of rows.
+    :type rows: int
+    :param cols: Seats per row.
+    :type cols: int
+    :param layout: Shape, if not a full rectangle.
+    :type layout: Optional[Layout]
+    :param allocator: Automatic allocation strategy name.
+    :type allocator: str
+    :return: Schedule with a single screening.
+    :rtype: Schedule
+    :raises ValueError: If the layout does not match ``rows × cols`` or the
+        allocator is unknown.
+    """
+    get_allocator(allocator)
+    schedule = Schedule()
+    schedule.add_auditorium(DEFAULT_SCREEN, rows, cols, layout, allocator)
+    schedule.add_screening(DEFAULT_SCREEN, DEFAULT_SHOWTIME, title)
+    return schedule
+
+
+def parse_schedule(
+    data: Dict[str, Any], base_dir: str = ".", allocator: str = "greedy"
+) -> Schedule:
+    """Build a schedule from decoded JSON.
+
+    :param data: Mapping with ``screens`` and ``screenings`` lists.
+    :type data: dict[str, Any]
+    :param base_dir: Directory that layout paths are relative to.
+    :type base_dir: str
+    :param allocator: Strategy of screens that do not name one.
+    :type allocator: str
+    :return: Schedule (no screening materialised).
+    :rtype: Schedule
+    :raises ValueError: On missing keys or invalid values.
+    """
+    schedule = Schedule()
+    try:
+        for screen in data["screens"]:
+            name = str(screen["name"])
+            # Reuse the prompt's validation of title and size.
+            _, rows, cols = parse_init_line(f"{name} {screen['rows']} {screen['cols']}")
+            layout = None
+            if screen.get("layout"):
+                layout = load_layout(os.path.join(base_dir, screen["layout"]))
+            strategy = str(screen.get("allocator", allocator)).strip().lower()
+            get_allocator(strategy)
+            schedule.add_auditorium(name, rows, cols, layout, strategy)
+        for item in data["screenings"]:
+            schedule.add_screening(
+                str(item["screen"]), str(item["showtime"]), str(item["title"])
+            )
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"Invalid schedule: missing or malformed {exc}.") from exc
+    if not len(schedule):
+        raise ValueError("Schedule has no screenings.")
+    return schedule
+
+
+def load_schedule(path: str, allocator: str = "greedy") -> Schedule:
+    """Load a JSON schedule file.
+
+    :param path: File path.
+    :type path: str
+    :param allocator: Strategy of screens that do not name one.
+    :type allocator: str
+    :return: Schedule (no screening materialised).
+    :rtype: Schedule
+    :raises ValueError: If the file is malformed.
+    :raises OSError: If a file cannot be read.
+    """
+    with open(path, encoding="utf-8") as fh:
+        try:
+            data = json.load(fh)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid schedule JSON: {exc}.") from exc
+    return parse_schedule(data, os.path.dirname(os.path.abspath(path)), allocator)
@@ -0,0 +1,249 @@
+"""Find seats for a film across all of its screenings.
+
+:class:`SeatSearchIndex` keeps, for every screening in a
+:class:`~src.models.schedule.Schedule`, the longest run of adjacent free seats
+in each row plus the free seat count. Booking events update only the rows
+they touch, and each title keeps its screenings sorted by free seats, so a
+query walks a short sorted list instead of allocating on every screen.
+Screenings that were never selected are answered from their auditorium's
+shape without creating their seat grid.
+"""
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from src.core.events import BookingEvent, EventBus, Subscription
+from src.core.seat_utils import row_letter_to_index, seat_pool
+from src.core.spacing import SpacingMask, SpacingRules, make_mask
+from src.models.entities import Seat
+from src.models.schedule import Auditorium, Schedule, Screening, ScreeningKey
+
+#: Sort key of a screening within its title: ``(-free, schedule order, key)``.
+_Rank = Tuple[int, int, ScreeningKey]
+
+
+@dataclass(frozen=True, slots=True)
+class SearchResult:
+    """Best screening for a party and the seats it would get.
+
+    :param screening: Chosen screening (not necessarily materialised).
+    :type screening: Screening
+    :param seats: Adjacent seats in one row, left to right.
+    :type seats: list[Seat]
+    """
+
+    screening: Screening
+    seats: List[Seat]
+
+
+def longest_run(free: Sequence[bool]) -> int:
+    """Return the length of the longest stretch of ``True`` values.
+
+    :param free: Per-seat availability of one row.
+    :type free: Sequence[bool]
+    :return: Longest run length (``0`` if none).
+    :rtype: int
+    """
+    best = run = 0
+    for f in free:
+        run = run + 1 if f else 0
+        if run > best:
+            best = run
+    return best
+
+
+@lru_cache(maxsize=32)
+def _empty_rows(aud: Auditorium) -> Tuple[Tuple[bool, ...], ...]:
+    """Return per-row availability of an empty *aud* (shared by its screenings)."""
+    taken: Set[Tuple[int, int]] = set()
+    if aud.layout is not None:
+        taken = aud.layout.missing | aud.layout.blocked
+    return tuple(
+        tuple((r, c) not in taken for c in range(1, aud.cols + 1))
+        for r in range(aud.rows)
+    )
+
+
+@lru_cache(maxsize=32)
+def _empty_runs(aud: Auditorium) -> Tuple[int, ...]:
+    """Return the longest free run of each row of an empty *aud*."""
+    return tuple(map(longest_run, _empty_rows(aud)))
+
+
+@lru_cache(maxsize=1024)
+def _row_span(aud: Auditorium, r: int) -> int:
+    """Return the sum of the first and last existing column of row *r*."""
+    missing = aud.layout.missing if aud.layout is not None else frozenset()
+    cols = [c for c in range(1, aud.cols + 1) if (r, c) not in missing]
+    return cols[0] + cols[-1] if cols else 0
+
+
+class SeatSearchIndex:
+    """Index of free seats per screening, kept current by booking events.
+
+    Screenings added to the schedule after the index was built are not
+    indexed.
+
+    :param schedule: Screenings to index.
+    :type schedule: Schedule
+    :param events: Bus to follow; ``None`` leaves updates to :meth:`refresh`.
+    :type events: Optional[EventBus]
+    :param rules: Distancing rules the proposed seats must satisfy. The index
+        itself ignores them, so it only narrows down where to look.
+    :type rules: Optional[SpacingRules]
+    """
+
+    def __init__(
+        self,
+        schedule: Schedule,
+        events: Optional[EventBus] = None,
+        rules: Optional[SpacingRules] = None,
+    ) -> None:
+        self._schedule = schedule
+        self._rules = rules
+        self._order: Dict[ScreeningKey, int] = {}
+        self._runs: Dict[ScreeningKey, List[int]] = {}
+        self._rank: Dict[ScreeningKey, _Rank] = {}
+        self._by_title: Dict[str, List[_Rank]] = {}
+        for i, screening in enumerate(schedule):
+            self._order[screening.key] = i
+            self._index(screening)
+        self._events = events
+        self._sub: Optional[Subscription] = None
+        if events is not None:
+            self._sub = events.subscribe(self._on_events)
+
+    def close(self) -> None:
+        """Stop following booking events."""
+        if self._events is not None and self._sub is not None:
+            self._events.unsubscribe(self._sub)
+            self._sub = None
+
+    def refresh(self, key: ScreeningKey, rows: Optional[Sequence[int]] = None) -> None:
+        """Re-read *rows* (default: all) of a screening from its grid.
+
+        :param key: ``(screen, showtime)``.
+        :type key: ScreeningKey
+        :param rows: Zero-based row indexes that changed.
+        :type rows: Optional[Sequence[int]]
+        """
+        screening = self._schedule.screenings.get(key)
+        if screening is None or key not in self._order:
+            return
+        if rows is None:
+            self._index(screening)
+            return
+        runs = self._runs[key]
+        for r in rows:
+            runs[r] = longest_run(self._free_row(screening, r))
+        self._rerank(screening)
+
+    def longest(self, key: ScreeningKey) -> int:
+        """Return the largest party a screening can seat together.
+
+        :param key: ``(screen, showtime)``.
+        :type key: ScreeningKey
+        :return: Longest run of adjacent free seats.
+        :rtype: int
+        """
+        return max(self._runs[key], default=0)
+
+    def find(self, title: str, k: int) -> Optional[SearchResult]:
+        """Return the screening of *title* best able to seat *k* together.
+
+        Among screenings with a run of at least *k* adjacent free seats, the
+        one with the most free seats wins (earlier in the schedule on ties).
+        Seats come from the first row with room, in the row order automatic
+        allocation uses, as close to that row's centre as the free run allows.
+        With distancing rules, windows containing a forbidden seat are skipped.
+
+        :param title: Film title (case-insensitive).
+        :type title: str
+        :param k: Party size.
+        :type k: int
+        :return: Best match, or ``None`` if no screening has room.
+        :rtype: Optional[SearchResult]
+        """
+        if k <= 0:
+            return None
+        for _, _, key in self._by_title.get(title.casefold(), ()):
+            runs = self._runs[key]
+            if max(runs, default=0) < k:
+                continue
+            screening = self._schedule.screenings[key]
+            mask = None
+            if screening.theater is not None:
+                mask = make_mask(screening.theater, self._rules)
+            for row, n in enumerate(runs):
+                if n >= k:
+                    seats = self._place(screening, row, k, mask)
+                    if seats is not None:
+                        return SearchResult(screening, seats)
+        return None
+
+    # ----- internals -----
+
+    def _on_events(self, events: Sequence[BookingEvent]) -> None:
+        """Refresh the rows touched by each event of a scheduled screening."""
+        touched: Dict[ScreeningKey, Set[int]] = {}
+        for event in events:
+            if event.screening is not None:
+                rows = touched.setdefault(event.screening, set())
+                rows.update(row_letter_to_index(rng.row) for rng in event.ranges)
+        for key, rows in touched.items():
+            self.refresh(key, sorted(rows))
+
+    @staticmethod
+    def _free_row(screening: Screening, r: int) -> Sequence[bool]:
+        """Return per-seat availability of row *r* without materialising."""
+        if screening.theater is None:
+            return _empty_rows(screening.auditorium)[r]
+        return [cell is None for cell in screening.theater.grid[r]]
+
+    def _index(self, screening: Screening) -> None:
+        """Compute all row runs of *screening* and (re)rank it."""
+        if screening.theater is None:
+            runs = list(_empty_runs(screening.auditorium))
+        else:
+            runs = [
+                longest_run(self._free_row(screening, r))
+                for r in range(len(screening.theater.grid))
+            ]
+        self._runs[screening.key] = runs
+        self._rerank(screening)
+
+    def _rerank(self, screening: Screening) -> None:
+        """Move *screening* to its place in its title's sorted list."""
+        key = screening.key
+        ranks = self._by_title.setdefault(screening.title.casefold(), [])
+        old = self._rank.get(key)
+        if old is not None:
+            del ranks[bisect_left(ranks, old)]
+        new = (-screening.available(), self._order[key], key)
+        insort(ranks, new)
+        self._rank[key] = new
+
+    @staticmethod
+    def _place(
+        screening: Screening, row: int, k: int, mask: Optional[SpacingMask]
+    ) -> Optional[List[Seat]]:
+        """Return *k* adjacent free seats of *row*, nearest the row's centre."""
+        free = SeatSearchIndex._free_row(screening, row)
+        if mask is not None:
+            forbidden = mask.forbidden(row)
+            free = [f and not (forbidden >> i & 1) for i, f in enumerate(free)]
+        # Twice the row's centre: midpoint of its first and last physical seat.
+        centre2 = _row_span(screening.auditorium, row)
+        starts = []
+        run = 0
+        for col, f in enumerate(free, start=1):
+            run = run + 1 if f else 0
+            if run >= k:
+                starts.append(col - k + 1)
+        if not starts:
+            return None
+        best = min(starts, key=lambda s: abs(2 * s + k - 1 - centre2))
+        aud = screening.auditorium
+        return list(seat_pool(aud.rows, aud.cols)[row][best - 1 : best - 1 + k])
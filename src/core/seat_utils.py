@@ -1,45 +1,62 @@
 """Seat utilities for conversions, parsing, and validation."""
 
+import re
 import string
+from functools import lru_cache
+from itertools import product
+from typing import Dict, List, Optional, Tuple
 
 from src.models.entities import Seat, Theater
 
+#: Largest supported house: rows ``A`` … ``ZZ`` and seats ``1`` … ``999``.
+MAX_ROWS = 26 + 26 * 26
+MAX_COLS = 999
+
+# Spreadsheet-style labels, built once: A..Z, then AA, AB, ..., ZZ.
+_ROW_LABELS: Tuple[str, ...] = tuple(string.ascii_uppercase) + tuple(
+    a + b for a, b in product(string.ascii_uppercase, repeat=2)
+)
+_ROW_INDEX: Dict[str, int] = {label: i for i, label in enumerate(_ROW_LABELS)}
+_SEAT_CODE_RE = re.compile(r"([A-Z]{1,2})(\d+)")
+
 
 def row_index_to_letter(index: int) -> str:
-    """Convert a zero-based row index to a row letter.
+    """Convert a zero-based row index to a row label.
 
-    :param index: Row index in the range ``0..25`` (where 0 == ``A``).
+    Rows are labelled like spreadsheet columns: ``A`` … ``Z``, then ``AA``,
+    ``AB`` … ``ZZ``.
+
+    :param index: Row index in the range ``0..MAX_ROWS - 1`` (where 0 == ``A``).
     :type index: int
-    :return: Row letter (``A``–``Z``).
+    :return: Row label (``A``–``ZZ``).
     :rtype: str
-    :raises ValueError: If index is outside ``0..25``.
+    :raises ValueError: If index is outside ``0..MAX_ROWS - 1``.
     """
-    if not (0 <= index < 26):
-        raise ValueError("Row index must be between 0 and 25.")
-    return string.ascii_uppercase[index]
+    if not (0 <= index < MAX_ROWS):
+        raise ValueError(f"Row index must be between 0 and {MAX_ROWS - 1}.")
+    return _ROW_LABELS[index]
 
 
 def row_letter_to_index(letter: str) -> int:
-    """Convert a row letter to a zero-based row index.
+    """Convert a row label to a zero-based row index.
 
-    :param letter: Row letter (``A``–``Z``), case-insensitive.
+    :param letter: Row label (``A``–``ZZ``), case-insensitive.
     :type letter: str
     :return: Zero-based row index.
     :rtype: int
-    :raises ValueError: If *letter* is not exactly one character in ``A``–``Z``.
+    :raises ValueError: If *letter* is not a valid row label.
     """
-    if letter is None:
-        raise ValueError("Row letter must be a single character A–Z.")
-    letter = letter.strip().upper()
-    if len(letter) != 1 or not ("A" <= letter <= "Z"):
-        raise ValueError("Row letter must be a single character A–Z.")
-    return ord(letter) - ord("A")
+    index = _ROW_INDEX.get(letter.strip().upper()) if letter is not None else None
+    if index is None:
+        raise ValueError("Row must be one or two letters, A–ZZ.")
+    return index
 
 
 def parse_seat_code(code: str) -> Seat:
-    """Parse a seat code like ``B03`` into a :class:`Seat`.
+    """Parse a seat code like ``B03`` or ``AB112`` into a :class:`Seat`.
 
-    :param code: Seat code string with format ``<RowLetter><2-digit column>``.
+    :param code: Seat code string with format ``<Row><column number>``, where
+        the row is one or two letters and the column has at least one digit.
     :type code: str
     :return: Parsed seat.
     :rtype: Seat
@@ -48,19 +65,100 @@ def parse_seat_code(code: str) -> Seat:
     if not code:
         raise ValueError("Seat code cannot be empty.")
 
-    letter = code[0].upper()
-    if len(letter) != 1 or not ("A" <= letter <= "Z"):
-        raise ValueError(f"Invalid seat code row in '{code}'. Row must be A–Z.")
-
-    digits = code[1:]
-    if not digits.isdigit():
+    m = _SEAT_CODE_RE.fullmatch(code.upper())
+    if m is None:
+        if not code[0].isalpha():
+            raise ValueError(f"Invalid seat code row in '{code}'. Row must be A–ZZ.")
         raise ValueError(f"Invalid seat code digits in '{code}'.")
 
-    col = int(digits)
+    col = int(m.group(2))
     if col < 1:
         raise ValueError("Seat column must be >= 1.")
+    if col > MAX_COLS:
+        return Seat(row=m.group(1), col=col)  # out of range anywhere; not pooled
+    return seat_at(_ROW_INDEX[m.group(1)], col)
+
+
+@lru_cache(maxsize=1024)
+def seat_at(row: int, col: int) -> Seat:
+    """Return a shared :class:`Seat` at zero-based *row* and one-based *col*.
+
+    Recently requested seats are kept in a bounded cache; use
+    :func:`seat_pool` when the house is known.
+
+    :param row: Zero-based row index (``0..MAX_ROWS - 1``).
+    :type row: int
+    :param col: One-based column index.
+    :type col: int
+    :return: Seat at that position (the same object while it stays cached).
+    :rtype: Seat
+    :raises ValueError: If *row* is out of range.
+    """
+    return Seat(row=row_index_to_letter(row), col=col)
+
+
+class SeatPool:
+    """Shared seats of one house, created a row at a time on first use.
 
-    return Seat(row=letter, col=col)
+    ``pool[r][c - 1]`` is the seat at zero-based row *r* and one-based column
+    *c*; indexing a row tuple avoids a function call per seat in allocation
+    loops. Rows nobody allocates from are never built, so a large house costs
+    nothing until it is used.
+
+    :param rows: Number of rows.
+    :type rows: int
+    :param cols: Seats per row.
+    :type cols: int
+    """
+
+    __slots__ = ("cols", "_rows")
+
+    def __init__(self, rows: int, cols: int) -> None:
+        self.cols = cols
+        self._rows: List[Optional[Tuple[Seat, ...]]] = [None] * rows
+
+    def __getitem__(self, row: int) -> Tuple[Seat, ...]:
+        """Return the seats of zero-based *row*, building them if needed.
+
+        Two threads may both build a missing row; either tuple is kept, and
+        the seats of both compare equal.
+
+        :param row: Zero-based row index.
+        :type row: int
+        :return: Seats indexed by zero-based column.
+        :rtype: tuple[Seat, ...]
+        """
+        seats = self._rows[row]
+        if seats is None:
+            label = row_index_to_letter(row)
+            seats = tuple(Seat(row=label, col=c) for c in range(1, self.cols + 1))
+            self._rows[row] = seats
+        return seats
+
+    def built_rows(self) -> int:
+        """Return how many rows have been built.
+
+        :return: Row count.
+        :rtype: int
+        """
+        return sum(seats is not None for seats in self._rows)
+
+
+@lru_cache(maxsize=16)
+def seat_pool(rows: int, cols: int) -> SeatPool:
+    """Return the seat pool of a house of this size.
+
+    Seats do not depend on the layout, so every auditorium of the same size
+    shares one pool. Pools of the least recently used sizes are released.
+
+    :param rows: Number of rows.
+    :type rows: int
+    :param cols: Seats per row.
+    :type cols: int
+    :return: The shared pool.
+    :rtype: SeatPool
+    """
+    return SeatPool(rows, cols)
 
 
 def format_seat_code(row: int, col: int) -> str:
@@ -70,7 +168,7 @@ def format_seat_code(row: int, col: int) -> str:
     :type row: int
     :param col: One-based column index (``>= 1``).
     :type col: int
-    :return: Seat code like ``A01``.
+    :return: Seat code like ``A01`` (or ``AB112`` for large houses).
     :rtype: str
     """
     return f"{row_index_to_letter(row)}{col:02d}"
@@ -1,10 +1,17 @@
 """Booking service: preview and commit operations."""
 
-from typing import Iterable, Optional
+from contextlib import contextmanager
+from typing import Iterable, Iterator, List, Optional, Type, Union
 
-from src.core.allocation import auto_allocate, manual_allocate
+from src.core.allocation import manual_allocate
 from src.core.errors import CapacityExceeded, NotFound
+from src.core.events import BookingCancelled, BookingCommitted, EventBus, seat_ranges
+from src.core.history import CANCEL, COMMIT, DEFAULT_DEPTH, Operation, OperationLog
+from src.core.preview import PreviewTable
 from src.core.seat_utils import row_letter_to_index
+from src.core.spacing import SpacingRules
+from src.core.start_seats import StartSeat, recommend_start_seats
+from src.core.tracing import NULL_TRACER, Tracer
 from src.models.context import AppContext
 from src.models.entities import Booking, Seat
 
@@ -12,9 +19,48 @@ from src.models.entities import Booking, Seat
 class BookingService:
     """High-level booking operations."""
 
+    def __init__(
+        self,
+        tracer: Tracer = NULL_TRACER,
+        events: Optional[EventBus] = None,
+        rules: Optional[SpacingRules] = None,
+        history: int = DEFAULT_DEPTH,
+    ) -> None:
+        """Create the service.
+
+        :param tracer: Tracer recording a span per service call.
+        :type tracer: Tracer
+        :param events: Bus receiving an event per mutation (a private one by
+            default).
+        :type events: Optional[EventBus]
+        :param rules: Distancing rules applied to every preview.
+        :type rules: Optional[SpacingRules]
+        :param history: Commits and cancellations kept for undo/redo.
+        :type history: int
+        """
+        self._tracer = tracer
+        self.events = events if events is not None else EventBus()
+        self.rules = rules
+        self.history = OperationLog(history)
+        self._previews: Optional[PreviewTable] = None
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Group several mutations so subscribers see their events in one batch.
+
+        :return: Context manager; see :meth:`EventBus.batch`.
+        :rtype: Iterator[None]
+        """
+        with self.events.batch():
+            yield
+
     def preview_auto(self, ctx: AppContext, k: int) -> Optional[list[Seat]]:
         """Return an auto-allocation preview for ``k`` seats.
 
+        The strategy is the active screen's ``ctx.allocator``. Previews come
+        from :meth:`preview_table`, so trying several party sizes against the
+        same grid costs one allocation pass.
+
         :param ctx: Application context.
         :type ctx: AppContext
         :param k: Number of seats requested.
@@ -23,11 +69,39 @@ class BookingService:
         :rtype: Optional[list[Seat]]
         :raises CapacityExceeded: If requested seats exceed availability.
         """
-        if k > ctx.theater.available():
-            raise CapacityExceeded(
-                f"Sorry, there are only {ctx.theater.available()} seats available.\n"
+        with self._tracer.span(
+            "service.preview_auto",
+            screen=ctx.theater.title,
+            party_size=k,
+            allocator=ctx.allocator,
+        ) as span:
+            free = ctx.theater.available()
+            if k > free:
+                raise CapacityExceeded(
+                    f"Sorry, there are only {free} seats available.\n"
+                )
+            seats = self.preview_table(ctx).preview(k)
+            if seats is None and span.sampled:
+                span.outcome = "unallocatable"
+            return seats
+
+    def preview_table(self, ctx: AppContext) -> PreviewTable:
+        """Return the preview table of the active screen's current grid.
+
+        The table is rebuilt (lazily) whenever the screen, its grid version or
+        its allocator changes.
+
+        :param ctx: Application context.
+        :type ctx: AppContext
+        :return: Preview table.
+        :rtype: PreviewTable
+        """
+        table = self._previews
+        if table is None or not table.fresh(ctx.theater, ctx.allocator, self.rules):
+            table = self._previews = PreviewTable(
+                ctx.theater, ctx.allocator, self.rules
             )
-        return auto_allocate(ctx.theater, k)
+        return table
 
     def preview_manual(
         self, ctx: AppContext, k: int, start: Seat
@@ -44,11 +118,21 @@ class BookingService:
         :rtype: Optional[list[Seat]]
         :raises CapacityExceeded: If requested seats exceed availability.
         """
-        if k > ctx.theater.available():
-            raise CapacityExceeded(
-                f"Sorry, there are only {ctx.theater.available()} seats available./n"
-            )
-        return manual_allocate(ctx.theater, k, start)
+        with self._tracer.span(
+            "service.preview_manual",
+            screen=ctx.theater.title,
+            party_size=k,
+            start=start.code(),
+        ) as span:
+            free = ctx.theater.available()
+            if k > free:
+                raise CapacityExceeded(
+                    f"Sorry, there are only {free} seats available./n"
+                )
+            seats = manual_allocate(ctx.theater, k, start, self.rules)
+            if seats is None and span.sampled:
+                span.outcome = "unallocatable"
+            return seats
 
     # ----- commit & ids -----
 
@@ -67,6 +151,8 @@ class BookingService:
     ) -> None:
         """Commit seats under *booking_id* and register the booking.
 
+        The commit is recorded in :attr:`history` so it can be undone.
+
         :param ctx: Application context.
         :type ctx: AppContext
         :param booking_id: Booking identifier to use for ownership.
@@ -74,10 +160,118 @@ class BookingService:
         :param seats: Seats to assign.
         :type seats: Iterable[Seat]
         """
-        for s in seats:
+        seats = list(seats)
+        with self._tracer.span(
+            "service.commit_booking",
+            screen=ctx.theater.title,
+            party_size=len(seats),
+            booking_id=booking_id,
+        ):
+            booking = self._assign(ctx, Booking(booking_id=booking_id, seats=seats))
+        self._publish(BookingCommitted, ctx, booking)
+        self.history.record(Operation(COMMIT, booking, _target(ctx)))
+
+    def cancel_booking(self, ctx: AppContext, booking_id: str) -> Booking:
+        """Release the seats of *booking_id* and remove the booking.
+
+        The cancellation is recorded in :attr:`history` so it can be undone.
+
+        :param ctx: Application context.
+        :type ctx: AppContext
+        :param booking_id: Booking identifier.
+        :type booking_id: str
+        :return: The cancelled booking.
+        :rtype: Booking
+        :raises NotFound: If booking does not exist.
+        """
+        booking = self.get_booking(ctx, booking_id)
+        with self._tracer.span(
+            "service.cancel_booking",
+            screen=ctx.theater.title,
+            party_size=len(booking.seats),
+            booking_id=booking_id,
+        ):
+            self._release(ctx, booking)
+        self._publish(BookingCancelled, ctx, booking)
+        self.history.record(Operation(CANCEL, booking, _target(ctx)))
+        return booking
+
+    def undo(self) -> Optional[Operation]:
+        """Revert the most recent commit or cancellation.
+
+        Works on the screen the operation was made on, whichever screening is
+        active now, and publishes the usual events so derived indexes follow.
+
+        :return: The reverted operation, or ``None`` if there is nothing to undo.
+        :rtype: Optional[Operation]
+        """
+        op = self.history.undo()
+        if op is not None:
+            self._replay(op, "service.undo", inverse=True)
+        return op
+
+    def redo(self) -> Optional[Operation]:
+        """Re-apply the most recently undone operation.
+
+        :return: The re-applied operation, or ``None`` if there is nothing to
+            redo.
+        :rtype: Optional[Operation]
+        """
+        op = self.history.redo()
+        if op is not None:
+            self._replay(op, "service.redo", inverse=False)
+        return op
+
+    def _replay(self, op: Operation, span: str, inverse: bool) -> None:
+        """Apply *op* (or its inverse) to its screen, in O(booking size)."""
+        ctx, booking = op.target, op.booking
+        release = (op.kind == COMMIT) == inverse
+        with self._tracer.span(
+            span,
+            screen=ctx.theater.title,
+            party_size=len(booking.seats),
+            booking_id=booking.booking_id,
+            operation=op.kind,
+        ):
+            if release:
+                self._release(ctx, booking)
+            else:
+                self._assign(ctx, booking)
+        self._publish(BookingCancelled if release else BookingCommitted, ctx, booking)
+
+    @staticmethod
+    def _assign(ctx: AppContext, booking: Booking) -> Booking:
+        """Give *booking* its seats and register it."""
+        for s in booking.seats:
+            ctx.theater.assign(row_letter_to_index(s.row), s.col, booking.booking_id)
+        ctx.bookings[booking.booking_id] = booking
+        return booking
+
+    @staticmethod
+    def _release(ctx: AppContext, booking: Booking) -> None:
+        """Free the seats *booking* still holds and unregister it."""
+        for s in booking.seats:
             row_idx = row_letter_to_index(s.row)
-            ctx.theater.grid[row_idx][s.col - 1] = booking_id
-        ctx.bookings[booking_id] = Booking(booking_id=booking_id, seats=list(seats))
+            if ctx.theater.grid[row_idx][s.col - 1] == booking.booking_id:
+                ctx.theater.assign(row_idx, s.col, None)
+        del ctx.bookings[booking.booking_id]
+
+    def _publish(
+        self,
+        event: Type[Union[BookingCommitted, BookingCancelled]],
+        ctx: AppContext,
+        booking: Booking,
+    ) -> None:
+        """Publish *event* for *booking* on the screen of *ctx*."""
+        self.events.publish(
+            event(
+                screen=ctx.theater.title,
+                booking_id=booking.booking_id,
+                ranges=seat_ranges(booking.seats),
+                version=ctx.theater.version,
+                screening=ctx.screening,
+            )
+        )
 
     # ----- queries -----
 
@@ -96,3 +290,37 @@ class BookingService:
         if not b:
             raise NotFound(f"Booking '{booking_id}' not found.")
         return b
+
+    def suggest_start_seats(
+        self, ctx: AppContext, k: int, limit: int = 5
+    ) -> List[StartSeat]:
+        """Return the best start seats for a manual reseat of ``k`` seats.
+
+        :param ctx: Application context.
+        :type ctx: AppContext
+        :param k: Party size.
+        :type k: int
+        :param limit: Maximum suggestions.
+        :type limit: int
+        :return: Start seats from which :meth:`preview_manual` succeeds, best
+            first (see :func:`~src.core.start_seats.recommend_start_seats`).
+        :rtype: list[StartSeat]
+        """
+        with self._tracer.span(
+            "service.suggest_start_seats", screen=ctx.theater.title, party_size=k
+        ):
+            return recommend_start_seats(ctx.theater, k, self.rules, limit)
+
+
+def _target(ctx: AppContext) -> AppContext:
+    """Return a context pinned to the active screen of *ctx*.
+
+    It shares the theater and booking registry, so operations recorded with it
+    still reach that screen after ``ctx`` switches to another screening.
+    """
+    return AppContext(
+        theater=ctx.theater,
+        bookings=ctx.bookings,
+        screening=ctx.screening,
+        allocator=ctx.allocator,
+    )
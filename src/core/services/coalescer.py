@@ -0,0 +1,239 @@
+"""Micro-batched automatic bookings for screens under heavy demand.
+
+When many callers book the same screen at once, running ``preview_auto`` and
+``commit_booking`` per request repeats the same work for each of them: every
+commit changes the grid version, so each preview starts from scratch, and
+each commit notifies every subscriber separately.
+:class:`BookingCoalescer` queues requests per screen. One worker thread takes
+up to ``max_batch`` queued requests of a screen at a time and serves them in
+arrival order within a single transaction, so subscribers see one batch of
+events.
+
+With the greedy strategy and no active spacing rules, a batch makes one pass
+over :func:`~src.core.preview.greedy_seats`. Each request takes the next
+``k`` seats, which are exactly the seats ``auto_allocate`` would give it if
+the requests ran one after another. Other strategies and spacing rules
+depend on where earlier parties sat, so those requests are allocated one by
+one, still inside the batch.
+
+Requests are queued per screen and allocation strategy, so every request in
+a batch is seated by the same allocator against the same grid. Fairness:
+requests of a queue are served strictly first come, first served. A request
+that cannot be seated does not block smaller ones behind it, and the worker
+serves queues round-robin, so one busy screen cannot starve another.
+
+Thread safety: the coalescer serialises only the bookings submitted to it.
+:class:`~src.core.search.SeatSearchIndex` and the preview caches of
+:mod:`src.core.preview` are not synchronised, so a screen booked through a
+coalescer must not also be booked or previewed through the
+:class:`~src.core.services.booking.BookingService` directly from other
+threads.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Tuple
+
+from src.core.preview import greedy_seats
+from src.core.services.booking import BookingService
+from src.core.strategies import get_allocator
+from src.models.context import AppContext
+from src.models.entities import Booking, Seat, Theater
+
+#: ``(ctx, k) -> seats or None`` used for the requests of one batch.
+_Take = Callable[[AppContext, int], Optional[List[Seat]]]
+
+
+@dataclass(slots=True)
+class _Request:
+    """One queued booking request."""
+
+    ctx: AppContext
+    k: int
+    future: "Future[Optional[Booking]]"
+
+
+@dataclass(slots=True)
+class _Lane:
+    """Pending requests of one screen and allocation strategy."""
+
+    theater: Theater
+    allocator: str
+    queue: Deque[_Request] = field(default_factory=deque)
+
+
+#: Lanes are keyed by ``(id(theater), allocator name)``.
+_LaneKey = Tuple[int, str]
+
+
+class BookingCoalescer:
+    """Queue automatic bookings per screen and commit them in micro-batches.
+
+    Not safe to combine with direct :class:`BookingService` use on the same
+    screen from other threads; see the module docstring.
+
+    :param service: Service performing previews and commits.
+    :type service: BookingService
+    :param max_batch: Most requests of one screen served together.
+    :type max_batch: int
+    """
+
+    def __init__(self, service: BookingService, max_batch: int = 64) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1.")
+        self._svc = service
+        self.max_batch = max_batch
+        self._lanes: Dict[_LaneKey, _Lane] = {}
+        self._ready: Deque[_LaneKey] = deque()  # lanes with work, in service order
+        self._cond = threading.Condition()
+        self._closed = False
+        self.batches = 0
+        self.requests = 0
+        self._thread = threading.Thread(
+            target=self._loop, name="booking-coalescer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, ctx: AppContext, k: int) -> "Future[Optional[Booking]]":
+        """Queue a request for ``k`` automatically allocated seats.
+
+        :param ctx: Context of the screen to book (its theater, booking
+            registry and allocator); it must not be switched to another
+            screening while requests are pending. The allocator is read
+            now, at submission.
+        :type ctx: AppContext
+        :param k: Number of seats.
+        :type k: int
+        :return: Future resolving to the committed booking, or ``None`` if
+            the party could not be seated.
+        :rtype: Future[Optional[Booking]]
+        :raises RuntimeError: If the coalescer is closed.
+        """
+        future: "Future[Optional[Booking]]" = Future()
+        key = (id(ctx.theater), ctx.allocator)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BookingCoalescer is closed.")
+            lane = self._lanes.get(key)
+            if lane is None or lane.theater is not ctx.theater:
+                lane = self._lanes[key] = _Lane(ctx.theater, ctx.allocator)
+            if not lane.queue:
+                self._ready.append(key)
+            lane.queue.append(_Request(ctx, k, future))
+            self._cond.notify()
+        return future
+
+    def book(
+        self, ctx: AppContext, k: int, timeout: Optional[float] = None
+    ) -> Optional[Booking]:
+        """Submit a request and wait for its outcome.
+
+        :param ctx: Context of the screen to book.
+        :type ctx: AppContext
+        :param k: Number of seats.
+        :type k: int
+        :param timeout: Seconds to wait; ``None`` waits indefinitely.
+        :type timeout: Optional[float]
+        :return: Committed booking, or ``None`` if the party could not be
+            seated.
+        :rtype: Optional[Booking]
+        """
+        return self.submit(ctx, k).result(timeout)
+
+    def close(self) -> None:
+        """Serve the requests already queued, then stop the worker thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def __enter__(self) -> "BookingCoalescer":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _loop(self) -> None:
+        """Worker thread: serve one batch per ready lane, round-robin."""
+        while True:
+            with self._cond:
+                while not self._ready and not self._closed:
+                    self._cond.wait()
+                if not self._ready:
+                    return  # closed and drained
+                key = self._ready.popleft()
+                lane = self._lanes[key]
+                n = min(len(lane.queue), self.max_batch)
+                batch = [lane.queue.popleft() for _ in range(n)]
+                if lane.queue:
+                    self._ready.append(key)  # back of the line
+                else:
+                    del self._lanes[key]
+                self.batches += 1
+                self.requests += n
+            self._serve(lane, batch)
+
+    def _serve(self, lane: _Lane, batch: List[_Request]) -> None:
+        """Allocate and commit *batch* of *lane* in arrival order, then resolve it."""
+        results: List[Optional[Booking]] = []
+        try:
+            with self._svc.transaction():
+                take = self._allocator(lane)
+                for req in batch:
+                    seats = take(req.ctx, req.k)
+                    booking = None
+                    if seats:
+                        bid = req.ctx.generate_booking_id()
+                        self._svc.commit_booking(req.ctx, bid, seats)
+                        booking = req.ctx.bookings[bid]
+                    results.append(booking)
+        except Exception as exc:  # noqa: BLE001 - reported to every waiter
+            for req in batch[len(results) :]:
+                req.future.set_exception(exc)
+        for req, booking in zip(batch, results):
+            req.future.set_result(booking)
+
+    def _allocator(self, lane: _Lane) -> _Take:
+        """Return the seat source for one batch of *lane*."""
+        rules = self._svc.rules
+        theater = lane.theater
+        if lane.allocator != "greedy" or (rules is not None and rules.active()):
+            allocate = get_allocator(lane.allocator)
+
+            def one_by_one(req_ctx: AppContext, k: int) -> Optional[List[Seat]]:
+                if k <= 0 or k > theater.available():
+                    return None
+                return allocate(theater, k, rules)
+
+            return one_by_one
+
+        return _GreedyPass(greedy_seats(theater)).take
+
+
+class _GreedyPass:
+    """Hand out consecutive slices of one greedy seat sequence.
+
+    Seats are pulled from the iterator only as requests need them. A request
+    larger than what is left gets ``None`` and leaves the seats for smaller
+    requests behind it, as a separate ``auto_allocate`` call would.
+    """
+
+    def __init__(self, seats: Iterator[Seat]) -> None:
+        self._seats = seats
+        self._pulled: List[Seat] = []
+
+    def take(self, ctx: AppContext, k: int) -> Optional[List[Seat]]:  # noqa: ARG002
+        """Return the next ``k`` seats of the sequence, or ``None``."""
+        if k <= 0:
+            return None
+        pulled = self._pulled
+        while len(pulled) < k:
+            seat = next(self._seats, None)
+            if seat is None:
+                return None
+            pulled.append(seat)
+        seats = pulled[:k]
+        del pulled[:k]
+        return seats
@@ -0,0 +1,349 @@
+"""Monte Carlo simulation of booking nights.
+
+Each simulated night starts from an empty house. Parties drawn from a
+:class:`~src.core.workload.WorkloadModel` arrive until the night's demand is
+used up, and are served through the real
+:class:`~src.core.services.booking.BookingService` paths: auto-allocation,
+or a manual reseat for requests that ask for one. Each night then reports:
+
+* **fill rate** — sold seats over capacity;
+* **stranded seats** — free seats with no free neighbour in their row, which
+  only a party of one can still use;
+* **split parties** — bookings not seated side by side in a single row;
+* **turned away** — parties that could not be seated.
+
+Nights are independent and seeded from ``(seed, night number)``, so a run is
+reproducible whatever the number of workers. :func:`run_simulation` spreads
+chunks of nights over a :class:`~concurrent.futures.ProcessPoolExecutor`;
+each worker folds its nights into running statistics and returns only those,
+so memory and inter-process traffic do not grow with the number of nights.
+"""
+
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from src.core.seat_utils import row_letter_to_index
+from src.core.services.booking import BookingService
+from src.core.spacing import SpacingRules
+from src.core.workload import WorkloadModel, place_request
+from src.models.context import AppContext
+from src.models.entities import Booking, Theater
+from src.models.layout import Layout
+
+#: Metrics reported per night, in report order.
+METRICS = ("fill_rate", "stranded_seats", "split_parties", "turned_away")
+
+
+@dataclass(frozen=True, slots=True)
+class SimulationSpec:
+    """What to simulate: a house, its traffic and how it is sold.
+
+    :param rows: Number of rows.
+    :type rows: int
+    :param cols: Seats per row.
+    :type cols: int
+    :param layout: Auditorium shape, if not a full rectangle.
+    :type layout: Optional[Layout]
+    :param model: Party size and reseat distribution.
+    :type model: WorkloadModel
+    :param demand: Mean tickets wanted per night, as a fraction of capacity
+        (``1.0`` asks for exactly a full house).
+    :type demand: float
+    :param demand_sd: Standard deviation of *demand* between nights.
+    :type demand_sd: float
+    :param allocator: Automatic allocation strategy.
+    :type allocator: str
+    :param rules: Distancing rules, if any.
+    :type rules: Optional[SpacingRules]
+    """
+
+    rows: int
+    cols: int
+    layout: Optional[Layout] = None
+    model: WorkloadModel = WorkloadModel()
+    demand: float = 1.0
+    demand_sd: float = 0.1
+    allocator: str = "greedy"
+    rules: Optional[SpacingRules] = None
+
+    def __post_init__(self) -> None:
+        """Validate the parameters.
+
+        :raises ValueError: On a non-positive size or negative demand.
+        """
+        if self.rows < 1 or self.cols < 1:
+            raise ValueError("rows and cols must be positive.")
+        if self.demand < 0 or self.demand_sd < 0:
+            raise ValueError("demand and demand_sd cannot be negative.")
+
+
+@dataclass(frozen=True, slots=True)
+class NightResult:
+    """Outcome of one simulated night (see the module docstring).
+
+    :param fill_rate: Sold seats over capacity.
+    :type fill_rate: float
+    :param stranded_seats: Free seats without a free neighbour.
+    :type stranded_seats: int
+    :param split_parties: Bookings not seated together in one row.
+    :type split_parties: int
+    :param turned_away: Parties that could not be seated.
+    :type turned_away: int
+    """
+
+    fill_rate: float
+    stranded_seats: int
+    split_parties: int
+    turned_away: int
+
+
+@dataclass(slots=True)
+class RunningStats:
+    """Streaming count, mean, variance and range (Welford's algorithm).
+
+    Two partial results combine exactly with :meth:`merge`, so workers can
+    aggregate independently.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    low: float = math.inf
+    high: float = -math.inf
+
+    def add(self, x: float) -> None:
+        """Fold one observation in.
+
+        :param x: Observed value.
+        :type x: float
+        """
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        self.low = min(self.low, x)
+        self.high = max(self.high, x)
+
+    def merge(self, other: "RunningStats") -> None:
+        """Fold another partial result in (Chan et al.'s parallel update).
+
+        :param other: Statistics over a disjoint set of observations.
+        :type other: RunningStats
+        """
+        if not other.count:
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.low = min(self.low, other.low)
+        self.high = max(self.high, other.high)
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation (``0.0`` below two observations)."""
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+
+@dataclass(slots=True)
+class SimulationSummary:
+    """Running statistics of every metric in :data:`METRICS`.
+
+    :param stats: Metric name -> statistics.
+    :type stats: dict[str, RunningStats]
+    """
+
+    stats: Dict[str, RunningStats] = field(
+        default_factory=lambda: {name: RunningStats() for name in METRICS}
+    )
+
+    @property
+    def nights(self) -> int:
+        """Number of nights aggregated."""
+        return self.stats[METRICS[0]].count
+
+    def add(self, night: NightResult) -> None:
+        """Fold one night in.
+
+        :param night: Night outcome.
+        :type night: NightResult
+        """
+        for name in METRICS:
+            self.stats[name].add(getattr(night, name))
+
+    def merge(self, other: "SimulationSummary") -> None:
+        """Fold a partial summary in.
+
+        :param other: Summary of other nights.
+        :type other: SimulationSummary
+        """
+        for name in METRICS:
+            self.stats[name].merge(other.stats[name])
+
+
+def stranded_seats(theater: Theater) -> int:
+    """Return the free seats whose row neighbours are both unavailable.
+
+    :param theater: Theater to inspect.
+    :type theater: Theater
+    :return: Count of isolated free seats.
+    :rtype: int
+    """
+    count = 0
+    for row in theater.grid:
+        run = 0
+        for cell in row:
+            if cell is None:
+                run += 1
+                continue
+            count += run == 1
+            run = 0
+        count += run == 1
+    return count
+
+
+def is_split(booking: Booking) -> bool:
+    """Return ``True`` unless *booking* sits side by side in one row.
+
+    :param booking: Booking to inspect.
+    :type booking: Booking
+    :return: Whether the party is split.
+    :rtype: bool
+    """
+    rows = {row_letter_to_index(s.row) for s in booking.seats}
+    if len(rows) > 1:
+        return True
+    cols = [s.col for s in booking.seats]
+    return max(cols) - min(cols) + 1 != len(cols)
+
+
+def simulate_night(spec: SimulationSpec, rng: random.Random) -> NightResult:
+    """Sell one night and measure it.
+
+    :param spec: Simulation parameters.
+    :type spec: SimulationSpec
+    :param rng: Random source of this night.
+    :type rng: random.Random
+    :return: Night outcome.
+    :rtype: NightResult
+    """
+    theater = Theater("Simulation", spec.rows, spec.cols, layout=spec.layout)
+    ctx = AppContext(theater=theater, allocator=spec.allocator)
+    service = BookingService(rules=spec.rules, history=0)
+    capacity = theater.capacity()
+    wanted = round(max(rng.gauss(spec.demand, spec.demand_sd), 0.0) * capacity)
+    smallest = min(spec.model.party_sizes)
+
+    turned_away = 0
+    for req in spec.model.requests(rng):
+        if wanted <= 0:
+            break
+        wanted -= req.party_size
+        if req.party_size > theater.available():
+            turned_away += 1
+            if theater.available() < smallest:
+                turned_away += _remaining_parties(spec.model, wanted, rng)
+                break
+            continue
+        seats = place_request(ctx, service, req, req.party_size, rng)
+        if seats is None:
+            turned_away += 1
+            continue
+        service.commit_booking(ctx, service.new_provisional_id(ctx), seats)
+
+    return NightResult(
+        fill_rate=(capacity - theater.available()) / capacity if capacity else 0.0,
+        stranded_seats=stranded_seats(theater),
+        split_parties=sum(map(is_split, ctx.bookings.values())),
+        turned_away=turned_away,
+    )
+
+
+def _remaining_parties(model: WorkloadModel, wanted: int, rng: random.Random) -> int:
+    """Count the parties still to arrive for *wanted* tickets (house is full)."""
+    parties = 0
+    requests = model.requests(rng)
+    while wanted > 0:
+        wanted -= next(requests).party_size
+        parties += 1
+    return parties
+
+
+def night_rng(seed: int, night: int) -> random.Random:
+    """Return the random source of one night of a run.
+
+    :param seed: Run seed.
+    :type seed: int
+    :param night: Zero-based night number.
+    :type night: int
+    :return: Independently seeded generator.
+    :rtype: random.Random
+    """
+    return random.Random(f"{seed}:{night}")
+
+
+def simulate_nights(
+    spec: SimulationSpec, seed: int, nights: Iterable[int]
+) -> SimulationSummary:
+    """Simulate the given nights of a run and aggregate them.
+
+    This is the unit of work sent to pool workers.
+
+    :param spec: Simulation parameters.
+    :type spec: SimulationSpec
+    :param seed: Run seed.
+    :type seed: int
+    :param nights: Night numbers to simulate.
+    :type nights: Iterable[int]
+    :return: Partial summary.
+    :rtype: SimulationSummary
+    """
+    summary = SimulationSummary()
+    for night in nights:
+        summary.add(simulate_night(spec, night_rng(seed, night)))
+    return summary
+
+
+def run_simulation(
+    spec: SimulationSpec,
+    nights: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> SimulationSummary:
+    """Simulate *nights* independent nights, in parallel when possible.
+
+    :param spec: Simulation parameters.
+    :type spec: SimulationSpec
+    :param nights: Number of nights.
+    :type nights: int
+    :param seed: Run seed; the same seed gives the same nights.
+    :type seed: int
+    :param workers: Worker processes; ``None`` uses every CPU, ``1`` runs in
+        this process.
+    :type workers: Optional[int]
+    :param chunk_size: Nights per task; defaults to about four tasks per
+        worker, enough to keep every worker busy until the end.
+    :type chunk_size: Optional[int]
+    :return: Aggregated statistics.
+    :rtype: SimulationSummary
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or nights <= 1:
+        return simulate_nights(spec, seed, range(nights))
+
+    size = chunk_size or max(1, math.ceil(nights / (workers * 4)))
+    chunks: List[range] = [
+        range(start, min(start + size, nights)) for start in range(0, nights, size)
+    ]
+    summary = SimulationSummary()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(simulate_nights, spec, seed, c) for c in chunks]
+        for future in as_completed(futures):
+            summary.merge(future.result())
+    return summary
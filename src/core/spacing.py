@@ -0,0 +1,180 @@
+"""Distancing rules between parties, checked with row bitsets.
+
+Each row's seats held by bookings are packed into an integer (bit ``c - 1``
+for seat ``c``). Spreading that bitset ``gap`` places left and right, and
+OR-ing in the rows directly in front and behind, gives the set of seats the
+rules forbid for a new party. A :class:`SpacingMask` builds that mask once
+per row it is asked about; testing a candidate seat is then one shift and
+one AND, whatever the size of the venue.
+
+Missing and blocked positions are not parties, so they never trigger a rule,
+and seats of the party being placed do not constrain each other.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence
+
+from src.core.seat_utils import row_letter_to_index
+from src.models.entities import Seat, Theater
+from src.models.layout import BLOCKED, MISSING
+
+
+@dataclass(frozen=True, slots=True)
+class SpacingRules:
+    """Distancing rules applied when seats are allocated.
+
+    :param gap: Empty seats required between two parties in the same row.
+    :type gap: int
+    :param no_behind: Forbid seats directly in front of or behind another
+        party (same seat number, adjacent row).
+    :type no_behind: bool
+    """
+
+    gap: int = 0
+    no_behind: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the gap.
+
+        :raises ValueError: If *gap* is negative.
+        """
+        if self.gap < 0:
+            raise ValueError("Spacing gap cannot be negative.")
+
+    def active(self) -> bool:
+        """Return ``True`` if any rule restricts seating.
+
+        :return: Whether checks are needed.
+        :rtype: bool
+        """
+        return self.gap > 0 or self.no_behind
+
+
+def occupied_bits(row: Sequence[Optional[str]]) -> int:
+    """Return the bitset of seats held by bookings in *row*.
+
+    :param row: One row of ``Theater.grid``.
+    :type row: Sequence[Optional[str]]
+    :return: Integer with bit ``c - 1`` set when seat ``c`` is booked.
+    :rtype: int
+    """
+    bits = 0
+    for i, cell in enumerate(row):
+        if cell is not None and cell is not MISSING and cell is not BLOCKED:
+            bits |= 1 << i
+    return bits
+
+
+def spread(bits: int, gap: int) -> int:
+    """Return *bits* widened by *gap* positions on both sides.
+
+    Doubling shifts need ``O(log gap)`` integer operations.
+
+    :param bits: Row bitset.
+    :type bits: int
+    :param gap: Distance to cover.
+    :type gap: int
+    :return: Bitset of every position within *gap* of a set bit.
+    :rtype: int
+    """
+    covered = 0  # positions already covered on each side
+    while covered < gap:
+        step = min(covered + 1, gap - covered)
+        bits |= (bits << step) | (bits >> step)
+        covered += step
+    return bits
+
+
+class SpacingMask:
+    """Per-row forbidden-seat masks of one theater, built on demand.
+
+    A mask reflects the grid when the row was first asked about, so create
+    one per allocation.
+
+    :param theater: Theater whose grid is inspected (not mutated).
+    :type theater: Theater
+    :param rules: Rules to enforce.
+    :type rules: SpacingRules
+    """
+
+    def __init__(self, theater: Theater, rules: SpacingRules) -> None:
+        self._theater = theater
+        self._rules = rules
+        self._occupied: Dict[int, int] = {}
+        self._forbidden: Dict[int, int] = {}
+
+    def allows(self, row_idx: int, col: int) -> bool:
+        """Return ``True`` if the rules allow a new party in this seat.
+
+        :param row_idx: Zero-based row index.
+        :type row_idx: int
+        :param col: One-based column index.
+        :type col: int
+        :return: Whether the seat keeps the required distance.
+        :rtype: bool
+        """
+        return not (self.forbidden(row_idx) >> (col - 1)) & 1
+
+    def forbidden(self, row_idx: int) -> int:
+        """Return the bitset of seats the rules forbid in *row_idx*.
+
+        :param row_idx: Zero-based row index.
+        :type row_idx: int
+        :return: Integer with bit ``c - 1`` set when seat ``c`` is forbidden.
+        :rtype: int
+        """
+        mask = self._forbidden.get(row_idx)
+        if mask is None:
+            mask = spread(self._bits(row_idx), self._rules.gap)
+            if self._rules.no_behind:
+                if row_idx > 0:
+                    mask |= self._bits(row_idx - 1)
+                if row_idx + 1 < self._theater.rows:
+                    mask |= self._bits(row_idx + 1)
+            self._forbidden[row_idx] = mask
+        return mask
+
+    def _bits(self, row_idx: int) -> int:
+        """Return (and cache) :func:`occupied_bits` of one row."""
+        bits = self._occupied.get(row_idx)
+        if bits is None:
+            bits = self._occupied[row_idx] = occupied_bits(self._theater.grid[row_idx])
+        return bits
+
+
+def make_mask(theater: Theater, rules: Optional[SpacingRules]) -> Optional[SpacingMask]:
+    """Return a :class:`SpacingMask`, or ``None`` when no rule applies.
+
+    :param theater: Theater to check.
+    :type theater: Theater
+    :param rules: Rules, or ``None`` for no distancing.
+    :type rules: Optional[SpacingRules]
+    :return: Mask, or ``None`` so callers can skip checks entirely.
+    :rtype: Optional[SpacingMask]
+    """
+    if rules is None or not rules.active():
+        return None
+    return SpacingMask(theater, rules)
+
+
+def first_violation(
+    theater: Theater, seats: Sequence[Seat], rules: Optional[SpacingRules]
+) -> Optional[Seat]:
+    """Return the first of *seats* the rules forbid, or ``None``.
+
+    :param theater: Theater holding the existing bookings.
+    :type theater: Theater
+    :param seats: Seats of one new party.
+    :type seats: Sequence[Seat]
+    :param rules: Rules, or ``None`` for no distancing.
+    :type rules: Optional[SpacingRules]
+    :return: Offending seat, if any.
+    :rtype: Optional[Seat]
+    """
+    mask = make_mask(theater, rules)
+    if mask is None:
+        return None
+    for seat in seats:
+        if not mask.allows(row_letter_to_index(seat.row), seat.col):
+            return seat
+    return None
@@ -0,0 +1,105 @@
+"""Rank free seats as starting points for a manual reseat.
+
+:func:`~src.core.allocation.manual_allocate` takes every usable seat from the
+start seat rightwards, then overflows into the rows behind. Whether a start
+seat works, and what it yields, follows from two counts. The first is the
+usable seats at or right of it in its row, a per-row suffix count. The
+second is the usable seats in all later rows. Both come from one right-to-left
+sweep per row, so every seat is scored without calling ``manual_allocate``.
+"""
+
+import heapq
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from src.core.seat_utils import seat_pool
+from src.core.spacing import SpacingRules, make_mask
+from src.models.entities import Seat, Theater
+
+
+@dataclass(frozen=True, slots=True)
+class StartSeat:
+    """A start seat that can seat the whole party.
+
+    :param seat: Seat to enter at the reseat prompt.
+    :type seat: Seat
+    :param in_row: Party members placed in the start row.
+    :type in_row: int
+    :param adjacent: ``True`` if those members sit side by side.
+    :type adjacent: bool
+    """
+
+    seat: Seat
+    in_row: int
+    adjacent: bool
+
+
+def recommend_start_seats(
+    theater: Theater, k: int, rules: Optional[SpacingRules] = None, limit: int = 5
+) -> List[StartSeat]:
+    """Return the best start seats for a manual reseat of ``k`` seats.
+
+    Only seats from which ``manual_allocate`` succeeds are returned. They are
+    ranked by, in order: fewest members overflowing to later rows; start-row
+    members side by side; the start-row block closest to the row's centre;
+    front row first. Scoring is linear in the number of seats.
+
+    :param theater: Theater context (grid is inspected, not mutated).
+    :type theater: Theater
+    :param k: Party size.
+    :type k: int
+    :param rules: Distancing rules; seats they forbid are never used.
+    :type rules: Optional[SpacingRules]
+    :param limit: Maximum suggestions.
+    :type limit: int
+    :return: Suggestions, best first.
+    :rtype: list[StartSeat]
+    """
+    if k <= 0 or limit <= 0:
+        return []
+    mask = make_mask(theater, rules)
+    cols = theater.cols
+    pool = seat_pool(theater.rows, cols)
+
+    # suffix[r][c - 1]: usable seats in row r at or right of column c;
+    # runs[r][c - 1]: usable adjacent seats starting at column c.
+    suffix: List[List[int]] = []
+    runs: List[List[int]] = []
+    for row_idx, row in enumerate(theater.grid):
+        forbidden = mask.forbidden(row_idx) if mask else 0
+        count = run = 0
+        row_suffix = [0] * cols
+        row_runs = [0] * cols
+        for i in range(cols - 1, -1, -1):
+            if row[i] is None and not (forbidden >> i & 1):
+                count += 1
+                run += 1
+            else:
+                run = 0
+            row_suffix[i] = count
+            row_runs[i] = run
+        suffix.append(row_suffix)
+        runs.append(row_runs)
+
+    scored: List[Tuple[int, bool, int, int, int]] = []
+    behind = 0  # usable seats in rows after the current one
+    for row_idx in range(theater.rows - 1, -1, -1):
+        row_suffix, row_runs = suffix[row_idx], runs[row_idx]
+        if row_suffix and row_suffix[0] + behind >= k:
+            for i in range(cols):
+                if not row_runs[i] or row_suffix[i] + behind < k:
+                    continue  # not a usable seat, or too few seats from here
+                in_row = min(k, row_suffix[i])
+                adjacent = row_runs[i] >= in_row
+                offset = abs(2 * (i + 1) + in_row - 1 - (cols + 1))
+                scored.append((k - in_row, not adjacent, offset, row_idx, i + 1))
+        behind += row_suffix[0] if row_suffix else 0
+
+    return [
+        StartSeat(
+            seat=pool[row_idx][col - 1],
+            in_row=k - overflow,
+            adjacent=not split,
+        )
+        for overflow, split, _, row_idx, col in heapq.nsmallest(limit, scored)
+    ]
@@ -0,0 +1,36 @@
+"""Lookup of automatic seat allocation strategies by name."""
+
+from typing import Callable, Dict, List, Optional
+
+from src.core.allocation import auto_allocate
+from src.core.best_fit import best_fit_allocate
+from src.core.cluster import cluster_allocate
+from src.core.spacing import SpacingRules
+from src.models.entities import Seat, Theater
+
+#: ``(theater, party size, rules) -> seats or None``.
+Allocator = Callable[[Theater, int, Optional[SpacingRules]], Optional[List[Seat]]]
+
+#: Strategies selectable per screen: name -> allocator.
+ALLOCATORS: Dict[str, Allocator] = {
+    "greedy": auto_allocate,
+    "best-fit": best_fit_allocate,
+    "cluster": cluster_allocate,
+}
+
+
+def get_allocator(name: str) -> Allocator:
+    """Return the allocator registered as *name*.
+
+    :param name: Key of :data:`ALLOCATORS` (case-insensitive).
+    :type name: str
+    :return: Allocation function.
+    :rtype: Allocator
+    :raises ValueError: If *name* is not a known strategy.
+    """
+    allocator = ALLOCATORS.get(name.strip().lower())
+    if allocator is None:
+        raise ValueError(
+            f"Unknown allocator '{name}'. Choose one of: {', '.join(ALLOCATORS)}."
+        )
+    return allocator
@@ -0,0 +1,300 @@
+"""Structured JSON-lines tracing for commands and service calls.
+
+A :class:`Tracer` hands out :class:`Span` objects through :meth:`Tracer.span`.
+The sampling decision is taken once per trace, when the root span opens
+(head-based sampling); child spans inherit it, so unsampled traces cost a
+context-variable lookup and nothing else.
+
+Finished spans are handed to a :class:`TraceWriter`, which serialises and
+writes them on a background thread. Its queue is bounded: when the writer
+falls behind, records are dropped (and counted) rather than blocking the
+booking path.
+"""
+
+import json
+import os
+import queue
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, Optional, TextIO
+
+
+@dataclass(slots=True)
+class Span:
+    """A timed operation inside a trace.
+
+    :param name: Operation name, e.g. ``"command"`` or ``"service.preview_auto"``.
+    :type name: str
+    :param trace_id: Identifier shared by all spans of one trace.
+    :type trace_id: str
+    :param span_id: Identifier of this span.
+    :type span_id: str
+    :param parent_id: Identifier of the enclosing span, if any.
+    :type parent_id: Optional[str]
+    :param sampled: Whether the span is recorded.
+    :type sampled: bool
+    :param attrs: Extra attributes (party size, screen, ...).
+    :type attrs: dict[str, Any]
+    :param outcome: Result label; ``"ok"`` unless set or an exception escapes.
+    :type outcome: str
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    sampled: bool
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    outcome: str = "ok"
+
+    def set(self, **attrs: Any) -> None:
+        """Attach attributes to the span (no-op when unsampled).
+
+        :param attrs: Attribute names and JSON-serialisable values.
+        """
+        if self.sampled:
+            self.attrs.update(attrs)
+
+
+class _UnsampledSpan(Span):
+    """Placeholder span of unsampled traces; never recorded, writes are ignored.
+
+    One instance is shared by every unsampled trace on every thread, so it
+    must not carry state from one request to the next.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        for name, value in (
+            ("name", ""),
+            ("trace_id", ""),
+            ("span_id", ""),
+            ("parent_id", None),
+            ("sampled", False),
+            ("attrs", {}),
+            ("outcome", "ok"),
+        ):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Ignore the write (the placeholder is shared)."""
+
+
+_UNSAMPLED = _UnsampledSpan()
+
+_current: ContextVar[Optional[Span]] = ContextVar("gic_current_span", default=None)
+
+
+def current_span() -> Optional[Span]:
+    """Return the innermost open span of the running context, if any.
+
+    :return: Current span (possibly an unsampled placeholder) or ``None``.
+    :rtype: Optional[Span]
+    """
+    return _current.get()
+
+
+def annotate(**attrs: Any) -> None:
+    """Attach attributes to the current span, if one is open and sampled.
+
+    :param attrs: Attribute names and JSON-serialisable values.
+    """
+    span = _current.get()
+    if span is not None:
+        span.set(**attrs)
+
+
+class TraceWriter:
+    """Write trace records as JSON lines from a background thread.
+
+    :param stream: Text stream receiving one JSON object per line.
+    :type stream: TextIO
+    :param maxsize: Maximum number of records waiting to be written.
+    :type maxsize: int
+    :param owns_stream: Close *stream* when the writer is closed.
+    :type owns_stream: bool
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self, stream: TextIO, maxsize: int = 1024, owns_stream: bool = False
+    ) -> None:
+        self._stream = stream
+        self._owns_stream = owns_stream
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self.dropped = 0
+        self._thread = threading.Thread(
+            target=self._drain, name="gic-trace-writer", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, record: Dict[str, Any]) -> None:
+        """Queue *record* for writing; drop it if the queue is full.
+
+        :param record: JSON-serialisable mapping.
+        :type record: dict[str, Any]
+        """
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _drain(self) -> None:
+        """Writer loop: serialise queued records until told to stop."""
+        while True:
+            record = self._queue.get()
+            if record is self._STOP:
+                break
+            self._stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+            if self._queue.empty():
+                self._stream.flush()
+        self._stream.flush()
+
+    def close(self, timeout: float = 2.0) -> None:
+        """Flush pending records and stop the writer thread.
+
+        :param timeout: Seconds to wait for the writer to finish.
+        :type timeout: float
+        """
+        if not self._thread.is_alive():
+            return
+        try:
+            self._queue.put(self._STOP, timeout=timeout)
+        except queue.Full:
+            return
+        self._thread.join(timeout)
+        if self._owns_stream and not self._thread.is_alive():
+            self._stream.close()
+
+
+class Tracer:
+    """Create spans and forward sampled ones to a :class:`TraceWriter`.
+
+    :param writer: Destination for finished spans; ``None`` disables tracing.
+    :type writer: Optional[TraceWriter]
+    :param sample_rate: Probability that a new trace is recorded.
+    :type sample_rate: float
+    :param rng: Source of uniform ``[0, 1)`` numbers (injectable for tests).
+    :type rng: Callable[[], float]
+    """
+
+    def __init__(
+        self,
+        writer: Optional[TraceWriter] = None,
+        sample_rate: float = 1.0,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self._writer = writer
+        self._rate = sample_rate if writer is not None else 0.0
+        self._rng = rng
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any trace can be recorded at all."""
+        return self._rate > 0.0
+
+    @contextmanager
+    def span(self, name: str, **attrs: Any) -> Iterator[Span]:
+        """Open a span for the duration of the ``with`` block.
+
+        The outcome becomes ``"error"`` (with ``error`` set to the exception
+        type) if an exception escapes, or ``"exit"`` for :class:`SystemExit`,
+        unless the block already set one. Exceptions are always re-raised.
+
+        :param name: Operation name.
+        :type name: str
+        :param attrs: Initial attributes.
+        :return: Context manager yielding the span.
+        :rtype: Iterator[Span]
+        """
+        parent = _current.get()
+        if parent is None:
+            sampled = self._rate > 0.0 and self._rng() < self._rate
+        else:
+            sampled = parent.sampled
+
+        if not sampled:
+            token = _current.set(_UNSAMPLED)
+            try:
+                yield _UNSAMPLED
+            finally:
+                _current.reset(token)
+            return
+
+        span_id = os.urandom(8).hex()
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else span_id,
+            span_id=span_id,
+            parent_id=parent.span_id if parent is not None else None,
+            sampled=True,
+            attrs=dict(attrs),
+        )
+        token = _current.set(span)
+        started = time.time()
+        t0 = time.perf_counter_ns()
+        try:
+            yield span
+        except SystemExit:
+            if span.outcome == "ok":
+                span.outcome = "exit"
+            raise
+        except BaseException as exc:
+            span.outcome = "error"
+            span.attrs["error"] = type(exc).__name__
+            raise
+        finally:
+            elapsed_ns = time.perf_counter_ns() - t0
+            _current.reset(token)
+            self._emit(span, started, elapsed_ns)
+
+    def _emit(self, span: Span, started: float, elapsed_ns: int) -> None:
+        """Build the record for a finished span and hand it to the writer."""
+        if self._writer is None:
+            return
+        record: Dict[str, Any] = {
+            "ts": round(started, 6),
+            "trace_id": span.trace_id,
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "duration_ms": round(elapsed_ns / 1e6, 3),
+            "outcome": span.outcome,
+        }
+        record.update(span.attrs)
+        self._writer.submit(record)
+
+    def close(self) -> None:
+        """Flush and stop the underlying writer, if any."""
+        if self._writer is not None:
+            self._writer.close()
+
+
+#: Tracer that never samples; the default for services built without one.
+NULL_TRACER = Tracer()
+
+
+def open_tracer(path: Optional[str], sample_rate: float, queue_size: int) -> Tracer:
+    """Return a tracer appending to *path*, or :data:`NULL_TRACER` if unset.
+
+    :param path: JSON-lines output file, or ``None`` to disable tracing.
+    :type path: Optional[str]
+    :param sample_rate: Head-based sampling probability.
+    :type sample_rate: float
+    :param queue_size: Bound of the writer queue.
+    :type queue_size: int
+    :return: Configured tracer.
+    :rtype: Tracer
+    """
+    if not path or sample_rate <= 0.0:
+        return NULL_TRACER
+    # Flushing is left to the writer thread, which flushes whenever it is idle.
+    stream = open(path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+    writer = TraceWriter(stream, maxsize=queue_size, owns_stream=True)
+    return Tracer(writer, sample_rate=sample_rate)
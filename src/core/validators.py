@@ -1,10 +1,19 @@
 """Input validators and parsers for the CLI."""
 
 import re
-from typing import Tuple
+from typing import Optional, Tuple
 
 from src.models.entities import Seat, Theater
-from src.core.seat_utils import seat_in_bounds
+from src.core.seat_utils import (
+    MAX_COLS,
+    MAX_ROWS,
+    row_letter_to_index,
+    seat_in_bounds,
+)
+from src.core.errors import RuleViolation
+from src.core.export import REPORTS, export_format
+from src.core.spacing import SpacingRules, first_violation
+from src.models.layout import BLOCKED, MISSING
 
 
 def parse_init_line(line: str) -> Tuple[str, int, int]:
@@ -36,10 +45,10 @@ def parse_init_line(line: str) -> Tuple[str, int, int]:
     if not title:
         raise ValueError("Title cannot be empty.")
 
-    if not (1 <= rows <= 26):
-        raise ValueError("Rows must be between 1 and 26 (A–Z).")
-    if not (1 <= cols <= 50):
-        raise ValueError("SeatsPerRow must be between 1 and 50.")
+    if not (1 <= rows <= MAX_ROWS):
+        raise ValueError(f"Rows must be between 1 and {MAX_ROWS} (A–ZZ).")
+    if not (1 <= cols <= MAX_COLS):
+        raise ValueError(f"SeatsPerRow must be between 1 and {MAX_COLS}.")
 
     return title, rows, cols
 
@@ -80,7 +89,9 @@ def parse_booking_id(text: str) -> str:
     return bid
 
 
-def validate_start_seat(theater: Theater, seat: Seat) -> None:
+def validate_start_seat(
+    theater: Theater, seat: Seat, rules: Optional[SpacingRules] = None
+) -> None:
     """Validate a proposed starting seat for manual allocation.
 
     The seat must be in bounds and currently free.
@@ -89,7 +100,87 @@ def validate_start_seat(theater: Theater, seat: Seat) -> None:
     :type theater: Theater
     :param seat: Proposed starting seat.
     :type seat: Seat
+    :param rules: Distancing rules the seat must satisfy.
+    :type rules: Optional[SpacingRules]
     :raises ValueError: If the seat is out of bounds or already taken.
+    :raises RuleViolation: If *rules* forbid the seat.
     """
     if not seat_in_bounds(theater, seat):
         raise ValueError("Seat is out of bounds for this theater.")
+    occupant = theater.grid[row_letter_to_index(seat.row)][seat.col - 1]
+    if occupant is MISSING:
+        raise ValueError(f"There is no seat {seat.code()} in this theater.")
+    if occupant is BLOCKED:
+        raise ValueError(f"Seat {seat.code()} is not available for booking.")
+    if first_violation(theater, [seat], rules) is not None:
+        raise RuleViolation(f"Seat {seat.code()} is too close to another booking.")
+
+
+_PROFILE_MODES = {"cpu": (True, False), "mem": (False, True), "both": (True, True)}
+
+
+def parse_profile_request(text: str) -> Tuple[int, bool, bool]:
+    """Parse a profiling request ``<Commands> [cpu|mem|both]``.
+
+    The mode defaults to ``cpu``.
+
+    :param text: Raw input line, e.g. ``"5 both"``.
+    :type text: str
+    :return: Tuple ``(commands, cpu, memory)``.
+    :rtype: Tuple[int, bool, bool]
+    :raises ValueError: If the count is not positive or the mode is unknown.
+    """
+    parts = text.strip().lower().split()
+    if not parts or len(parts) > 2:
+        raise ValueError("Provide: [Commands] [cpu|mem|both].")
+    if not parts[0].isdigit() or int(parts[0]) <= 0:
+        raise ValueError("Number of commands to profile must be a positive integer.")
+    mode = parts[1] if len(parts) == 2 else "cpu"
+    if mode not in _PROFILE_MODES:
+        raise ValueError("Profiling mode must be one of: cpu, mem, both.")
+    cpu, memory = _PROFILE_MODES[mode]
+    return int(parts[0]), cpu, memory
+
+
+def parse_export_request(text: str) -> Tuple[str, str]:
+    """Parse an export request ``<bookings|occupancy> <Path>``.
+
+    The path may contain spaces; its extension is checked by
+    :func:`~src.core.export.export_format`.
+
+    :param text: Raw input line, e.g. ``"bookings nightly.csv.gz"``.
+    :type text: str
+    :return: Tuple ``(report, path)``.
+    :rtype: Tuple[str, str]
+    :raises ValueError: If the report is unknown, the path is missing or has
+        an unsupported extension.
+    """
+    parts = text.strip().split(maxsplit=1)
+    if len(parts) != 2:
+        raise ValueError("Provide: [bookings|occupancy] [Path].")
+    report, path = parts[0].lower(), parts[1].strip()
+    if report not in REPORTS:
+        raise ValueError(f"Report must be one of: {', '.join(REPORTS)}.")
+    export_format(path)
+    return report, path
+
+
+def parse_spacing_rules(text: str) -> SpacingRules:
+    """Parse distancing rules ``<Gap> [behind]``.
+
+    ``"2"`` requires two empty seats between parties in a row; ``"1 behind"``
+    also keeps the seats directly in front of and behind a party free.
+
+    :param text: Raw input, e.g. ``"1 behind"``.
+    :type text: str
+    :return: Parsed rules.
+    :rtype: SpacingRules
+    :raises ValueError: If the gap is not a non-negative integer or an
+        unknown option follows it.
+    """
+    parts = text.strip().lower().split()
+    if not parts or not parts[0].isdigit() or len(parts) > 2:
+        raise ValueError("Spacing must be '<Gap> [behind]', e.g. '1 behind'.")
+    if len(parts) == 2 and parts[1] != "behind":
+        raise ValueError(f"Unknown spacing option '{parts[1]}'.")
+    return SpacingRules(gap=int(parts[0]), no_behind=len(parts) == 2)
@@ -0,0 +1,184 @@
+"""Synthetic booking workload model.
+
+Describes what a night of ticket sales looks like — party sizes and how often
+the operator reseats manually — so benchmarks and simulations exercise the
+real allocation and commit paths with realistic traffic.
+"""
+
+import random
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+from src.core.seat_utils import seat_pool
+from src.core.services.booking import BookingService
+from src.models.context import AppContext
+from src.models.entities import Seat
+
+# Consecutive unplaceable requests after which filling gives up.
+_MAX_MISSES = 50
+
+
+@dataclass(frozen=True, slots=True)
+class BookingRequest:
+    """A single customer request.
+
+    :param party_size: Number of seats wanted.
+    :type party_size: int
+    :param reseat: Whether the operator reseats manually instead of accepting
+        the auto-allocation.
+    :type reseat: bool
+    """
+
+    party_size: int
+    reseat: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class WorkloadModel:
+    """Distribution of booking requests.
+
+    The defaults approximate a typical evening: mostly couples and small
+    groups, with the occasional large party.
+
+    :param party_sizes: Possible party sizes.
+    :type party_sizes: tuple[int, ...]
+    :param party_weights: Relative frequency of each entry in *party_sizes*.
+    :type party_weights: tuple[float, ...]
+    :param reseat_probability: Chance that a request is manually reseated.
+    :type reseat_probability: float
+    """
+
+    party_sizes: Tuple[int, ...] = (1, 2, 3, 4, 5, 6, 8)
+    party_weights: Tuple[float, ...] = (0.18, 0.38, 0.16, 0.15, 0.06, 0.05, 0.02)
+    reseat_probability: float = 0.1
+
+    def __post_init__(self) -> None:
+        """Validate the distribution.
+
+        :raises ValueError: On mismatched or invalid parameters.
+        """
+        if not self.party_sizes or len(self.party_sizes) != len(self.party_weights):
+            raise ValueError(
+                "party_sizes and party_weights must be non-empty and aligned."
+            )
+        if min(self.party_sizes) < 1:
+            raise ValueError("Party sizes must be positive.")
+        if not 0.0 <= self.reseat_probability <= 1.0:
+            raise ValueError("reseat_probability must be between 0 and 1.")
+
+    def requests(self, rng: random.Random) -> Iterator[BookingRequest]:
+        """Yield an endless stream of requests drawn from the model.
+
+        :param rng: Seeded random source.
+        :type rng: random.Random
+        :return: Infinite iterator of requests.
+        :rtype: Iterator[BookingRequest]
+        """
+        sizes, weights = self.party_sizes, self.party_weights
+        while True:
+            yield BookingRequest(
+                party_size=rng.choices(sizes, weights)[0],
+                reseat=rng.random() < self.reseat_probability,
+            )
+
+
+def random_free_seat(ctx: AppContext, rng: random.Random) -> Optional[Seat]:
+    """Return a uniformly chosen free seat, or ``None`` if the house is full.
+
+    :param ctx: Application context.
+    :type ctx: AppContext
+    :param rng: Random source.
+    :type rng: random.Random
+    :return: Free seat or ``None``.
+    :rtype: Optional[Seat]
+    """
+    t = ctx.theater
+    free = [
+        (r, c)
+        for r, row in enumerate(t.grid)
+        for c, owner in enumerate(row, start=1)
+        if owner is None
+    ]
+    if not free:
+        return None
+    r, c = rng.choice(free)
+    return seat_pool(t.rows, t.cols)[r][c - 1]
+
+
+def place_request(
+    ctx: AppContext,
+    service: BookingService,
+    req: BookingRequest,
+    k: int,
+    rng: random.Random,
+) -> Optional[List[Seat]]:
+    """Return the seats an operator would confirm for *req*, without committing.
+
+    A reseated request starts from a random free seat; if that fails (or the
+    request is not reseated) the auto-allocation is used.
+
+    :param ctx: Application context.
+    :type ctx: AppContext
+    :param service: Booking service used for previews.
+    :type service: BookingService
+    :param req: Request being served.
+    :type req: BookingRequest
+    :param k: Seats to place (may be less than ``req.party_size``).
+    :type k: int
+    :param rng: Seeded random source.
+    :type rng: random.Random
+    :return: Seats, or ``None`` if the request cannot be placed.
+    :rtype: Optional[list[Seat]]
+    """
+    seats = None
+    if req.reseat:
+        start = random_free_seat(ctx, rng)
+        if start is not None:
+            seats = service.preview_manual(ctx, k, start)
+    if not seats:
+        seats = service.preview_auto(ctx, k)
+    return seats or None
+
+
+def fill_to_occupancy(
+    ctx: AppContext,
+    service: BookingService,
+    occupancy: float,
+    model: WorkloadModel,
+    rng: random.Random,
+) -> int:
+    """Book requests from *model* until *occupancy* of the house is sold.
+
+    Requests that no longer fit are skipped; filling stops once the target is
+    reached, no request of the smallest party size fits, or too many requests
+    in a row cannot be placed.
+
+    :param ctx: Application context to fill.
+    :type ctx: AppContext
+    :param service: Booking service used for previews and commits.
+    :type service: BookingService
+    :param occupancy: Target sold fraction, ``0..1``.
+    :type occupancy: float
+    :param model: Workload model.
+    :type model: WorkloadModel
+    :param rng: Seeded random source.
+    :type rng: random.Random
+    :return: Number of bookings committed.
+    :rtype: int
+    """
+    target_free = round(ctx.theater.capacity() * (1.0 - occupancy))
+    smallest = min(model.party_sizes)
+    committed = misses = 0
+    for req in model.requests(rng):
+        available = ctx.theater.available()
+        if available <= target_free or available < smallest or misses >= _MAX_MISSES:
+            break
+        k = min(req.party_size, available - target_free)
+        seats = place_request(ctx, service, req, k, rng)
+        if not seats:
+            misses += 1
+            continue
+        service.commit_booking(ctx, service.new_provisional_id(ctx), seats)
+        committed += 1
+        misses = 0
+    return committed
@@ -1,7 +1,7 @@
 """Application context (in-memory state)."""
 
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Optional, Tuple
 
 from src.models.entities import Theater, Booking
 
@@ -16,11 +16,18 @@ class AppContext:
     :type bookings: dict[str, Booking]
     :param next_seq: Next numeric sequence for booking IDs.
     :type next_seq: int
+    :param screening: ``(screen, showtime)`` of the active screening when the
+        context is driven by a :class:`~src.models.schedule.Schedule`.
+    :type screening: Optional[tuple[str, str]]
+    :param allocator: Automatic allocation strategy of the active screen.
+    :type allocator: str
     """
 
     theater: Theater
     bookings: Dict[str, Booking] = field(default_factory=dict)
     next_seq: int = 1
+    screening: Optional[Tuple[str, str]] = None
+    allocator: str = "greedy"
 
     def generate_booking_id(self) -> str:
         """Return a new booking ID like ``GIC0001`` and advance the sequence.
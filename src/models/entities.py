@@ -1,14 +1,22 @@
 """Domain entities (dataclasses)."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
+from src.models.layout import BLOCKED, MISSING, Layout
+from src.models.occupancy import Occupancy
 
-@dataclass(slots=True)
+
+@dataclass(frozen=True, slots=True)
 class Seat:
-    """A seat coordinate.
+    """An immutable seat coordinate.
+
+    Allocators and the seat-code parser hand out shared instances from
+    :func:`~src.core.seat_utils.seat_pool` rather than building new ones, so
+    equal seats are usually the same object and container lookups succeed on
+    the identity check. The seat code is formatted once, on creation.
 
-    :param row: Row letter (``A``–``Z``).
+    :param row: Row label (``A``–``Z``, then ``AA``–``ZZ``).
     :type row: str
     :param col: One-based column index.
     :type col: int
@@ -16,14 +24,19 @@ class Seat:
 
     row: str
     col: int
+    _code: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Cache the formatted seat code."""
+        object.__setattr__(self, "_code", f"{self.row.upper()}{self.col:02d}")
 
     def code(self) -> str:
-        """Return the seat code as ``<Row><2-digit Col>`` (e.g., ``A03``).
+        """Return the seat code as ``<Row><Col>`` (e.g., ``A03``, ``AB112``).
 
         :return: Formatted seat code.
         :rtype: str
         """
-        return f"{self.row.upper()}{self.col:02d}"
+        return self._code
 
 
 @dataclass(slots=True)
@@ -50,23 +63,101 @@ class Theater:
     :type rows: int
     :param cols: Number of seats per row.
     :type cols: int
+    :param layout: Auditorium shape; ``None`` for a full rectangle. Missing and
+        blocked positions hold the :data:`~src.models.layout.MISSING` and
+        :data:`~src.models.layout.BLOCKED` sentinels in the grid, so they read
+        as taken everywhere without extra checks.
+    :type layout: Optional[Layout]
+    :param occupancy: Optional array-backed store kept in step with the grid
+        by :meth:`assign`; bulk queries are delegated to it.
+    :type occupancy: Optional[Occupancy]
+
+    :meth:`assign` is the only supported way to change ``grid``: it keeps the
+    counters below and the occupancy store in step, and writing to ``grid``
+    directly leaves them stale.
+
+    ``version`` increases on every change made through :meth:`assign`, and
+    ``row_versions[r]`` records the version of the last change to row ``r``;
+    caches key on them to detect which parts of the grid are stale.
+    ``row_free[r]`` is the number of free seats in row ``r`` and ``free`` their
+    total, both also maintained by :meth:`assign`.
     """
 
     title: str
     rows: int
     cols: int
+    layout: Optional[Layout] = None
+    occupancy: Optional[Occupancy] = field(default=None, repr=False, compare=False)
     grid: List[List[Optional[str]]] = field(init=False)
+    version: int = field(init=False, default=0)
+    row_versions: List[int] = field(init=False)
+    row_free: List[int] = field(init=False)
+    free: int = field(init=False)
 
     def __post_init__(self) -> None:
-        """Initialize the occupancy grid as an ``rows × cols`` matrix of ``None``."""
+        """Initialize the occupancy grid as an ``rows × cols`` matrix of ``None``.
+
+        :raises ValueError: If *layout* does not match ``rows × cols``.
+        """
         self.grid = [[None for _ in range(self.cols)] for _ in range(self.rows)]
+        self.row_versions = [0] * self.rows
+        self.row_free = [self.cols] * self.rows
+        self.free = self.rows * self.cols
+        if self.layout is not None:
+            self._place_layout(self.layout)
+        if self.occupancy is not None:
+            self.occupancy.load(self.grid)
+
+    def _place_layout(self, layout: Layout) -> None:
+        """Put the layout's sentinels into the grid.
+
+        :raises ValueError: If *layout* does not match ``rows × cols``.
+        """
+        if (layout.rows, layout.cols) != (self.rows, self.cols):
+            raise ValueError(
+                f"Layout is {layout.rows}x{layout.cols}, "
+                f"theater is {self.rows}x{self.cols}."
+            )
+        for sentinel, positions in (
+            (MISSING, layout.missing),
+            (BLOCKED, layout.blocked),
+        ):
+            for r, c in positions:
+                self.grid[r][c - 1] = sentinel
+                self.row_free[r] -= 1
+                self.free -= 1
+
+    def assign(self, row_idx: int, col: int, owner: Optional[str]) -> None:
+        """Set the occupant of one seat and bump the grid versions.
+
+        :param row_idx: Zero-based row index.
+        :type row_idx: int
+        :param col: One-based column index.
+        :type col: int
+        :param owner: Booking ID, or ``None`` to free the seat.
+        :type owner: Optional[str]
+        """
+        row = self.grid[row_idx]
+        if row[col - 1] is None and owner is not None:
+            self.row_free[row_idx] -= 1
+            self.free -= 1
+        elif row[col - 1] is not None and owner is None:
+            self.row_free[row_idx] += 1
+            self.free += 1
+        row[col - 1] = owner
+        self.version += 1
+        self.row_versions[row_idx] = self.version
+        if self.occupancy is not None:
+            self.occupancy.assign(row_idx, col, owner)
 
     def capacity(self) -> int:
-        """Return the total number of seats.
+        """Return the total number of sellable seats.
 
-        :return: ``rows * cols``.
+        :return: ``rows * cols``, less missing and blocked seats of the layout.
         :rtype: int
         """
+        if self.layout is not None:
+            return self.layout.sellable()
         return self.rows * self.cols
 
     def available(self) -> int:
@@ -75,4 +166,21 @@ class Theater:
         :return: Count of seats with ``None`` in the grid.
         :rtype: int
         """
-        return sum(1 for r in self.grid for c in r if c is None)
+        return self.free
+
+    def seats_of(self, booking_id: str) -> List[Tuple[int, int]]:
+        """Return the seats held by *booking_id*, front row first.
+
+        :param booking_id: Booking ID.
+        :type booking_id: str
+        :return: ``(zero-based row index, one-based column)`` pairs.
+        :rtype: list[tuple[int, int]]
+        """
+        if self.occupancy is not None:
+            return self.occupancy.seats_of(booking_id)
+        return [
+            (r, c)
+            for r, row in enumerate(self.grid)
+            for c, cell in enumerate(row, start=1)
+            if cell == booking_id
+        ]
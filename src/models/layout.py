@@ -0,0 +1,60 @@
+"""Auditorium layout descriptor (seat existence and seat kinds)."""
+
+from dataclasses import dataclass
+from typing import FrozenSet, Tuple
+
+#: Grid occupant of a position without a seat (aisle, gap, curved row end).
+MISSING = "<missing>"
+#: Grid occupant of a seat that exists but is never sold (broken, camera, ...).
+BLOCKED = "<blocked>"
+
+#: A seat position as ``(zero-based row index, one-based column)``.
+Position = Tuple[int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class Layout:
+    """Shape of an auditorium inside its ``rows × cols`` bounding box.
+
+    Every position is a regular seat unless listed in one of the sets. Layouts
+    are immutable and hashable, so one instance can be shared by all
+    screenings in the same auditorium and used as a cache key for compiled
+    tables.
+
+    :param rows: Number of rows.
+    :type rows: int
+    :param cols: Width of the widest row.
+    :type cols: int
+    :param missing: Positions without a seat.
+    :type missing: frozenset[Position]
+    :param blocked: Seats that exist but are not sold.
+    :type blocked: frozenset[Position]
+    :param wheelchair: Wheelchair spaces (sold last by automatic allocation).
+    :type wheelchair: frozenset[Position]
+    """
+
+    rows: int
+    cols: int
+    missing: FrozenSet[Position] = frozenset()
+    blocked: FrozenSet[Position] = frozenset()
+    wheelchair: FrozenSet[Position] = frozenset()
+
+    def __post_init__(self) -> None:
+        """Validate positions.
+
+        :raises ValueError: If a position is outside the box or in two sets.
+        """
+        marked = (self.missing, self.blocked, self.wheelchair)
+        for r, c in frozenset().union(*marked):
+            if not (0 <= r < self.rows and 1 <= c <= self.cols):
+                raise ValueError(f"Layout position {(r, c)} is outside the layout.")
+        if sum(map(len, marked)) != len(frozenset().union(*marked)):
+            raise ValueError("A layout position can only have one kind.")
+
+    def sellable(self) -> int:
+        """Return the number of seats that can be sold.
+
+        :return: Positions that are neither missing nor blocked.
+        :rtype: int
+        """
+        return self.rows * self.cols - len(self.missing) - len(self.blocked)
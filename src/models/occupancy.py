@@ -0,0 +1,39 @@
+"""Pluggable occupancy stores mirrored from ``Theater.grid``."""
+
+from typing import Callable, List, Optional, Protocol, Sequence, Tuple
+
+
+class Occupancy(Protocol):
+    """Array-backed copy of a theater's occupancy for bulk queries.
+
+    ``Theater.grid`` stays the source of truth that allocation and rendering
+    walk seat by seat; an occupancy store receives every change made through
+    ``Theater.assign`` and answers whole-grid questions (availability, a
+    booking's seats, symbol maps) without Python-level loops over the grid.
+    """
+
+    def load(self, grid: Sequence[Sequence[Optional[str]]]) -> None:
+        """Replace the stored state with *grid* (including layout sentinels)."""
+
+    def assign(self, row_idx: int, col: int, owner: Optional[str]) -> None:
+        """Record the new occupant of one seat (one-based *col*)."""
+
+    def available(self) -> int:
+        """Return the number of free seats."""
+
+    def row_free_counts(self) -> List[int]:
+        """Return the number of free seats of each row."""
+
+    def seats_of(self, owner: str) -> List[Tuple[int, int]]:
+        """Return ``(row index, one-based column)`` of every seat of *owner*."""
+
+    def symbol_rows(self, current_booking_id: Optional[str], symbols: str) -> List[str]:
+        """Return one string per row with one symbol per position.
+
+        *symbols* gives, in order, the symbols for a free seat, a missing
+        position, a blocked seat, another booking and *current_booking_id*.
+        """
+
+
+#: Builds an empty store for ``(rows, cols)``.
+OccupancyFactory = Callable[[int, int], Occupancy]
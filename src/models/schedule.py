@@ -0,0 +1,222 @@
+"""Screening schedule: many showtimes over a few auditoriums."""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.models.context import AppContext
+from src.models.entities import Booking, Theater
+from src.models.layout import Layout
+from src.models.occupancy import OccupancyFactory
+
+#: A screening key: ``(screen name, showtime)``.
+ScreeningKey = Tuple[str, str]
+
+
+@dataclass(frozen=True, slots=True)
+class Auditorium:
+    """A physical screen, shared by all of its screenings.
+
+    :param name: Screen name, e.g. ``"1"`` or ``"IMAX"``.
+    :type name: str
+    :param rows: Number of rows.
+    :type rows: int
+    :param cols: Seats per row.
+    :type cols: int
+    :param layout: Shape, if not a full rectangle. The same instance is handed
+        to every screening, so compiled allocation tables and render templates
+        (cached per layout) are built once per auditorium.
+    :type layout: Optional[Layout]
+    :param allocator: Name of the automatic allocation strategy for this
+        screen (see :data:`src.core.strategies.ALLOCATORS`).
+    :type allocator: str
+    """
+
+    name: str
+    rows: int
+    cols: int
+    layout: Optional[Layout] = None
+    allocator: str = "greedy"
+
+    def capacity(self) -> int:
+        """Return the number of sellable seats.
+
+        :return: Seat count.
+        :rtype: int
+        """
+        if self.layout is not None:
+            return self.layout.sellable()
+        return self.rows * self.cols
+
+
+@dataclass(slots=True)
+class Screening:
+    """One showtime of a film in an auditorium.
+
+    Occupancy is created on first use: until then a screening is only its
+    key, title and a reference to the shared :class:`Auditorium`.
+
+    :param auditorium: Screen the film is shown on.
+    :type auditorium: Auditorium
+    :param showtime: Start time label, e.g. ``"Mon 19:30"``.
+    :type showtime: str
+    :param title: Film title.
+    :type title: str
+    """
+
+    auditorium: Auditorium
+    showtime: str
+    title: str
+    theater: Optional[Theater] = field(default=None, init=False)
+    bookings: Optional[Dict[str, Booking]] = field(default=None, init=False)
+
+    @property
+    def key(self) -> ScreeningKey:
+        """``(screen name, showtime)``."""
+        return self.auditorium.name, self.showtime
+
+    def label(self) -> str:
+        """Return ``"<title> - screen <name>, <showtime>"``."""
+        return f"{self.title} - screen {self.auditorium.name}, {self.showtime}"
+
+    def available(self) -> int:
+        """Return free seats without materialising occupancy.
+
+        :return: Free seat count.
+        :rtype: int
+        """
+        if self.theater is None:
+            return self.auditorium.capacity()
+        return self.theater.available()
+
+    def materialise(self, occupancy: Optional[OccupancyFactory] = None) -> Theater:
+        """Create the occupancy state if needed and return it.
+
+        :param occupancy: Builds an array-backed store for a new grid.
+        :type occupancy: Optional[OccupancyFactory]
+        :return: Theater holding this screening's grid.
+        :rtype: Theater
+        """
+        if self.theater is None:
+            aud = self.auditorium
+            store = occupancy(aud.rows, aud.cols) if occupancy is not None else None
+            self.theater = Theater(
+                self.title, aud.rows, aud.cols, layout=aud.layout, occupancy=store
+            )
+            self.bookings = {}
+        return self.theater
+
+
+class Schedule:
+    """Screenings indexed by ``(screen, showtime)``, materialised lazily.
+
+    :param occupancy: Builds the occupancy store of each materialised
+        screening; ``None`` keeps the plain grid.
+    :type occupancy: Optional[OccupancyFactory]
+    """
+
+    def __init__(self, occupancy: Optional[OccupancyFactory] = None) -> None:
+        self.auditoriums: Dict[str, Auditorium] = {}
+        self.screenings: Dict[ScreeningKey, Screening] = {}
+        self.occupancy = occupancy
+
+    def add_auditorium(
+        self,
+        name: str,
+        rows: int,
+        cols: int,
+        layout: Optional[Layout] = None,
+        allocator: str = "greedy",
+    ) -> Auditorium:
+        """Register a screen.
+
+        :param name: Screen name.
+        :type name: str
+        :param rows: Number of rows.
+        :type rows: int
+        :param cols: Seats per row.
+        :type cols: int
+        :param layout: Shape, if not a full rectangle.
+        :type layout: Optional[Layout]
+        :param allocator: Automatic allocation strategy name.
+        :type allocator: str
+        :return: The auditorium.
+        :rtype: Auditorium
+        :raises ValueError: If the name is taken or the layout does not fit.
+        """
+        if name in self.auditoriums:
+            raise ValueError(f"Screen '{name}' is already defined.")
+        if layout is not None and (layout.rows, layout.cols) != (rows, cols):
+            raise ValueError(f"Layout of screen '{name}' is not {rows}x{cols}.")
+        aud = Auditorium(name, rows, cols, layout, allocator)
+        self.auditoriums[name] = aud
+        return aud
+
+    def add_screening(self, screen: str, showtime: str, title: str) -> Screening:
+        """Schedule *title* on *screen* at *showtime*.
+
+        :param screen: Name of a registered auditorium.
+        :type screen: str
+        :param showtime: Start time label.
+        :type showtime: str
+        :param title: Film title.
+        :type title: str
+        :return: The (not yet materialised) screening.
+        :rtype: Screening
+        :raises ValueError: If the screen is unknown or the slot is taken.
+        """
+        if screen not in self.auditoriums:
+            raise ValueError(f"Unknown screen '{screen}'.")
+        if (screen, showtime) in self.screenings:
+            raise ValueError(
+                f"Screen '{screen}' already has a screening at {showtime}."
+            )
+        screening = Screening(self.auditoriums[screen], showtime, title)
+        self.screenings[screening.key] = screening
+        return screening
+
+    def __iter__(self) -> Iterator[Screening]:
+        """Iterate screenings in insertion order."""
+        return iter(self.screenings.values())
+
+    def __len__(self) -> int:
+        return len(self.screenings)
+
+    def materialised(self) -> List[Screening]:
+        """Return the screenings whose occupancy has been created.
+
+        :return: Touched screenings in insertion order.
+        :rtype: list[Screening]
+        """
+        return [s for s in self.screenings.values() if s.theater is not None]
+
+    def materialise(self, key: ScreeningKey) -> Theater:
+        """Return the theater of screening *key*, creating it if needed.
+
+        :param key: ``(screen, showtime)``.
+        :type key: ScreeningKey
+        :return: The screening's theater.
+        :rtype: Theater
+        :raises KeyError: If no such screening exists.
+        """
+        return self.screenings[key].materialise(self.occupancy)
+
+    def activate(self, ctx: AppContext, key: ScreeningKey) -> Screening:
+        """Point *ctx* at the screening *key*, materialising it if needed.
+
+        The booking sequence in *ctx* is shared by all screenings, so booking
+        IDs stay unique across the schedule.
+
+        :param ctx: Application context used by the commands.
+        :type ctx: AppContext
+        :param key: ``(screen, showtime)``.
+        :type key: ScreeningKey
+        :return: The active screening.
+        :rtype: Screening
+        :raises KeyError: If no such screening exists.
+        """
+        screening = self.screenings[key]
+        ctx.theater = screening.materialise(self.occupancy)
+        ctx.bookings = screening.bookings  # type: ignore[assignment]
+        ctx.screening = key
+        ctx.allocator = screening.auditorium.allocator
+        return screening
@@ -26,7 +26,7 @@ def test_flow_book_accept_exit(
         "1",  # menu -> book
         "3",  # ticket count
         "",  # accept default selection
-        "3",  # exit
+        "10",  # exit
     ]
     feeder = _input_feeder(inputs)
     monkeypatch.setattr("builtins.input", lambda _: next(feeder))
@@ -61,7 +61,7 @@ def test_flow_book_reseat_check_exit(
         "2",  # menu -> check bookings
         "GIC0001",  # check first booking
         "",  # back to menu from check
-        "3",  # exit
+        "10",  # exit
     ]
     feeder = _input_feeder(inputs)
     monkeypatch.setattr("builtins.input", lambda _: next(feeder))
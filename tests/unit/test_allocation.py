@@ -31,8 +31,8 @@ def test_auto_allocate_overflow_to_next_row() -> None:
 def test_auto_allocate_skips_already_booked() -> None:
     t = Theater(title="Inception", rows=1, cols=6)
     # Occupy A03 and A04 (center pair)
-    t.grid[0][2] = "GIC0001"
-    t.grid[0][3] = "GIC0001"
+    t.assign(0, 3, "GIC0001")
+    t.assign(0, 4, "GIC0001")
     seats = auto_allocate(t, 3)
     assert seats is not None
     # Next available by order: A02, A05, A01
@@ -58,21 +58,34 @@ def test_manual_allocate_overflow_uses_default_on_next_rows() -> None:
 def test_allocate_insufficient_capacity_returns_none() -> None:
     t = Theater(title="Inception", rows=1, cols=4)
     # Occupy three seats -> only one left
-    t.grid[0][0] = "GIC0001"
-    t.grid[0][1] = "GIC0001"
-    t.grid[0][2] = "GIC0001"
+    t.assign(0, 1, "GIC0001")
+    t.assign(0, 2, "GIC0001")
+    t.assign(0, 3, "GIC0001")
     assert auto_allocate(t, 2) is None
     assert manual_allocate(t, 2, Seat("A", 1)) is None
 
+
 def test_manual_allocate_scans_right_skipping_taken() -> None:
     t = Theater("Film", rows=2, cols=10)
     # Mark some seats in B row as taken: B03..B06
-    t.grid[1][2] = "X"  # B03
-    t.grid[1][3] = "X"  # B04
-    t.grid[1][4] = "X"  # B05
-    t.grid[1][5] = "X"  # B06
+    t.assign(1, 3, "X")  # B03
+    t.assign(1, 4, "X")  # B04
+    t.assign(1, 5, "X")  # B05
+    t.assign(1, 6, "X")  # B06
     # Start at B05
     # Expect it to pick B07, B08 for k=2 (scan right, skip taken, don't jump to C row)
     seats = manual_allocate(t, 2, Seat("B", 5))
     assert seats is not None
     assert [s.code() for s in seats] == ["B07", "B08"]
+
+
+def test_allocation_in_large_house_uses_multi_letter_rows() -> None:
+    t = Theater("Arena", rows=702, cols=150)
+    for row_idx in range(27):  # fill rows A..AA
+        for col in range(1, 151):
+            t.assign(row_idx, col, "X")
+    seats = auto_allocate(t, 2)
+    assert [s.code() for s in seats] == ["AB75", "AB76"]
+    seats = manual_allocate(t, 2, Seat("ZZ", 149))
+    assert [s.code() for s in seats] == ["ZZ149", "ZZ150"]
+    assert manual_allocate(t, 3, Seat("ZZ", 149)) is None
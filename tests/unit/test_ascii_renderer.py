@@ -1,3 +1,8 @@
+import random
+
+import pytest
+
+from src.core.render import render_seat_map
 from src.core.renderers.ascii_renderer import AsciiRenderer
 from src.models.entities import Seat, Theater
 
@@ -22,8 +27,8 @@ def test_render_order_and_header_footer() -> None:
 def test_render_highlights_current_booking() -> None:
     t = Theater(title="Inception", rows=2, cols=4)
     # Occupy A02 with booking 1, B03 with booking 2
-    t.grid[0][1] = "GIC0001"  # A02
-    t.grid[1][2] = "GIC0002"  # B03
+    t.assign(0, 2, "GIC0001")  # A02
+    t.assign(1, 3, "GIC0002")  # B03
 
     out = AsciiRenderer().seat_map(t, current_booking_id="GIC0001")
     lines = out.splitlines()
@@ -40,7 +45,7 @@ def test_render_highlights_current_booking() -> None:
 def test_render_preview_overrides_and_other_bookings_marked() -> None:
     t = Theater(title="Inception", rows=2, cols=4)
     # Occupy B02 with existing booking
-    t.grid[1][1] = "GIC9999"  # B02
+    t.assign(1, 2, "GIC9999")  # B02
 
     preview = [Seat("A", 3), Seat("A", 4)]
     out = AsciiRenderer().seat_map(t, preview_seats=preview)
@@ -53,3 +58,59 @@ def test_render_preview_overrides_and_other_bookings_marked() -> None:
 
     b_cells = b_line.split()[1:]
     assert b_cells == [".", "#", ".", "."]
+
+
+def _reference_seat_map(t: Theater, current_booking_id=None, preview_seats=None) -> str:
+    """The original per-cell implementation, kept as an oracle."""
+    preview_codes = {s.row.upper() + f"{s.col:02d}" for s in (preview_seats or [])}
+    lines = ["    S C R E E N", "-" * max(2 * t.cols + 2, 18)]
+    for row_idx in range(t.rows - 1, -1, -1):
+        row_letter = chr(ord("A") + row_idx)
+        cells = []
+        for col in range(1, t.cols + 1):
+            occupant = t.grid[row_idx][col - 1]
+            if f"{row_letter}{col:02d}" in preview_codes:
+                cells.append("o")
+            elif occupant is None:
+                cells.append(".")
+            else:
+                cells.append("o" if occupant == current_booking_id else "#")
+        lines.append(f"{row_letter}  " + " ".join(cells))
+    lines.append("   " + " ".join(str(i) for i in range(1, t.cols + 1)))
+    return "\n".join(lines)
+
+
+@pytest.mark.parametrize("rows,cols,seed", [(1, 1, 0), (3, 7, 1), (26, 50, 2)])
+def test_fast_path_is_byte_identical_to_reference(
+    rows: int, cols: int, seed: int
+) -> None:
+    rng = random.Random(seed)
+    t = Theater("Film", rows, cols)
+    for r in range(rows):
+        for c in range(cols):
+            if rng.random() < 0.4:
+                t.assign(r, c + 1, rng.choice(["GIC0001", "GIC0002", "GIC0003"]))
+    preview = [
+        Seat(chr(ord("A") + rng.randrange(rows)), rng.randint(1, cols))
+        for _ in range(4)
+    ]
+    preview.append(Seat("a", cols + 5))  # out of bounds: ignored
+
+    for kwargs in (
+        {},
+        {"current_booking_id": "GIC0002"},
+        {"preview_seats": preview},
+        {"current_booking_id": "GIC0001", "preview_seats": preview},
+    ):
+        expected = _reference_seat_map(t, **kwargs)
+        assert AsciiRenderer().seat_map(t, **kwargs) == expected
+        assert render_seat_map(t, **kwargs) == expected
+
+
+def test_multi_letter_rows_are_aligned() -> None:
+    t = Theater("Film", 27, 2)
+    lines = AsciiRenderer().seat_map(t).split("\n")
+    assert lines[2] == "AA  . ."
+    assert lines[3] == "Z   . ."
+    assert lines[-2] == "A   . ."
+    assert lines[-1] == "    1 2"
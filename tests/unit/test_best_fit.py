@@ -0,0 +1,114 @@
+import pytest
+
+from src.config import load_settings
+from src.core.allocation import auto_allocate
+from src.core.best_fit import best_fit_allocate, fit_tables
+from src.core.layout import parse_layout_text
+from src.core.schedule import parse_schedule, single_screening
+from src.core.services.booking import BookingService
+from src.core.spacing import SpacingRules
+from src.core.strategies import ALLOCATORS, get_allocator
+from src.models.context import AppContext
+from src.models.entities import Theater
+
+
+def _codes(seats):
+    return [s.code() for s in seats]
+
+
+def _book(theater: Theater, *codes: str) -> None:
+    for code in codes:
+        theater.assign(ord(code[0]) - ord("A"), int(code[1:]), "GIC0001")
+
+
+def test_empty_house_is_centred_in_the_first_row() -> None:
+    assert _codes(best_fit_allocate(Theater("Film", 2, 10), 4)) == [
+        "A04",
+        "A05",
+        "A06",
+        "A07",
+    ]
+
+
+def test_party_stays_together_where_greedy_splits() -> None:
+    t = Theater("Film", 3, 6)
+    _book(t, "A03", "A04")
+    assert _codes(auto_allocate(t, 3)) == ["A02", "A05", "A01"]
+    # B02-B04 would strand B01; B01-B03 leaves a clean block of three.
+    assert _codes(best_fit_allocate(t, 3)) == ["B01", "B02", "B03"]
+
+
+def test_single_seats_are_not_stranded() -> None:
+    t = Theater("Film", 1, 6)
+    _book(t, "A01")
+    # A03-A05 is as central as A02-A04 but would strand A02 and A06.
+    assert _codes(best_fit_allocate(t, 3)) == ["A02", "A03", "A04"]
+
+
+def test_wheelchair_spaces_are_used_last() -> None:
+    t = Theater("Hall", 1, 6, layout=parse_layout_text("ww....\n"))
+    assert _codes(best_fit_allocate(t, 4)) == ["A03", "A04", "A05", "A06"]
+    assert fit_tables(1, 6, t.layout).wheelchair[0] == (0, 1, 2, 2, 2, 2, 2)
+
+
+def test_wheelchair_spaces_inside_a_run_are_stepped_around() -> None:
+    t = Theater("Hall", 1, 20, layout=parse_layout_text("........wwww........\n"))
+    # Either side of the wheelchair spaces beats the ends of the run.
+    assert _codes(best_fit_allocate(t, 2)) == ["A07", "A08"]
+
+
+def test_party_is_split_over_consecutive_rows_when_no_row_fits() -> None:
+    t = Theater("Film", 2, 4)
+    _book(t, "A02", "B03")
+    assert _codes(best_fit_allocate(t, 4)) == ["A03", "A04", "B01", "B02"]
+
+
+def test_scattered_seats_fall_back_to_greedy() -> None:
+    t = Theater("Film", 3, 3)
+    _book(t, "A02", "B01", "B03", "C02")
+    assert _codes(best_fit_allocate(t, 4)) == _codes(auto_allocate(t, 4))
+    assert best_fit_allocate(t, 6) is None
+
+
+def test_best_fit_respects_spacing_rules() -> None:
+    t = Theater("Film", 1, 9)
+    _book(t, "A05")
+    assert _codes(best_fit_allocate(t, 3, SpacingRules(gap=1))) == [
+        "A01",
+        "A02",
+        "A03",
+    ]
+
+
+def test_strategies_are_selectable_per_screen() -> None:
+    assert set(ALLOCATORS) == {"greedy", "best-fit", "cluster"}
+    assert get_allocator(" Best-Fit ") is best_fit_allocate
+    with pytest.raises(ValueError):
+        get_allocator("random")
+    with pytest.raises(ValueError):
+        single_screening("Film", 2, 4, allocator="random")
+    assert (
+        load_settings({"GIC_ALLOCATOR": "best-fit"}).allocation.allocator == "best-fit"
+    )
+
+    schedule = parse_schedule(
+        {
+            "screens": [
+                {"name": "1", "rows": 3, "cols": 6},
+                {"name": "2", "rows": 3, "cols": 6, "allocator": "greedy"},
+            ],
+            "screenings": [
+                {"screen": "1", "showtime": "18:00", "title": "Dune"},
+                {"screen": "2", "showtime": "18:00", "title": "Dune"},
+            ],
+        },
+        allocator="best-fit",
+    )
+    svc = BookingService()
+    previews = []
+    for key in (("1", "18:00"), ("2", "18:00")):
+        ctx = AppContext(theater=schedule.materialise(key))
+        schedule.activate(ctx, key)
+        _book(ctx.theater, "A03", "A04")
+        previews.append(_codes(svc.preview_auto(ctx, 3)))
+    assert previews == [["B01", "B02", "B03"], ["A02", "A05", "A01"]]
@@ -0,0 +1,113 @@
+from src.core.allocation import auto_allocate
+from src.core.cluster import ClusterAllocator, FreeSeatPrefix
+from src.core.spacing import SpacingRules
+from src.core.strategies import get_allocator
+from src.models.entities import Theater
+
+
+def _codes(seats):
+    return [s.code() for s in seats]
+
+
+def _aisle_house() -> Theater:
+    """4x10 house with seats 5-6 of every row taken (no row seats eight)."""
+    t = Theater("Film", 4, 10)
+    for r in range(4):
+        t.assign(r, 5, "GIC0001")
+        t.assign(r, 6, "GIC0001")
+    return t
+
+
+def test_prefix_counts_windows() -> None:
+    prefix = FreeSeatPrefix(_aisle_house())
+    assert prefix.refresh() == 4
+    assert prefix.count(0, 1, 4, 10) == 32
+    assert prefix.count(1, 3, 2, 5) == 6
+    assert prefix.is_free(0, 4) and not prefix.is_free(0, 5)
+
+
+def test_prefix_recounts_only_changed_rows() -> None:
+    t = _aisle_house()
+    prefix = FreeSeatPrefix(t)
+    prefix.refresh()
+    t.assign(2, 1, "GIC0002")
+    assert prefix.refresh() == 1
+    assert prefix.refresh() == 0
+    assert prefix.count(0, 1, 4, 10) == 31
+
+    ruled = FreeSeatPrefix(t, SpacingRules(no_behind=True))
+    ruled.refresh()
+    t.assign(2, 2, "GIC0002")
+    assert ruled.refresh() == 3  # rows B-D depend on row C
+
+
+def test_large_party_gets_a_block_instead_of_a_scattered_row() -> None:
+    t = _aisle_house()
+    assert _codes(auto_allocate(t, 8)) == [
+        "A04",
+        "A07",
+        "A03",
+        "A08",
+        "A02",
+        "A09",
+        "A01",
+        "A10",
+    ]
+    assert _codes(ClusterAllocator()(t, 8)) == [
+        "A01",
+        "A02",
+        "A03",
+        "A04",
+        "B01",
+        "B02",
+        "B03",
+        "B04",
+    ]
+
+
+def test_near_rectangle_fills_front_row_first() -> None:
+    assert _codes(ClusterAllocator()(_aisle_house(), 7)) == [
+        "A01",
+        "A02",
+        "A03",
+        "A04",
+        "B01",
+        "B02",
+        "B03",
+    ]
+
+
+def test_party_fitting_one_row_stays_in_it_centred() -> None:
+    assert _codes(ClusterAllocator()(Theater("Film", 3, 10), 4)) == [
+        "A04",
+        "A05",
+        "A06",
+        "A07",
+    ]
+
+
+def test_block_follows_later_commits() -> None:
+    t = _aisle_house()
+    allocate = ClusterAllocator()
+    for seat in allocate(t, 8):
+        t.assign(ord(seat.row) - ord("A"), seat.col, "GIC0002")
+    assert _codes(allocate(t, 8))[:4] == ["A07", "A08", "A09", "A10"]
+
+
+def test_rules_and_fallback() -> None:
+    t = Theater("Film", 2, 6)
+    t.assign(0, 3, "GIC0001")
+    # Gap 1 forbids A02-A04; B02-B05 is the most central free block.
+    assert _codes(ClusterAllocator()(t, 4, SpacingRules(gap=1))) == [
+        "B02",
+        "B03",
+        "B04",
+        "B05",
+    ]
+
+    checker = Theater("Film", 3, 3)
+    for r, c in ((0, 2), (1, 1), (1, 3), (2, 2)):
+        checker.assign(r, c, "GIC0001")
+    assert ClusterAllocator()(checker, 4) == auto_allocate(checker, 4)
+    assert ClusterAllocator()(checker, 6) is None
+    assert get_allocator("cluster")(checker, 0) == []
@@ -0,0 +1,102 @@
+import threading
+
+import pytest
+
+from src.core.allocation import auto_allocate
+from src.core.seat_utils import row_letter_to_index
+from src.core.services.booking import BookingService
+from src.core.services.coalescer import BookingCoalescer
+from src.core.spacing import SpacingRules
+from src.models.context import AppContext
+from src.models.entities import Theater
+
+SIZES = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9, 3]
+
+
+def _serial(rows: int, cols: int, rules=None):
+    """Seats each request of SIZES gets when booked one after another."""
+    t = Theater("Film", rows, cols)
+    out = []
+    for k in SIZES:
+        seats = auto_allocate(t, k, rules)
+        out.append(None if seats is None else [s.code() for s in seats])
+        for s in seats or ():
+            t.assign(row_letter_to_index(s.row), s.col, "X")
+    return out
+
+
+@pytest.mark.parametrize("rules", [None, SpacingRules(gap=1)])
+def test_batches_match_serial_bookings_in_arrival_order(rules) -> None:
+    svc = BookingService(rules=rules)
+    ctx = AppContext(theater=Theater("Film", 4, 12))
+    with BookingCoalescer(svc, max_batch=5) as coalescer:
+        futures = [coalescer.submit(ctx, k) for k in SIZES]
+        results = [f.result(timeout=5) for f in futures]
+    got = [None if b is None else [s.code() for s in b.seats] for b in results]
+    assert got == _serial(4, 12, rules)
+    booked = [b.booking_id for b in results if b is not None]
+    assert booked == sorted(ctx.bookings) == sorted(booked)
+
+
+def test_waiting_requests_are_served_as_one_batch() -> None:
+    svc = BookingService()
+    ctx = AppContext(theater=Theater("Film", 1, 5))
+    gate = threading.Event()
+    deliveries = []
+
+    def slow(events):
+        deliveries.append(len(events))
+        gate.wait(5)
+
+    svc.events.subscribe(slow)
+    with BookingCoalescer(svc) as coalescer:
+        first = coalescer.submit(ctx, 1)
+        while not deliveries:  # worker is inside the first batch
+            threading.Event().wait(0.001)
+        rest = [coalescer.submit(ctx, k) for k in (3, 4, 1, 5)]
+        gate.set()
+        outcomes = [f.result(timeout=5) for f in [first, *rest]]
+    # The party of four cannot be seated but does not hold up the last single.
+    assert [b and len(b.seats) for b in outcomes] == [1, 3, None, 1, None]
+    assert coalescer.batches == 2 and coalescer.requests == 5
+    assert deliveries == [1, 2]  # one delivery per batch
+    assert ctx.theater.available() == 0
+
+
+def test_errors_reach_the_waiters_and_close_is_final() -> None:
+    ctx = AppContext(theater=Theater("Film", 1, 5), allocator="unknown")
+    coalescer = BookingCoalescer(BookingService())
+    with pytest.raises(ValueError):
+        coalescer.book(ctx, 2, timeout=5)
+    coalescer.close()
+    with pytest.raises(RuntimeError):
+        coalescer.submit(ctx, 1)
+    with pytest.raises(ValueError):
+        BookingCoalescer(BookingService(), max_batch=0)
+
+
+def test_requests_are_batched_per_allocator() -> None:
+    svc = BookingService()
+    theater = Theater("Film", 2, 5)
+    greedy = AppContext(theater=theater)
+    other = AppContext(theater=theater, allocator="unknown")
+    gate = threading.Event()
+    deliveries = []
+
+    def slow(events):
+        deliveries.append(len(events))
+        gate.wait(5)
+
+    svc.events.subscribe(slow)
+    with BookingCoalescer(svc) as coalescer:
+        first = coalescer.submit(greedy, 1)
+        while not deliveries:  # worker is inside the first batch
+            threading.Event().wait(0.001)
+        failing = coalescer.submit(other, 2)
+        second = coalescer.submit(greedy, 2)
+        gate.set()
+        assert first.result(timeout=5) is not None
+        assert second.result(timeout=5) is not None
+        with pytest.raises(ValueError):
+            failing.result(timeout=5)
+    assert coalescer.batches == 3
@@ -3,6 +3,12 @@ import pytest
 from src.cli.commands.book import BookCommand
 from src.cli.commands.check import CheckCommand
 from src.cli.commands.exit import ExitCommand
+from src.cli.dashboard import Dashboard
+from src.cli.registry import get_commands
+from src.core.export import Exporter
+from src.core.profiling import Profiler
+from src.core.schedule import single_screening
+from src.core.search import SeatSearchIndex
 from src.core.services.booking import BookingService
 from src.core.renderers.ascii_renderer import AsciiRenderer
 from src.models.context import AppContext
@@ -45,7 +51,7 @@ def test_check_command_renders_when_found(script_io_factory) -> None:
 def test_exit_display_label() -> None:
     ctx = AppContext(theater=Theater("Film", 1, 1))
     cmd = ExitCommand()
-    assert cmd.display_label(ctx).startswith("[3] Exit")
+    assert cmd.display_label(ctx).startswith("[10] Exit")
 
 
 def test_exit_command_exits_with_message(script_io_factory) -> None:
@@ -60,3 +66,21 @@ def test_exit_command_exits_with_message(script_io_factory) -> None:
     assert any(
         "Thank you for using GIC Cinemas system. Bye!" in out for out in io.outputs
     )
+
+
+def test_menu_is_numbered_in_order_with_exit_last() -> None:
+    schedule = single_screening("Inception", 2, 4)
+    service = BookingService()
+    search = SeatSearchIndex(schedule, service.events)
+    commands = get_commands(
+        renderer=AsciiRenderer(),
+        service=service,
+        profiler=Profiler(),
+        dashboard=Dashboard(service, screens=list),
+        schedule=schedule,
+        search=search,
+        exporter=Exporter(schedule),
+    )
+    search.close()
+    assert [c.meta.key for c in commands] == [str(i) for i in range(1, 11)]
+    assert isinstance(commands[-1], ExitCommand)
@@ -0,0 +1,66 @@
+import pytest
+
+from src.app import run_app
+from src.config import ProfileSettings, Settings, TraceSettings, load_settings
+
+
+def test_defaults_when_environment_is_empty() -> None:
+    assert load_settings({}) == Settings()
+
+
+def test_trace_settings_are_parsed() -> None:
+    s = load_settings(
+        {
+            "GIC_TRACE_FILE": "t.jsonl",
+            "GIC_TRACE_SAMPLE": "0.25",
+            "GIC_TRACE_QUEUE": "8",
+        }
+    )
+    assert s.tracing == TraceSettings("t.jsonl", 0.25, 8)
+
+
+def test_profile_settings_are_parsed() -> None:
+    s = load_settings(
+        {"GIC_PROFILE": "4", "GIC_PROFILE_MODE": "mem", "GIC_PROFILE_DIR": "/tmp"}
+    )
+    assert s.profiling == ProfileSettings(4, False, True, "/tmp")
+
+
+def test_renderer_setting_is_normalised() -> None:
+    assert load_settings({"GIC_RENDERER": " JSON "}).rendering.renderer == "json"
+
+
+def test_layout_path_is_read() -> None:
+    assert load_settings({"GIC_LAYOUT": "hall.txt"}).layout_path == "hall.txt"
+
+
+def test_schedule_path_is_read() -> None:
+    assert load_settings({"GIC_SCHEDULE": "week.json"}).schedule_path == "week.json"
+
+
+@pytest.mark.parametrize(
+    "env",
+    [
+        {"GIC_TRACE_SAMPLE": "2"},
+        {"GIC_TRACE_SAMPLE": "x"},
+        {"GIC_TRACE_QUEUE": "0"},
+        {"GIC_PROFILE": "2", "GIC_PROFILE_MODE": "gpu"},
+        {"GIC_RENDERER": "html"},
+    ],
+)
+def test_invalid_values_raise(env: dict) -> None:
+    with pytest.raises(ValueError):
+        load_settings(env)
+
+
+def test_invalid_setting_stops_startup_with_one_line(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setenv("GIC_RENDERER", "html")
+    with pytest.raises(SystemExit) as ei:
+        run_app()
+    assert ei.value.code == 1
+    out = capsys.readouterr().out
+    assert (
+        out == "Invalid configuration: GIC_RENDERER must be one of: ascii, json, rle.\n"
+    )
@@ -0,0 +1,65 @@
+import io
+import time
+
+from src.cli.commands.dashboard import DashboardCommand
+from src.cli.dashboard import Dashboard
+from src.core.renderers.diff import screen_patch
+from src.core.services.booking import BookingService
+from src.models.context import AppContext
+from src.models.entities import Seat, Theater
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def test_screen_patch_rewrites_changed_cells_only() -> None:
+    assert screen_patch(None, "ab\ncd").startswith("\x1b[H\x1b[2J")
+    assert screen_patch("ab\ncd", "ab\ncd") == ""
+    assert screen_patch("ab\n. . . .", "ab\n. o o .") == "\x1b[2;3Ho o\x1b[3;1H"
+    assert screen_patch("x: 10\ny", "x: 9\ny") == "\x1b[1;4H9\x1b[K\x1b[3;1H"
+    assert screen_patch("a\nb", "a\nb\nc").startswith("\x1b[H\x1b[2J")
+
+
+def test_dashboard_redraws_on_commit_only() -> None:
+    service = BookingService()
+    ctx = AppContext(theater=Theater("Film", 2, 4))
+    out = io.StringIO()
+    dash = Dashboard(service, screens=lambda: [("Film", ctx.theater)], min_interval=0.0)
+    dash.start(out, "test")
+    try:
+        assert _wait_for(lambda: dash.frames == 1)
+        assert "Film: 8 of 8 seats available" in out.getvalue()
+        time.sleep(0.05)
+        assert dash.frames == 1  # idle: no redraws without commits
+
+        mark = len(out.getvalue())
+        service.commit_booking(ctx, "GIC0001", [Seat("A", 2), Seat("A", 3)])
+        assert _wait_for(lambda: dash.frames == 2)
+        patch = out.getvalue()[mark:]
+        assert "\x1b[2J" not in patch
+        assert "6" in patch and "# #" in patch
+    finally:
+        dash.stop()
+    assert not dash.running
+    service.commit_booking(ctx, "GIC0002", [Seat("B", 1)])  # unsubscribed
+
+
+def test_dashboard_command_toggles(script_io_factory, tmp_path) -> None:
+    ctx = AppContext(theater=Theater("Film", 2, 4))
+    dash = Dashboard(BookingService(), screens=lambda: [("Film", ctx.theater)])
+    cmd = DashboardCommand(dash)
+    target = str(tmp_path / "lobby.txt")
+    io_ = script_io_factory([str(tmp_path / "missing" / "x"), target])
+    cmd.run(ctx, io_)
+    assert any(out.startswith("Cannot open") for out in io_.outputs)
+    assert cmd.display_label(ctx) == f"[4] Live dashboard (live on {target})"
+    assert _wait_for(lambda: dash.frames == 1)
+    cmd.run(ctx, script_io_factory([]))
+    assert cmd.display_label(ctx) == "[4] Live dashboard"
+    assert "Film: 8 of 8 seats available" in open(target, encoding="utf-8").read()
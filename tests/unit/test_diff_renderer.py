@@ -0,0 +1,56 @@
+from src.cli.commands.book import BookCommand
+from src.core.renderers.ascii_renderer import AsciiRenderer
+from src.core.renderers.diff import DiffRenderer
+from src.core.services.booking import BookingService
+from src.models.context import AppContext
+from src.models.entities import Seat, Theater
+
+
+def _frames() -> tuple[str, str]:
+    t = Theater("Film", 3, 4)
+    r = AsciiRenderer()
+    return (
+        r.seat_map(t, preview_seats=[Seat("A", 2), Seat("A", 3)]),
+        r.seat_map(t, preview_seats=[Seat("C", 2), Seat("C", 3)]),
+    )
+
+
+def test_text_mode_sends_changed_rows_only() -> None:
+    old, new = _frames()
+    update = DiffRenderer().update(old, new)
+    assert not update.full
+    assert update.text.splitlines() == ["C  . o o .", "A  . . . ."]
+
+
+def test_full_frame_when_nothing_to_diff_against() -> None:
+    old, new = _frames()
+    assert DiffRenderer().update(None, new).full
+    bigger = AsciiRenderer().seat_map(Theater("Film", 4, 4))
+    assert DiffRenderer().update(old, bigger).full
+
+
+def test_ansi_mode_rewrites_lines_in_place() -> None:
+    old, new = _frames()  # 6 lines: header, divider, C, B, A, footer
+    update = DiffRenderer(ansi=True).update(old, new, lines_below=3)
+    # Cursor at line 9; C is line 2, A is line 4; finish on line 8.
+    assert update.text == (
+        "\x1b[7F\x1b[2KC  . o o ." "\x1b[2E\x1b[2KA  . . . ." "\x1b[4E"
+    )
+    assert not update.full
+
+
+def test_ansi_falls_back_when_frame_scrolled_away() -> None:
+    old, new = _frames()
+    assert (
+        DiffRenderer(ansi=True).update(old, new, lines_below=30, screen_height=24).full
+    )
+
+
+def test_book_reseat_prints_only_changed_rows(script_io_factory) -> None:
+    io = script_io_factory(["2", "C01", ""])
+    ctx = AppContext(theater=Theater("Film", 3, 4))
+    BookCommand(renderer=AsciiRenderer(), service=BookingService()).run(ctx, io)
+
+    after = io.outputs[io.outputs.index("Updated selection:") + 1]
+    assert after == "C  o o . .\nA  . . . ."
+    assert ctx.bookings["GIC0001"].seats == [Seat("C", 1), Seat("C", 2)]
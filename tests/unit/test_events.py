@@ -0,0 +1,79 @@
+import threading
+
+import pytest
+
+from src.core.errors import NotFound
+from src.core.events import (
+    BookingCancelled,
+    BookingCommitted,
+    EventBus,
+    SeatRange,
+    seat_ranges,
+)
+from src.core.services.booking import BookingService
+from src.models.context import AppContext
+from src.models.entities import Seat, Theater
+
+
+def test_seat_ranges_collapse_runs_per_row() -> None:
+    seats = [Seat("B", 2), Seat("A", 4), Seat("A", 3), Seat("A", 6), Seat("B", 1)]
+    assert seat_ranges(seats) == (
+        SeatRange("A", 3, 4),
+        SeatRange("A", 6, 6),
+        SeatRange("B", 1, 2),
+    )
+
+
+def test_commit_and_cancel_publish_typed_events() -> None:
+    service = BookingService()
+    ctx = AppContext(theater=Theater("Film", 2, 5))
+    seen = []
+    service.events.subscribe(seen.extend)
+    cancelled = []
+    service.events.subscribe(cancelled.extend, BookingCancelled)
+
+    service.commit_booking(ctx, "GIC0001", [Seat("A", 2), Seat("A", 3)])
+    service.cancel_booking(ctx, "GIC0001")
+
+    assert seen == [
+        BookingCommitted("Film", "GIC0001", (SeatRange("A", 2, 3),), 2),
+        BookingCancelled("Film", "GIC0001", (SeatRange("A", 2, 3),), 4),
+    ]
+    assert cancelled == seen[1:]
+    assert ctx.theater.available() == 10 and "GIC0001" not in ctx.bookings
+    with pytest.raises(NotFound):
+        service.cancel_booking(ctx, "GIC0001")
+
+
+def test_transaction_delivers_one_batch() -> None:
+    service = BookingService()
+    ctx = AppContext(theater=Theater("Film", 2, 5))
+    calls = []
+    service.events.subscribe(lambda events: calls.append(list(events)))
+    with service.transaction():
+        service.commit_booking(ctx, "GIC0001", [Seat("A", 1)])
+        with service.transaction():
+            service.commit_booking(ctx, "GIC0002", [Seat("B", 1)])
+        assert calls == []
+    assert [[e.booking_id for e in batch] for batch in calls] == [
+        ["GIC0001", "GIC0002"]
+    ]
+
+
+def test_queued_subscriber_runs_off_thread_and_flushes_on_close() -> None:
+    bus = EventBus()
+    threads, got = [], []
+
+    def handler(events) -> None:
+        threads.append(threading.current_thread())
+        got.extend(events)
+
+    sub = bus.subscribe_queued(handler, BookingCommitted, maxsize=2)
+    for i in range(5):
+        bus.publish(BookingCommitted("Film", f"GIC{i:04d}", (), i))
+    bus.publish(BookingCancelled("Film", "GIC0000", (), 9))  # filtered out
+    bus.unsubscribe(sub)
+    assert [e.version for e in got] == [0, 1, 2, 3, 4]
+    assert threading.current_thread() not in threads
+    bus.publish(BookingCommitted("Film", "GIC0009", (), 9))
+    assert len(got) == 5
@@ -0,0 +1,121 @@
+import csv
+import gzip
+import json
+from typing import Iterator
+
+import pytest
+
+from src.cli.commands.export import ExportCommand
+from src.core.export import (
+    BOOKING_FIELDS,
+    REPORTS,
+    Exporter,
+    Record,
+    booking_records,
+    export_format,
+    export_report,
+    occupancy_records,
+)
+from src.core.services.booking import BookingService
+from src.core.validators import parse_export_request
+from src.models.context import AppContext
+from src.models.schedule import Schedule
+
+
+def _schedule() -> Schedule:
+    """Two screenings on screen 1 (one opened, with bookings) and one on 2."""
+    schedule = Schedule()
+    schedule.add_auditorium("1", 3, 5)
+    schedule.add_auditorium("2", 2, 4)
+    schedule.add_screening("1", "Mon 19:30", "Inception")
+    schedule.add_screening("1", "Mon 22:00", "Dune")
+    schedule.add_screening("2", "Mon 20:00", "Up")
+    ctx = AppContext(theater=schedule.materialise(("1", "Mon 19:30")))
+    schedule.activate(ctx, ("1", "Mon 19:30"))
+    svc = BookingService()
+    for k in (2, 3):
+        svc.commit_booking(ctx, ctx.generate_booking_id(), svc.preview_auto(ctx, k))
+    return schedule
+
+
+def test_booking_records_stream_bookings_in_order() -> None:
+    records = list(booking_records(_schedule()))
+    assert [r[:5] for r in records] == [
+        ("1", "Mon 19:30", "Inception", "GIC0001", 2),
+        ("1", "Mon 19:30", "Inception", "GIC0002", 3),
+    ]
+    assert records[0][5] == ["A03", "A02"]
+
+
+def test_occupancy_records_cover_unopened_screenings() -> None:
+    schedule = _schedule()
+    rows = list(occupancy_records(schedule))
+    assert rows[0] == ("1", "Mon 19:30", "Inception", 15, 5, 10, 0.3333, 2)
+    assert rows[1] == ("1", "Mon 22:00", "Dune", 15, 0, 15, 0.0, 0)
+    assert schedule.screenings[("2", "Mon 20:00")].theater is None
+
+
+def test_export_csv_and_gzip_jsonl(tmp_path) -> None:
+    schedule = _schedule()
+    out = tmp_path / "bookings.csv"
+    assert export_report(schedule, "bookings", str(out)) == 2
+    with open(out, newline="", encoding="utf-8") as fh:
+        rows = list(csv.DictReader(fh))
+    assert rows[1]["booking_id"] == "GIC0002"
+    assert rows[0]["seat_codes"] == "A03 A02"
+
+    gz = tmp_path / "occupancy.jsonl.gz"
+    assert export_report(schedule, "occupancy", str(gz)) == 3
+    with gzip.open(gz, "rt", encoding="utf-8") as fh:
+        lines = [json.loads(line) for line in fh]
+    assert lines[0]["sold"] == 5 and lines[2]["screen"] == "2"
+    assert not list(tmp_path.glob("*.partial"))
+
+
+def test_export_format_and_request_parsing() -> None:
+    assert export_format("a.CSV") == "csv"
+    assert export_format("dir/a.jsonl.gz") == "jsonl"
+    with pytest.raises(ValueError):
+        export_format("a.txt")
+    assert parse_export_request("Bookings my dump.csv") == ("bookings", "my dump.csv")
+    with pytest.raises(ValueError):
+        parse_export_request("seats out.csv")
+    with pytest.raises(ValueError):
+        parse_export_request("bookings")
+
+
+def test_failed_export_leaves_no_file(tmp_path) -> None:
+    exporter = Exporter(_schedule())
+    exporter.start("bookings", str(tmp_path / "missing" / "out.csv"))
+    result = exporter.wait()
+    assert result is not None and result.error is not None
+    assert not list(tmp_path.rglob("*.partial"))
+
+
+def test_export_command_runs_in_background(script_io_factory, tmp_path) -> None:
+    exporter = Exporter(_schedule())
+    cmd = ExportCommand(exporter)
+    ctx = AppContext(theater=_schedule().materialise(("1", "Mon 19:30")))
+    path = tmp_path / "b.jsonl"
+    io = script_io_factory(["bookings out.txt", f"bookings {path}"])
+    cmd.run(ctx, io)
+    assert "Export file must end in .csv or .jsonl (optionally .gz)." in io.outputs
+    assert io.outputs[-1] == f"Exporting bookings to {path} in the background."
+    result = exporter.wait()
+    assert result is not None and result.records == 2
+    assert cmd.display_label(ctx) == (
+        f"[9] Export bookings or occupancy (last: {result.describe()})"
+    )
+    assert path.read_text(encoding="utf-8").count("\n") == 2
+
+
+def test_unexpected_export_error_is_recorded(tmp_path, monkeypatch) -> None:
+    def broken(schedule: Schedule) -> Iterator[Record]:
+        raise KeyError("boom")
+
+    monkeypatch.setitem(REPORTS, "bookings", (BOOKING_FIELDS, broken))
+    exporter = Exporter(_schedule())
+    exporter.start("bookings", str(tmp_path / "out.csv"))
+    result = exporter.wait()
+    assert result is not None and result.error == "'boom'"
+    assert not list(tmp_path.iterdir())
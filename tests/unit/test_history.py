@@ -0,0 +1,102 @@
+from src.cli.commands.redo import RedoCommand
+from src.cli.commands.undo import UndoCommand
+from src.core.events import BookingCancelled, BookingCommitted
+from src.core.history import COMMIT, OperationLog
+from src.core.search import SeatSearchIndex
+from src.core.services.booking import BookingService
+from src.models.context import AppContext
+from src.models.entities import Seat, Theater
+from src.models.schedule import Schedule
+
+
+def _snapshot(ctx: AppContext):
+    return [row[:] for row in ctx.theater.grid], dict(ctx.bookings)
+
+
+def test_undo_and_redo_restore_grid_and_registry() -> None:
+    svc = BookingService()
+    ctx = AppContext(theater=Theater("Film", 2, 5))
+    events = []
+    svc.events.subscribe(events.extend)
+    empty = _snapshot(ctx)
+    svc.commit_booking(ctx, "GIC0001", svc.preview_auto(ctx, 3))
+    svc.commit_booking(ctx, "GIC0002", svc.preview_auto(ctx, 4))
+    booked = _snapshot(ctx)
+    svc.cancel_booking(ctx, "GIC0001")
+
+    assert svc.undo().describe() == "cancellation of GIC0001"
+    assert _snapshot(ctx) == booked
+    assert svc.undo().describe() == "booking GIC0002"
+    assert svc.undo().describe() == "booking GIC0001"
+    assert _snapshot(ctx) == empty and ctx.theater.available() == 10
+    assert svc.undo() is None
+
+    assert svc.redo().kind == COMMIT
+    svc.redo()
+    assert _snapshot(ctx) == booked
+    assert [type(e) for e in events[-5:]] == [
+        BookingCommitted,
+        BookingCancelled,
+        BookingCancelled,
+        BookingCommitted,
+        BookingCommitted,
+    ]
+
+    # A new operation forgets what could still be redone.
+    svc.cancel_booking(ctx, "GIC0002")
+    assert svc.history.next_redo() is None and svc.redo() is None
+
+
+def test_history_is_bounded() -> None:
+    svc = BookingService(history=2)
+    ctx = AppContext(theater=Theater("Film", 1, 5))
+    for i in range(1, 5):
+        svc.commit_booking(ctx, f"GIC000{i}", [Seat("A", i)])
+    assert svc.undo().booking.booking_id == "GIC0004"
+    assert svc.undo().booking.booking_id == "GIC0003"
+    assert svc.undo() is None
+    assert sorted(ctx.bookings) == ["GIC0001", "GIC0002"]
+    assert OperationLog(0).undo() is None
+
+
+def test_undo_reaches_its_screening_and_keeps_the_index_current() -> None:
+    schedule = Schedule()
+    schedule.add_auditorium("1", 1, 6)
+    schedule.add_screening("1", "18:00", "Dune")
+    schedule.add_screening("1", "21:00", "Dune")
+    svc = BookingService()
+    index = SeatSearchIndex(schedule, svc.events)
+    ctx = AppContext(theater=schedule.materialise(("1", "18:00")))
+    schedule.activate(ctx, ("1", "18:00"))
+    svc.commit_booking(ctx, ctx.generate_booking_id(), svc.preview_auto(ctx, 4))
+    early = ctx.theater
+    schedule.activate(ctx, ("1", "21:00"))
+    assert index.longest(("1", "18:00")) == 1
+
+    svc.undo()
+    assert early.available() == 6 and ctx.theater.available() == 6
+    assert index.longest(("1", "18:00")) == 6
+    assert schedule.screenings[("1", "18:00")].bookings == {}
+
+
+def test_undo_and_redo_commands(script_io_factory) -> None:
+    svc = BookingService()
+    ctx = AppContext(theater=Theater("Film", 1, 4))
+    undo, redo = UndoCommand(svc), RedoCommand(svc)
+    assert undo.display_label(ctx) == "[7] Undo (nothing to undo)"
+    svc.commit_booking(ctx, "GIC0001", [Seat("A", 1)])
+    assert undo.display_label(ctx) == "[7] Undo (booking GIC0001)"
+
+    io = script_io_factory([])
+    undo.run(ctx, io)
+    undo.run(ctx, io)
+    assert redo.display_label(ctx) == "[8] Redo (booking GIC0001)"
+    redo.run(ctx, io)
+    redo.run(ctx, io)
+    assert io.outputs == [
+        "Undid booking GIC0001 (Film).",
+        "Nothing to undo.",
+        "Redid booking GIC0001 (Film).",
+        "Nothing to redo.",
+    ]
+    assert ctx.theater.grid[0][0] == "GIC0001"
@@ -0,0 +1,102 @@
+import json
+
+import pytest
+
+from src.core.allocation import auto_allocate, compile_layout, manual_allocate
+from src.core.layout import load_layout, parse_layout_json, parse_layout_text
+from src.core.renderers.ascii_renderer import AsciiRenderer
+from src.core.renderers.rle_renderer import RleRenderer
+from src.core.validators import validate_start_seat
+from src.models.entities import Seat, Theater
+from src.models.layout import BLOCKED, MISSING, Layout
+
+TEXT = """\
+# front row first
+ ....
+..x...
+ww....
+"""
+
+
+def test_text_layout_is_parsed_and_padded() -> None:
+    layout = parse_layout_text(TEXT)
+    assert (layout.rows, layout.cols) == (3, 6)
+    assert layout.missing == {(0, 1), (0, 6)}
+    assert layout.blocked == {(1, 3)}
+    assert layout.wheelchair == {(2, 1), (2, 2)}
+    assert layout.sellable() == 15
+
+
+def test_json_layout_matches_text(tmp_path) -> None:
+    data = {
+        "rows": 3,
+        "cols": 6,
+        "missing": ["A01", "A06"],
+        "blocked": ["B03"],
+        "wheelchair": ["C01", "C02"],
+    }
+    path = tmp_path / "hall.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert load_layout(str(path)) == parse_layout_text(TEXT)
+
+
+@pytest.mark.parametrize("text", ["", "..?..", "\n".join(["."] * 703)])
+def test_bad_text_layouts_raise(text: str) -> None:
+    with pytest.raises(ValueError):
+        parse_layout_text(text)
+
+
+def test_overlapping_positions_raise() -> None:
+    with pytest.raises(ValueError):
+        parse_layout_json(
+            {"rows": 1, "cols": 2, "missing": ["A01"], "blocked": ["A01"]}
+        )
+
+
+def test_theater_grid_holds_sentinels() -> None:
+    t = Theater("Hall", 3, 6, layout=parse_layout_text(TEXT))
+    assert t.grid[0][0] is MISSING and t.grid[1][2] is BLOCKED
+    assert t.capacity() == t.available() == 15
+    assert t.row_free == [4, 5, 6]
+    with pytest.raises(ValueError):
+        Theater("Hall", 4, 6, layout=parse_layout_text(TEXT))
+
+
+def test_compiled_orders_skip_blocked_and_defer_wheelchair() -> None:
+    layout = parse_layout_text(TEXT)
+    assert compile_layout(layout) == ((3, 4, 2, 5), (4, 2, 5, 1, 6), (3, 4, 5, 6, 2, 1))
+    assert compile_layout(layout) is compile_layout(parse_layout_text(TEXT))
+
+
+def test_allocators_never_pick_missing_or_blocked_seats() -> None:
+    t = Theater("Hall", 3, 6, layout=parse_layout_text(TEXT))
+    seats = auto_allocate(t, 15)
+    assert len(seats) == 15
+    assert {(s.row, s.col) for s in seats}.isdisjoint({("A", 1), ("A", 6), ("B", 3)})
+    assert [s.code() for s in seats[-2:]] == ["C02", "C01"]
+    assert [s.code() for s in manual_allocate(t, 3, Seat("B", 2))] == [
+        "B02",
+        "B04",
+        "B05",
+    ]
+
+
+def test_start_seat_must_exist_and_be_sellable() -> None:
+    t = Theater("Hall", 3, 6, layout=parse_layout_text(TEXT))
+    with pytest.raises(ValueError, match="no seat A01"):
+        validate_start_seat(t, Seat("A", 1))
+    with pytest.raises(ValueError, match="not available"):
+        validate_start_seat(t, Seat("B", 3))
+
+
+def test_renderers_show_layout() -> None:
+    t = Theater("Hall", 3, 6, layout=parse_layout_text(TEXT))
+    lines = AsciiRenderer().seat_map(t).split("\n")
+    assert lines[2:5] == ["C  w w . . . .", "B  . . x . . .", "A    . . . .  "]
+    t.assign(2, 1, "GIC0001")
+    assert AsciiRenderer().seat_map(t).split("\n")[2] == "C  # w . . . ."
+    assert RleRenderer().seat_map(t).split("\n")[2:] == [
+        "A: 1_ 4. 1_",
+        "B: 2. 1x 3.",
+        "C: 1# 5.",
+    ]
@@ -0,0 +1,85 @@
+import json
+
+import pytest
+
+from src.core.renderers.ascii_renderer import AsciiRenderer
+from src.core.renderers.base import StreamingRenderer, Viewport, render_map
+from src.core.renderers.factory import make_renderer
+from src.core.renderers.json_renderer import JsonRenderer
+from src.core.renderers.rle_renderer import RleRenderer
+from src.models.entities import Seat, Theater
+
+
+def _theater() -> Theater:
+    t = Theater("Film", 3, 10)
+    for col in (3, 4, 5, 6):
+        t.assign(0, col, "GIC0001")
+    for col in (1, 2):
+        t.assign(1, col, "GIC0002")
+    return t
+
+
+def test_rle_encodes_rows_front_to_back() -> None:
+    out = RleRenderer().seat_map(_theater(), current_booking_id="GIC0001")
+    assert out.split("\n") == [
+        "screen: Film",
+        "size: 3x10",
+        "A: 2. 4o 4.",
+        "B: 2# 8.",
+        "C: 10.",
+    ]
+
+
+def test_rle_preview_overrides_occupants() -> None:
+    out = RleRenderer().seat_map(_theater(), preview_seats=[Seat("C", 9), Seat("A", 3)])
+    assert out.split("\n")[2:] == ["A: 2. 1o 3# 4.", "B: 2# 8.", "C: 8. 1o 1."]
+
+
+def test_json_matches_rle_runs() -> None:
+    t = _theater()
+    doc = json.loads(JsonRenderer().seat_map(t, current_booking_id="GIC0002"))
+    assert doc == {
+        "screen": "Film",
+        "rows": 3,
+        "cols": 10,
+        "map": {
+            "A": [[2, "."], [4, "#"], [4, "."]],
+            "B": [[2, "o"], [8, "."]],
+            "C": [[10, "."]],
+        },
+    }
+
+
+@pytest.mark.parametrize("renderer", [JsonRenderer(), RleRenderer()])
+def test_streamed_chunks_join_to_seat_map(renderer: StreamingRenderer) -> None:
+    t = _theater()
+    chunks = list(renderer.iter_seat_map(t, "GIC0001", [Seat("C", 1)]))
+    assert len(chunks) <= t.rows + 2
+    assert "".join(chunks) == renderer.seat_map(t, "GIC0001", [Seat("C", 1)])
+
+
+def test_viewports_encode_only_the_window() -> None:
+    t = _theater()
+    window = Viewport(0, 2, 2, 6)
+    assert RleRenderer().viewport(t, window).split("\n")[2:] == [
+        "window: A-B 3-6",
+        "A: 4#",
+        "B: 4.",
+    ]
+    doc = json.loads(JsonRenderer().viewport(t, window, preview_seats=[Seat("B", 3)]))
+    assert doc["window"] == {"rows": ["A", "B"], "seats": [3, 6]}
+    assert doc["map"] == {"A": [[4, "#"]], "B": [[1, "o"], [3, "."]]}
+
+
+def test_large_house_goes_through_viewport() -> None:
+    t = Theater("Big", 26, 60)
+    out = json.loads(render_map(JsonRenderer(), t, max_rows=4, max_cols=10))
+    assert len(out["map"]) == 4
+    assert all(runs == [[10, "."]] for runs in out["map"].values())
+
+
+def test_make_renderer_selects_by_name() -> None:
+    assert isinstance(make_renderer("ascii"), AsciiRenderer)
+    assert isinstance(make_renderer("RLE"), RleRenderer)
+    with pytest.raises(ValueError):
+        make_renderer("html")
@@ -0,0 +1,30 @@
+import pytest
+
+from benchmarks.memory_footprint import compare, deep_sizeof, installed_backends, run
+
+
+def test_deep_sizeof_counts_shared_objects_once() -> None:
+    shared = [0] * 100
+    assert deep_sizeof([shared, shared]) < 2 * deep_sizeof(shared)
+
+
+def test_run_reports_per_seat_and_per_booking_bytes() -> None:
+    empty, full = run(["grid"], sizes=[(4, 6)], occupancies=[0.0, 0.75])
+    assert empty.bookings == 0 and empty.booking_bytes == 0.0
+    assert empty.seat_bytes > 0 and full.bookings > 0 and full.booking_bytes > 0
+
+
+def test_compare_flags_growth_beyond_tolerance() -> None:
+    (m,) = run(["grid"], sizes=[(4, 6)], occupancies=[0.5])
+    baseline = {
+        m.key: {"seat_bytes": m.seat_bytes / 2, "booking_bytes": m.booking_bytes}
+    }
+    problems = compare([m], baseline)
+    assert len(problems) == 1 and "seat_bytes" in problems[0]
+
+
+def test_numpy_backend_is_measured_when_installed() -> None:
+    pytest.importorskip("numpy")
+    assert "numpy" in installed_backends()
+    (m,) = run(backends=["numpy"], sizes=[(4, 6)], occupancies=[0.5])
+    assert m.key == "numpy:4x6@0.5" and m.bookings > 0
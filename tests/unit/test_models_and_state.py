@@ -19,8 +19,8 @@ def test_theater_capacity_and_available() -> None:
     assert t.available() == 12
 
     # occupy a couple of seats
-    t.grid[0][0] = "GIC0001"
-    t.grid[2][3] = "GIC0002"
+    t.assign(0, 1, "GIC0001")
+    t.assign(2, 4, "GIC0002")
     assert t.available() == 10
 
 
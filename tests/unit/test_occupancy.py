@@ -0,0 +1,74 @@
+import sys
+
+import pytest
+
+from src.config import load_settings
+from src.core.layout import parse_layout_text
+from src.core.occupancy import occupancy_factory
+from src.core.renderers.ascii_renderer import AsciiRenderer
+from src.core.renderers.base import grid_symbols, render_map
+from src.models.entities import Theater
+from src.models.schedule import Schedule
+
+LAYOUT = parse_layout_text(" ..x\n....\n")
+
+
+def _theater(occupancy=None) -> Theater:
+    factory = occupancy_factory(occupancy) if occupancy else None
+    t = Theater(
+        "Hall", 2, 4, layout=LAYOUT, occupancy=factory(2, 4) if factory else None
+    )
+    t.assign(1, 2, "GIC0001")
+    t.assign(1, 3, "GIC0001")
+    t.assign(0, 2, "GIC0002")
+    return t
+
+
+def test_list_backend_keeps_the_plain_grid() -> None:
+    assert occupancy_factory(" LIST ") is None
+    t = _theater()
+    assert t.occupancy is None
+    assert t.seats_of("GIC0001") == [(1, 2), (1, 3)]
+    assert t.seats_of("GIC9999") == []
+    assert grid_symbols(t, "GIC0001") == ["_#.x", ".oo."]
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        occupancy_factory("arrow")
+    with pytest.raises(ValueError):
+        load_settings({"GIC_OCCUPANCY": "arrow"})
+    assert load_settings({"GIC_OCCUPANCY": "NumPy"}).allocation.occupancy == "numpy"
+
+
+def test_missing_numpy_is_reported(monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    monkeypatch.delitem(sys.modules, "src.core.numpy_occupancy", raising=False)
+    with pytest.raises(ImportError, match="numpy"):
+        occupancy_factory("numpy")
+
+
+def test_numpy_backend_matches_the_grid() -> None:
+    pytest.importorskip("numpy")
+    plain, arrays = _theater(), _theater("numpy")
+    assert arrays.available() == plain.available() == 3
+    assert arrays.occupancy.row_free_counts() == arrays.row_free == [1, 2]
+    assert arrays.seats_of("GIC0001") == plain.seats_of("GIC0001")
+    assert grid_symbols(arrays, "GIC0001") == grid_symbols(plain, "GIC0001")
+    assert render_map(AsciiRenderer(), arrays, "GIC0002") == render_map(
+        AsciiRenderer(), plain, "GIC0002"
+    )
+
+    arrays.assign(1, 2, None)
+    assert arrays.available() == 4
+    assert arrays.seats_of("GIC0001") == [(1, 3)]
+
+
+def test_schedule_attaches_the_selected_backend() -> None:
+    pytest.importorskip("numpy")
+    schedule = Schedule(occupancy=occupancy_factory("numpy"))
+    schedule.add_auditorium("1", 2, 4, LAYOUT)
+    schedule.add_screening("1", "18:00", "Hall")
+    t = schedule.materialise(("1", "18:00"))
+    assert t.occupancy is not None
+    assert t.available() == t.capacity() == 6
@@ -0,0 +1,92 @@
+import random
+
+from src.cli.commands.book import BookCommand
+from src.core.allocation import auto_allocate
+from src.core.layout import parse_layout_text
+from src.core.preview import PreviewTable, greedy_sequence, largest_group
+from src.core.renderers.ascii_renderer import AsciiRenderer
+from src.core.seat_utils import seat_pool
+from src.core.services.booking import BookingService
+from src.core.spacing import SpacingRules
+from src.models.context import AppContext
+from src.models.entities import Theater
+
+
+def _codes(seats):
+    return None if seats is None else [s.code() for s in seats]
+
+
+def test_greedy_sequence_prefixes_match_auto_allocate() -> None:
+    rng = random.Random(7)
+    layout = parse_layout_text(" .....w.\n........\n..xx....\n........\n")
+    for rules in (None, SpacingRules(gap=1), SpacingRules(no_behind=True)):
+        t = Theater("Film", 4, 8, layout=layout)
+        for _ in range(8):
+            r, c = rng.randrange(4), rng.randint(1, 8)
+            if t.grid[r][c - 1] is None:
+                t.assign(r, c, "GIC0001")
+        table = PreviewTable(t, "greedy", rules)
+        for k in range(1, t.available() + 1):
+            assert _codes(table.preview(k)) == _codes(auto_allocate(t, k, rules))
+
+
+def test_table_is_built_once_per_grid_version() -> None:
+    ctx = AppContext(theater=Theater("Film", 2, 5))
+    svc = BookingService()
+    table = svc.preview_table(ctx)
+    assert _codes(svc.preview_auto(ctx, 2)) == ["A03", "A02"]
+    assert _codes(svc.preview_auto(ctx, 7)) == [
+        "A03",
+        "A02",
+        "A04",
+        "A01",
+        "A05",
+        "B03",
+        "B02",
+    ]
+    assert svc.preview_table(ctx) is table
+
+    svc.commit_booking(ctx, "GIC0001", svc.preview_auto(ctx, 3))
+    assert svc.preview_table(ctx) is not table
+    assert _codes(svc.preview_auto(ctx, 2)) == ["A01", "A05"]
+
+    ctx.allocator = "best-fit"
+    assert _codes(svc.preview_auto(ctx, 2)) == ["B01", "B02"]
+    assert svc.preview_table(ctx).allocator == "best-fit"
+
+
+def test_memoised_previews_are_copies() -> None:
+    table = PreviewTable(Theater("Film", 2, 5), "cluster")
+    first = table.preview(3)
+    first.clear()
+    assert _codes(table.preview(3)) == ["A02", "A03", "A04"]
+    assert table.preview(11) is None
+
+
+def test_largest_group_and_menu_label() -> None:
+    t = Theater("Inception", 2, 6)
+    for c in (3, 4):
+        t.assign(0, c, "GIC0001")
+    t.assign(1, 2, "GIC0002")
+    assert largest_group(t) == 4
+    assert largest_group(t, SpacingRules(gap=1)) == 3
+    assert largest_group(Theater("Film", 1, 1)) == 1
+
+    cmd = BookCommand(renderer=AsciiRenderer(), service=BookingService())
+    assert cmd.display_label(AppContext(theater=t)) == (
+        "[1] Book tickets for Inception (9 seats available) [max 4 together]"
+    )
+
+
+def test_greedy_previews_read_only_as_far_as_needed() -> None:
+    t = Theater("Film", 702, 997)
+    table = PreviewTable(t, "greedy")
+    assert _codes(table.preview(4)) == _codes(auto_allocate(t, 4))
+    assert seat_pool(702, 997).built_rows() == 1
+    assert _codes(table.preview(1000)) == _codes(auto_allocate(t, 1000))
+    assert _codes(table.preview(2)) == _codes(auto_allocate(t, 2))
+    assert seat_pool(702, 997).built_rows() == 2
+
+    small = PreviewTable(Theater("Film", 2, 3), "greedy")
+    assert small.preview(7) is None
+    assert _codes(small.preview(6)) == _codes(auto_allocate(small.theater, 6))
@@ -0,0 +1,86 @@
+import pytest
+
+from src.cli.commands.profile import ProfileCommand
+from src.core.allocation import auto_allocate
+from src.core.profiling import Profiler
+from src.models.context import AppContext
+from src.models.entities import Theater
+
+
+def test_unarmed_profiler_is_passthrough(tmp_path) -> None:
+    prof = Profiler(out_dir=str(tmp_path))
+    with prof.capture("Book tickets"):
+        pass
+    assert prof.last_report is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_report_written_after_n_commands(tmp_path) -> None:
+    prof = Profiler(out_dir=str(tmp_path))
+    prof.arm(2, cpu=True, memory=True)
+    t = Theater("Film", 10, 20)
+
+    with prof.capture("Book tickets"):
+        auto_allocate(t, 15)
+    assert prof.armed and prof.last_report is None
+    with prof.capture("Check bookings"):
+        auto_allocate(t, 5)
+
+    assert not prof.armed
+    report = open(prof.last_report, encoding="utf-8").read()
+    assert "Book tickets, Check bookings" in report
+    assert "auto_allocate" in report
+    assert "allocation sites" in report
+    assert any(p.suffix == ".prof" for p in tmp_path.iterdir())
+
+
+def test_close_flushes_partial_session(tmp_path) -> None:
+    prof = Profiler(out_dir=str(tmp_path))
+    prof.arm(3, cpu=False, memory=True)
+    with prof.capture("Book tickets"):
+        [0] * 1000
+    assert prof.close() is not None
+    assert prof.close() is None
+
+
+def test_arm_rejects_empty_modes() -> None:
+    with pytest.raises(ValueError):
+        Profiler().arm(1, cpu=False, memory=False)
+
+
+def test_profile_command_arms_profiler(script_io_factory, tmp_path) -> None:
+    prof = Profiler(out_dir=str(tmp_path))
+    cmd = ProfileCommand(profiler=prof)
+    io = script_io_factory(["x", "3 both"])
+    ctx = AppContext(theater=Theater("Film", 1, 1))
+
+    cmd.run(ctx, io)
+
+    assert prof.remaining == 3
+    assert "(3 remaining)" in cmd.display_label(ctx)
+    assert any("positive integer" in out for out in io.outputs)
+
+
+def test_rearm_during_capture_applies_after_the_command(tmp_path) -> None:
+    prof = Profiler(out_dir=str(tmp_path))
+    prof.arm(3, cpu=True)
+    t = Theater("Film", 10, 20)
+    with prof.capture("Book tickets"):
+        auto_allocate(t, 5)
+    with prof.capture("Profile next commands"):
+        prof.arm(2, cpu=True, memory=True)
+        assert prof.remaining == 2  # the running session is untouched
+        auto_allocate(t, 5)
+
+    first_path = prof.last_report
+    first = open(first_path, encoding="utf-8").read()
+    assert "Commands profiled: Book tickets, Profile next commands" in first
+    assert prof.remaining == 2
+    with prof.capture("Check bookings"):
+        auto_allocate(t, 5)
+    with prof.capture("Book tickets"):
+        pass
+    assert prof.last_report != first_path  # same second, distinct names
+    second = open(prof.last_report, encoding="utf-8").read()
+    assert "Commands profiled: Check bookings, Book tickets" in second
+    assert "allocation sites" in second
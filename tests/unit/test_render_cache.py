@@ -0,0 +1,62 @@
+from src.core.renderers.ascii_renderer import AsciiRenderer
+from src.core.renderers.cached import CachingRenderer
+from src.models.entities import Seat, Theater
+
+
+class _CountingAscii(AsciiRenderer):
+    def __init__(self) -> None:
+        self.rows_rendered: list[int] = []
+
+    def render_row(
+        self, theater, row_idx, current_booking_id=None, preview_cols=frozenset()
+    ):
+        self.rows_rendered.append(row_idx)
+        return super().render_row(theater, row_idx, current_booking_id, preview_cols)
+
+
+def test_cached_output_matches_inner_renderer() -> None:
+    t = Theater("Film", 3, 5)
+    t.assign(0, 2, "GIC0001")
+    cache = CachingRenderer(AsciiRenderer())
+    preview = [Seat("B", 1), Seat("B", 2)]
+    for kwargs in ({}, {"current_booking_id": "GIC0001"}, {"preview_seats": preview}):
+        assert cache.seat_map(t, **kwargs) == AsciiRenderer().seat_map(t, **kwargs)
+
+
+def test_repeat_lookup_is_a_hit() -> None:
+    t = Theater("Film", 2, 4)
+    cache = CachingRenderer(AsciiRenderer())
+    first = cache.seat_map(t, current_booking_id="GIC0001")
+    assert cache.seat_map(t, current_booking_id="GIC0001") is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_commit_rebuilds_only_dirty_rows() -> None:
+    t = Theater("Film", 4, 4)
+    inner = _CountingAscii()
+    cache = CachingRenderer(inner)
+    cache.seat_map(t)
+    assert sorted(inner.rows_rendered) == [0, 1, 2, 3]
+
+    inner.rows_rendered.clear()
+    t.assign(2, 1, "GIC0001")
+    out = cache.seat_map(t)
+    assert inner.rows_rendered == [2]
+    assert out == AsciiRenderer().seat_map(t)
+
+
+def test_lru_bound_evicts_oldest() -> None:
+    t = Theater("Film", 1, 3)
+    cache = CachingRenderer(AsciiRenderer(), maxsize=2)
+    for bid in ("GIC0001", "GIC0002", "GIC0003"):
+        cache.seat_map(t, current_booking_id=bid)
+    assert len(cache._maps) == 2
+    cache.seat_map(t, current_booking_id="GIC0001")
+    assert cache.hits == 0
+
+
+def test_distinct_screens_do_not_share_entries() -> None:
+    a, b = Theater("Film", 1, 3), Theater("Film", 1, 3)
+    b.assign(0, 1, "GIC0001")
+    cache = CachingRenderer(AsciiRenderer())
+    assert cache.seat_map(a) != cache.seat_map(b)
@@ -0,0 +1,125 @@
+import json
+
+import pytest
+
+from src.cli.commands.screening import SelectScreeningCommand
+from src.core.allocation import compile_layout
+from src.core.layout import parse_layout_text
+from src.core.schedule import load_schedule, parse_schedule, single_screening
+from src.core.services.booking import BookingService
+from src.models.context import AppContext
+from src.models.schedule import Schedule
+
+
+def _schedule() -> Schedule:
+    schedule = Schedule()
+    schedule.add_auditorium("1", 2, 5)
+    schedule.add_auditorium("2", 2, 4, parse_layout_text(" .. \n....\n"))
+    schedule.add_screening("1", "18:00", "Inception")
+    schedule.add_screening("2", "18:00", "Dune")
+    schedule.add_screening("2", "21:00", "Dune")
+    return schedule
+
+
+def test_screenings_materialise_lazily() -> None:
+    schedule = _schedule()
+    assert schedule.materialised() == []
+    assert [s.available() for s in schedule] == [10, 6, 6]
+    assert schedule.materialised() == []
+
+    ctx = AppContext(theater=schedule.screenings[("1", "18:00")].materialise())
+    schedule.activate(ctx, ("2", "21:00"))
+    assert [s.key for s in schedule.materialised()] == [("1", "18:00"), ("2", "21:00")]
+    assert ctx.screening == ("2", "21:00")
+
+
+def test_screenings_share_the_auditorium_layout() -> None:
+    schedule = _schedule()
+    early, late = (schedule.screenings[("2", t)] for t in ("18:00", "21:00"))
+    a, b = early.materialise(), late.materialise()
+    assert a.layout is b.layout
+    assert compile_layout(a.layout) is compile_layout(b.layout)
+    assert a.grid is not b.grid
+
+
+def test_activate_switches_bookings_and_keeps_ids_unique() -> None:
+    schedule = _schedule()
+    svc = BookingService()
+    ctx = AppContext(theater=schedule.screenings[("1", "18:00")].materialise())
+    schedule.activate(ctx, ("1", "18:00"))
+    first = ctx.generate_booking_id()
+    svc.commit_booking(ctx, first, svc.preview_auto(ctx, 2))
+
+    schedule.activate(ctx, ("2", "18:00"))
+    assert ctx.bookings == {}
+    second = ctx.generate_booking_id()
+    svc.commit_booking(ctx, second, svc.preview_auto(ctx, 3))
+    assert first != second
+
+    schedule.activate(ctx, ("1", "18:00"))
+    assert list(ctx.bookings) == [first]
+    assert [s.available() for s in schedule] == [8, 3, 6]
+
+
+def test_schedule_rejects_bad_definitions() -> None:
+    schedule = _schedule()
+    with pytest.raises(ValueError):
+        schedule.add_auditorium("1", 2, 5)
+    with pytest.raises(ValueError):
+        schedule.add_screening("3", "18:00", "Dune")
+    with pytest.raises(ValueError):
+        schedule.add_screening("2", "18:00", "Alien")
+    with pytest.raises(ValueError):
+        single_screening("Film", 3, 3, parse_layout_text("..\n"))
+
+
+def test_load_schedule_resolves_layouts_once(tmp_path) -> None:
+    (tmp_path / "hall.txt").write_text(" .. \n....\n", encoding="utf-8")
+    data = {
+        "screens": [
+            {"name": "1", "rows": 2, "cols": 5},
+            {"name": "2", "rows": 2, "cols": 4, "layout": "hall.txt"},
+        ],
+        "screenings": [
+            {"screen": "2", "showtime": "18:00", "title": "Dune"},
+            {"screen": "2", "showtime": "21:00", "title": "Dune"},
+            {"screen": "1", "showtime": "19:00", "title": "Alien"},
+        ],
+    }
+    path = tmp_path / "schedule.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+    schedule = load_schedule(str(path))
+    assert [s.label() for s in schedule][2] == "Alien - screen 1, 19:00"
+    early, late, _ = schedule
+    assert early.auditorium is late.auditorium
+    assert early.auditorium.layout.sellable() == 6
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"screens": []},
+        {"screens": [], "screenings": []},
+        {"screens": [{"name": "1", "rows": 0, "cols": 5}], "screenings": []},
+    ],
+)
+def test_invalid_schedules_raise(data) -> None:
+    with pytest.raises(ValueError):
+        parse_schedule(data)
+
+
+def test_select_screening_command(script_io_factory) -> None:
+    schedule = _schedule()
+    ctx = AppContext(theater=schedule.screenings[("1", "18:00")].materialise())
+    schedule.activate(ctx, ("1", "18:00"))
+    cmd = SelectScreeningCommand(schedule)
+    assert cmd.display_label(ctx).endswith("(current: Inception - screen 1, 18:00)")
+
+    io = script_io_factory(["9", "3"])
+    cmd.run(ctx, io)
+
+    assert "  [3] Dune - screen 2, 21:00 (6 seats available)" in io.outputs
+    assert any("between 1 and 3" in out for out in io.outputs)
+    assert ctx.screening == ("2", "21:00")
+    assert ctx.theater is schedule.screenings[("2", "21:00")].theater
@@ -0,0 +1,84 @@
+from src.cli.commands.find import FindSeatsCommand
+from src.core.layout import parse_layout_text
+from src.core.search import SeatSearchIndex, longest_run
+from src.core.services.booking import BookingService
+from src.core.spacing import SpacingRules
+from src.models.context import AppContext
+from src.models.schedule import Schedule
+
+
+def _setup():
+    schedule = Schedule()
+    schedule.add_auditorium("1", 2, 6)
+    schedule.add_auditorium("2", 2, 8, parse_layout_text("...xx...\n........\n"))
+    schedule.add_screening("1", "18:00", "Dune")
+    schedule.add_screening("2", "21:00", "Dune")
+    schedule.add_screening("1", "21:00", "Alien")
+    svc = BookingService()
+    index = SeatSearchIndex(schedule, svc.events)
+    ctx = AppContext(theater=schedule.screenings[("1", "18:00")].materialise())
+    schedule.activate(ctx, ("1", "18:00"))
+    return schedule, svc, index, ctx
+
+
+def _codes(seats):
+    return [s.code() for s in seats]
+
+
+def test_longest_run() -> None:
+    assert longest_run([]) == 0
+    assert longest_run([True, True, False, True, True, True]) == 3
+
+
+def test_find_prefers_emptiest_screening_without_materialising() -> None:
+    schedule, _, index, _ = _setup()
+    found = index.find("dune", 4)
+    assert found is not None
+    assert found.screening.key == ("2", "21:00")  # 14 free vs 12
+    assert _codes(found.seats) == ["B03", "B04", "B05", "B06"]
+    assert schedule.screenings[("2", "21:00")].theater is None
+    assert index.find("Dune", 9) is None
+    assert index.find("Jaws", 1) is None
+
+
+def test_bookings_update_the_index(script_io_factory) -> None:
+    schedule, svc, index, ctx = _setup()
+    schedule.activate(ctx, ("2", "21:00"))
+    svc.commit_booking(ctx, ctx.generate_booking_id(), svc.preview_auto(ctx, 6))
+    assert index.longest(("2", "21:00")) == 8  # row A is now full, B is empty
+
+    found = index.find("Dune", 3)
+    assert found.screening.key == ("1", "18:00")
+    assert _codes(found.seats) == ["A02", "A03", "A04"]
+
+    # A cancellation frees the row again.
+    svc.cancel_booking(ctx, next(iter(ctx.bookings)))
+    assert index.find("Dune", 3).screening.key == ("2", "21:00")
+
+
+def test_find_command_books_on_the_found_screening(script_io_factory) -> None:
+    schedule, svc, index, ctx = _setup()
+    cmd = FindSeatsCommand(schedule, index, svc)
+    io = script_io_factory(["Dune", "x", "5", "y"])
+    cmd.run(ctx, io)
+
+    assert "Best match: Dune - screen 2, 21:00, seats B02-B06 (14 seats available)" in (
+        io.outputs
+    )
+    assert ctx.screening == ("2", "21:00")
+    assert _codes(ctx.bookings["GIC0001"].seats) == ["B02", "B03", "B04", "B05", "B06"]
+    assert index.longest(("2", "21:00")) == 3
+
+
+def test_find_respects_spacing_rules() -> None:
+    schedule = Schedule()
+    schedule.add_auditorium("1", 1, 6)
+    schedule.add_screening("1", "18:00", "Dune")
+    screening = schedule.screenings[("1", "18:00")]
+    screening.materialise().assign(0, 3, "GIC0001")
+    rules = SpacingRules(gap=1)
+    index = SeatSearchIndex(schedule, rules=rules)
+
+    assert index.longest(("1", "18:00")) == 3  # A04-A06, ignoring the rules
+    assert _codes(index.find("Dune", 2).seats) == ["A05", "A06"]
+    assert index.find("Dune", 3) is None
@@ -1,11 +1,17 @@
+from dataclasses import FrozenInstanceError
+
 import pytest
 
+from src.core.allocation import auto_allocate, manual_allocate
 from src.core.seat_utils import (
     row_index_to_letter,
     row_letter_to_index,
     parse_seat_code,
     format_seat_code,
+    seat_at,
+    seat_pool,
 )
+from src.models.entities import Seat, Theater
 
 
 def test_row_index_to_letter_valid() -> None:
@@ -13,7 +19,7 @@ def test_row_index_to_letter_valid() -> None:
     assert row_index_to_letter(25) == "Z"
 
 
-@pytest.mark.parametrize("bad", [-1, 26, 100])
+@pytest.mark.parametrize("bad", [-1, 702, 10000])
 def test_row_index_to_letter_invalid(bad: int) -> None:
     with pytest.raises(ValueError):
         row_index_to_letter(bad)
@@ -25,7 +31,15 @@ def test_row_letter_to_index_valid() -> None:
     assert row_letter_to_index("Z") == 25
 
 
-@pytest.mark.parametrize("bad", ["", "AA", "1", "-", "_"])
+def test_multi_letter_rows_round_trip() -> None:
+    assert row_index_to_letter(26) == "AA"
+    assert row_index_to_letter(27) == "AB"
+    assert row_index_to_letter(701) == "ZZ"
+    assert all(row_letter_to_index(row_index_to_letter(i)) == i for i in range(702))
+    assert row_letter_to_index(" ab ") == 27
+
+
+@pytest.mark.parametrize("bad", ["", "AAA", "1", "-", "_", "A1"])
 def test_row_letter_to_index_invalid(bad: str) -> None:
     with pytest.raises(ValueError):
         row_letter_to_index(bad)
@@ -38,8 +52,11 @@ def test_parse_seat_code_ok() -> None:
     seat2 = parse_seat_code("c9")
     assert seat2.row == "C" and seat2.col == 9
 
+    seat3 = parse_seat_code("ab112")
+    assert seat3.row == "AB" and seat3.col == 112
+
 
-@pytest.mark.parametrize("bad", ["", "3B", "B0x", "BB03", "B"])
+@pytest.mark.parametrize("bad", ["", "3B", "B0x", "ABC03", "B", "B00"])
 def test_parse_seat_code_invalid(bad: str) -> None:
     with pytest.raises(ValueError):
         parse_seat_code(bad)
@@ -48,3 +65,27 @@ def test_parse_seat_code_invalid(bad: str) -> None:
 def test_format_seat_code() -> None:
     assert format_seat_code(0, 1) == "A01"
     assert format_seat_code(2, 12) == "C12"
+    assert format_seat_code(27, 112) == "AB112"
+
+
+def test_seats_are_pooled_and_immutable() -> None:
+    table = seat_pool(3, 4)
+    assert table[1][2] is seat_pool(3, 4)[1][2]
+    assert seat_at(1, 3) is parse_seat_code("b3") == table[1][2]
+    assert table[1][2].code() == "B03" and repr(table[1][2]) == "Seat(row='B', col=3)"
+    assert Seat("B", 3) == table[1][2] and hash(Seat("B", 3)) == hash(table[1][2])
+    assert parse_seat_code("A1000").code() == "A1000"
+    with pytest.raises(FrozenInstanceError):
+        table[0][0].col = 2
+    t = Theater("Film", 3, 4)
+    seats = auto_allocate(t, 6) + manual_allocate(t, 2, parse_seat_code("C3"))
+    assert all(s is table[ord(s.row) - ord("A")][s.col - 1] for s in seats)
+
+
+def test_seat_pool_builds_rows_on_first_use() -> None:
+    t = Theater("Big", 702, 999)
+    auto_allocate(t, 4)
+    pool = seat_pool(702, 999)
+    assert pool.built_rows() == 1
+    assert pool[701][998].code() == "ZZ999"
+    assert pool.built_rows() == 2
@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from src.core.simulation import (
+    METRICS,
+    RunningStats,
+    SimulationSpec,
+    SimulationSummary,
+    is_split,
+    night_rng,
+    run_simulation,
+    simulate_night,
+    stranded_seats,
+)
+from src.core.workload import WorkloadModel
+from src.models.entities import Booking, Seat, Theater
+
+
+def _summary_tuple(summary: SimulationSummary) -> dict:
+    return {
+        name: (s.count, s.low, s.high, round(s.mean, 9), round(s.stdev, 9))
+        for name, s in summary.stats.items()
+    }
+
+
+def test_running_stats_merge_matches_sequential() -> None:
+    rng = random.Random(3)
+    values = [rng.uniform(-5, 20) for _ in range(101)]
+    whole = RunningStats()
+    for v in values:
+        whole.add(v)
+    left, right = RunningStats(), RunningStats()
+    for v in values[:40]:
+        left.add(v)
+    for v in values[40:]:
+        right.add(v)
+    left.merge(right)
+    left.merge(RunningStats())
+    assert left.count == whole.count == 101
+    assert left.mean == pytest.approx(sum(values) / 101)
+    assert left.stdev == pytest.approx(whole.stdev)
+    assert (left.low, left.high) == (min(values), max(values))
+
+
+def test_stranded_seats_counts_isolated_free_seats() -> None:
+    t = Theater("T", 2, 5)
+    for r, c in ((0, 2), (0, 5), (1, 1), (1, 2), (1, 3), (1, 4)):
+        t.assign(r, c, "X")
+    # A01 and B05 are stranded, A03-A04 are not.
+    assert stranded_seats(t) == 2
+
+
+def test_is_split() -> None:
+    together = Booking("B1", [Seat("A", 3), Seat("A", 4)])
+    gap = Booking("B2", [Seat("A", 3), Seat("A", 5)])
+    rows = Booking("B3", [Seat("A", 5), Seat("B", 5)])
+    assert not is_split(together)
+    assert is_split(gap)
+    assert is_split(rows)
+
+
+def test_simulate_night_is_deterministic_and_sane() -> None:
+    spec = SimulationSpec(8, 10)
+    first = simulate_night(spec, night_rng(7, 0))
+    assert first == simulate_night(spec, night_rng(7, 0))
+    assert 0.0 < first.fill_rate <= 1.0
+    assert first.stranded_seats >= 0 and first.split_parties >= 0
+
+
+def test_singles_fill_the_house_without_splits() -> None:
+    spec = SimulationSpec(
+        4, 6, model=WorkloadModel((1,), (1.0,), reseat_probability=0.0), demand_sd=0.0
+    )
+    night = simulate_night(spec, night_rng(0, 0))
+    assert night.fill_rate == 1.0
+    assert (night.stranded_seats, night.split_parties, night.turned_away) == (0, 0, 0)
+
+
+def test_parallel_run_matches_serial_run() -> None:
+    spec = SimulationSpec(6, 8, allocator="best-fit")
+    serial = run_simulation(spec, 30, seed=5, workers=1)
+    parallel = run_simulation(spec, 30, seed=5, workers=2, chunk_size=7)
+    assert serial.nights == parallel.nights == 30
+    assert _summary_tuple(serial) == _summary_tuple(parallel)
+    assert set(serial.stats) == set(METRICS)
+
+
+def test_spec_validation() -> None:
+    with pytest.raises(ValueError):
+        SimulationSpec(0, 10)
+    with pytest.raises(ValueError):
+        SimulationSpec(5, 10, demand=-0.5)
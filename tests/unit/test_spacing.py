@@ -0,0 +1,93 @@
+import pytest
+
+from src.config import load_settings
+from src.core.allocation import auto_allocate, manual_allocate
+from src.core.errors import RuleViolation
+from src.core.layout import parse_layout_text
+from src.core.spacing import SpacingRules, make_mask, occupied_bits, spread
+from src.core.validators import parse_spacing_rules, validate_start_seat
+from src.models.entities import Seat, Theater
+
+
+def _codes(seats):
+    return [s.code() for s in seats]
+
+
+def _book(theater: Theater, owner: str, *codes: str) -> None:
+    for code in codes:
+        theater.assign(ord(code[0]) - ord("A"), int(code[1:]), owner)
+
+
+@pytest.mark.parametrize("gap", [0, 1, 2, 3, 5, 8])
+def test_spread_covers_exactly_gap_seats(gap: int) -> None:
+    bits = 1 << 10
+    expected = sum(1 << i for i in range(10 - gap, 11 + gap))
+    assert spread(bits, gap) == expected
+
+
+def test_occupied_bits_ignore_layout_sentinels() -> None:
+    t = Theater("Hall", 1, 6, layout=parse_layout_text("x.. ..\n"))
+    _book(t, "GIC0001", "A02")
+    assert occupied_bits(t.grid[0]) == 0b10
+
+
+def test_inactive_rules_need_no_mask() -> None:
+    t = Theater("Film", 1, 4)
+    assert make_mask(t, None) is None
+    assert make_mask(t, SpacingRules()) is None
+    with pytest.raises(ValueError):
+        SpacingRules(gap=-1)
+
+
+def test_auto_allocate_keeps_gap_between_parties() -> None:
+    t = Theater("Film", 2, 8)
+    _book(t, "GIC0001", "A04", "A05")
+    seats = auto_allocate(t, 2, SpacingRules(gap=1))
+    # A03 and A06 are next to the first party, so the row's outer seats are used.
+    assert _codes(seats) == ["A02", "A07"]
+    assert _codes(auto_allocate(t, 2)) == ["A03", "A06"]
+
+
+def test_auto_allocate_avoids_seats_in_front_and_behind() -> None:
+    t = Theater("Film", 2, 3)
+    _book(t, "GIC0001", "A02")
+    seats = auto_allocate(t, 3, SpacingRules(gap=1, no_behind=True))
+    assert seats is None
+    assert _codes(auto_allocate(t, 2, SpacingRules(no_behind=True))) == [
+        "A01",
+        "A03",
+    ]
+    assert _codes(auto_allocate(t, 3, SpacingRules(no_behind=True))) == [
+        "A01",
+        "A03",
+        "B01",
+    ]
+
+
+def test_manual_allocate_skips_forbidden_seats() -> None:
+    t = Theater("Film", 2, 6)
+    _book(t, "GIC0001", "A03")
+    seats = manual_allocate(t, 3, Seat("A", 1), SpacingRules(gap=1))
+    assert _codes(seats) == ["A01", "A05", "A06"]
+
+
+def test_validate_start_seat_raises_rule_violation() -> None:
+    t = Theater("Film", 2, 6)
+    _book(t, "GIC0001", "A03")
+    rules = SpacingRules(gap=2, no_behind=True)
+    validate_start_seat(t, Seat("A", 6), rules)
+    for code in ("A05", "B03"):
+        with pytest.raises(RuleViolation):
+            validate_start_seat(t, Seat(code[0], int(code[1:])), rules)
+
+
+def test_parse_spacing_rules_and_setting() -> None:
+    assert parse_spacing_rules("2") == SpacingRules(gap=2)
+    assert parse_spacing_rules(" 0 Behind ") == SpacingRules(no_behind=True)
+    for bad in ("", "-1", "1 aside", "1 behind x"):
+        with pytest.raises(ValueError):
+            parse_spacing_rules(bad)
+    assert load_settings(
+        {"GIC_SPACING": "1 behind"}
+    ).allocation.spacing == SpacingRules(1, True)
+    assert load_settings({}).allocation.spacing is None
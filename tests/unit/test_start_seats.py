@@ -0,0 +1,62 @@
+import random
+
+from src.cli.commands.book import BookCommand
+from src.core.allocation import manual_allocate
+from src.core.renderers.ascii_renderer import AsciiRenderer
+from src.core.seat_utils import row_index_to_letter
+from src.core.services.booking import BookingService
+from src.core.spacing import SpacingRules, make_mask
+from src.core.start_seats import StartSeat, recommend_start_seats
+from src.models.context import AppContext
+from src.models.entities import Seat, Theater
+
+
+def test_suggestions_are_exactly_the_working_start_seats() -> None:
+    rng = random.Random(3)
+    for rules in (None, SpacingRules(gap=1, no_behind=True)):
+        t = Theater("Film", 5, 7)
+        for _ in range(12):
+            r, c = rng.randrange(5), rng.randint(1, 7)
+            if t.grid[r][c - 1] is None:
+                t.assign(r, c, "GIC0001")
+        mask = make_mask(t, rules)
+        for k in range(1, 12):
+            suggested = {
+                s.seat.code() for s in recommend_start_seats(t, k, rules, limit=35)
+            }
+            working = {
+                f"{row_index_to_letter(r)}{c:02d}"
+                for r in range(5)
+                for c in range(1, 8)
+                if t.grid[r][c - 1] is None
+                and (mask is None or mask.allows(r, c))
+                and manual_allocate(t, k, Seat(row_index_to_letter(r), c), rules)
+            }
+            assert suggested == working
+
+
+def test_whole_adjacent_central_blocks_rank_first() -> None:
+    t = Theater("Film", 2, 6)
+    t.assign(1, 3, "GIC0001")
+    assert recommend_start_seats(t, 3, limit=4) == [
+        StartSeat(Seat("A", 2), in_row=3, adjacent=True),
+        StartSeat(Seat("A", 3), in_row=3, adjacent=True),
+        StartSeat(Seat("A", 1), in_row=3, adjacent=True),
+        StartSeat(Seat("A", 4), in_row=3, adjacent=True),
+    ]
+    # B02 spans the taken B03; B04 is the only adjacent block in row B.
+    ranked = [s.seat.code() for s in recommend_start_seats(t, 3, limit=10)]
+    assert ranked.index("B04") < ranked.index("B02")
+    assert recommend_start_seats(t, 12) == []
+    assert recommend_start_seats(t, 3, limit=0) == []
+
+
+def test_failed_reseat_lists_start_seats(script_io_factory) -> None:
+    io = script_io_factory(["3", "B03", ""])
+    ctx = AppContext(theater=Theater("Film", 2, 4))
+    cmd = BookCommand(renderer=AsciiRenderer(), service=BookingService())
+
+    cmd.run(ctx, io)
+
+    assert "Start seats that fit 3: A01, A02, B01, B02, A03" in io.outputs
+    assert len(ctx.bookings) == 1
@@ -0,0 +1,106 @@
+import io
+import json
+import threading
+
+import pytest
+
+from src.core.services.booking import BookingService
+from src.core.tracing import TraceWriter, Tracer, annotate
+from src.models.context import AppContext
+from src.models.entities import Theater
+
+
+def _records(buf: io.StringIO) -> list[dict]:
+    return [json.loads(line) for line in buf.getvalue().splitlines()]
+
+
+def test_nested_spans_share_trace_and_link_parent() -> None:
+    buf = io.StringIO()
+    tracer = Tracer(TraceWriter(buf), sample_rate=1.0)
+    with tracer.span("command", screen="Film") as root:
+        with tracer.span("service.preview_auto", party_size=2):
+            pass
+        annotate(party_size=2)
+    tracer.close()
+
+    child, parent = _records(buf)
+    assert parent["span_id"] == root.span_id and parent["parent_id"] is None
+    assert child["parent_id"] == parent["span_id"]
+    assert child["trace_id"] == parent["trace_id"]
+    assert parent["party_size"] == 2 and parent["screen"] == "Film"
+    assert parent["outcome"] == "ok" and parent["duration_ms"] >= 0
+
+
+def test_unsampled_trace_records_nothing() -> None:
+    buf = io.StringIO()
+    tracer = Tracer(TraceWriter(buf), sample_rate=0.5, rng=lambda: 0.9)
+    with tracer.span("command") as span:
+        with tracer.span("service.commit_booking"):
+            annotate(party_size=3)
+    tracer.close()
+
+    assert not span.sampled
+    assert buf.getvalue() == ""
+
+
+def test_unsampled_placeholder_ignores_writes() -> None:
+    tracer = Tracer(TraceWriter(io.StringIO()), sample_rate=0.5, rng=lambda: 0.9)
+    with tracer.span("command") as span:
+        span.outcome = "unallocatable"
+        span.set(party_size=3)
+    with tracer.span("command") as other:
+        assert other is span
+        assert other.outcome == "ok" and other.attrs == {}
+    tracer.close()
+
+
+def test_error_and_exit_outcomes() -> None:
+    buf = io.StringIO()
+    tracer = Tracer(TraceWriter(buf))
+    with pytest.raises(KeyError):
+        with tracer.span("command"):
+            raise KeyError("x")
+    with pytest.raises(SystemExit):
+        with tracer.span("command"):
+            raise SystemExit(0)
+    tracer.close()
+
+    err, ext = _records(buf)
+    assert err["outcome"] == "error" and err["error"] == "KeyError"
+    assert ext["outcome"] == "exit"
+
+
+def test_full_queue_drops_instead_of_blocking() -> None:
+    entered, release = threading.Event(), threading.Event()
+
+    class _SlowStream(io.StringIO):
+        def write(self, s: str) -> int:
+            entered.set()
+            release.wait(2)
+            return super().write(s)
+
+    writer = TraceWriter(_SlowStream(), maxsize=1)
+    writer.submit({"name": "first"})  # picked up by the writer, which then stalls
+    assert entered.wait(2)
+    writer.submit({"name": "queued"})
+    writer.submit({"name": "dropped"})
+    assert writer.dropped == 1
+    release.set()
+    writer.close()
+
+
+def test_service_calls_are_traced() -> None:
+    buf = io.StringIO()
+    tracer = Tracer(TraceWriter(buf))
+    ctx = AppContext(theater=Theater("Film", 2, 4))
+    svc = BookingService(tracer=tracer)
+
+    seats = svc.preview_auto(ctx, 3)
+    svc.commit_booking(ctx, svc.new_provisional_id(ctx), seats)
+    tracer.close()
+
+    names = [(r["name"], r["party_size"], r["screen"]) for r in _records(buf)]
+    assert names == [
+        ("service.preview_auto", 3, "Film"),
+        ("service.commit_booking", 3, "Film"),
+    ]
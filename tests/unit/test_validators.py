@@ -4,6 +4,7 @@ from src.core.validators import (
     parse_init_line,
     parse_ticket_count,
     parse_booking_id,
+    parse_profile_request,
     validate_start_seat,
 )
 from src.models.entities import Theater, Seat
@@ -36,6 +37,10 @@ def test_parse_init_line_title_with_spaces() -> None:
     assert cols == 20
 
 
+def test_parse_init_line_large_house() -> None:
+    assert parse_init_line("Arena 702 999") == ("Arena", 702, 999)
+
+
 @pytest.mark.parametrize(
     "text",
     [
@@ -43,9 +48,9 @@ def test_parse_init_line_title_with_spaces() -> None:
         "OnlyTitle",  # too few parts
         "NoNumbers x y",  # not integers
         "Film 0 5",  # invalid rows
-        "Film 27 5",  # invalid rows
+        "Film 703 5",  # invalid rows
         "Film 5 0",  # invalid cols
-        "Film 5 51",  # invalid cols
+        "Film 5 1000",  # invalid cols
         "  7  9",  # missing title
     ],
 )
@@ -74,3 +79,17 @@ def test_parse_booking_id_valid(good: str) -> None:
 def test_parse_booking_id_invalid(bad: str) -> None:
     with pytest.raises(ValueError):
         parse_booking_id(bad)
+
+
+@pytest.mark.parametrize(
+    "good,expected",
+    [("5", (5, True, False)), ("2 mem", (2, False, True)), ("1 BOTH", (1, True, True))],
+)
+def test_parse_profile_request_valid(good: str, expected: tuple) -> None:
+    assert parse_profile_request(good) == expected
+
+
+@pytest.mark.parametrize("bad", ["", "0", "x cpu", "3 gpu", "3 cpu extra"])
+def test_parse_profile_request_invalid(bad: str) -> None:
+    with pytest.raises(ValueError):
+        parse_profile_request(bad)
@@ -0,0 +1,63 @@
+from src.core.renderers.ascii_renderer import AsciiRenderer
+from src.core.renderers.base import Viewport, render_map, viewport_around
+from src.models.entities import Seat, Theater
+
+
+def test_small_house_renders_in_full() -> None:
+    t = Theater("Film", 4, 6)
+    preview = [Seat("B", 2)]
+    r = AsciiRenderer()
+    assert render_map(r, t, preview_seats=preview) == r.seat_map(
+        t, preview_seats=preview
+    )
+
+
+def test_window_centres_on_focus_and_clamps() -> None:
+    t = Theater("Film", 20, 40)
+    assert viewport_around(t, [Seat("J", 20), Seat("J", 21)], 4, 10) == Viewport(
+        8, 12, 15, 25
+    )
+    assert viewport_around(t, [Seat("A", 1)], 4, 10) == Viewport(0, 4, 0, 10)
+    assert viewport_around(t, None, 4, 10) == Viewport(0, 4, 15, 25)
+
+
+def test_viewport_renders_window_and_summary() -> None:
+    t = Theater("Film", 10, 20)
+    t.assign(9, 1, "GIC0001")  # J01, hidden above
+    t.assign(4, 1, "GIC0002")  # E01, hidden to the left
+    out = render_map(
+        AsciiRenderer(),
+        t,
+        preview_seats=[Seat("E", 10), Seat("E", 11)],
+        max_rows=3,
+        max_cols=6,
+    )
+    lines = out.splitlines()
+
+    assert [line[0] for line in lines[2:5]] == ["F", "E", "D"]
+    assert lines[3] == "E  . . o o . ."
+    assert lines[5] == "   8 9 10 11 12 13"
+    assert "Showing rows D-F, seats 8-13 of 10 rows x 20 seats." in out
+    assert "rows G-J (79 free)" in out
+    assert "rows A-C (60 free)" in out
+    assert "other seats in rows D-F (41 free)" in out
+
+
+def test_viewport_never_touches_hidden_rows() -> None:
+    t = Theater("Film", 26, 50)
+    window = Viewport(10, 13, 20, 30)
+    for r in range(26):
+        if not 10 <= r < 13:
+            t.grid[r] = None  # any access would raise
+    out = AsciiRenderer().viewport(t, window, preview_seats=[Seat("L", 25)])
+    assert out.splitlines()[3].startswith("L  ")
+
+
+def test_hidden_free_counts_near_the_back() -> None:
+    t = Theater("Film", 10, 20)
+    t.assign(0, 1, "GIC0001")  # A01, hidden in front
+    t.assign(9, 5, "GIC0002")  # J05, hidden behind
+    assert t.free == 198
+    out = AsciiRenderer().viewport(t, Viewport(6, 9, 0, 20))
+    assert "rows J-J (19 free)" in out
+    assert "rows A-F (119 free)" in out
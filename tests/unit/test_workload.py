@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from src.core.services.booking import BookingService
+from src.core.workload import WorkloadModel, fill_to_occupancy
+from src.models.context import AppContext
+from src.models.entities import Theater
+
+
+def test_requests_follow_model_and_seed() -> None:
+    model = WorkloadModel(party_sizes=(2, 4), party_weights=(1, 1))
+    a = [r.party_size for _, r in zip(range(50), model.requests(random.Random(1)))]
+    b = [r.party_size for _, r in zip(range(50), model.requests(random.Random(1)))]
+    assert a == b
+    assert set(a) == {2, 4}
+
+
+def test_fill_to_occupancy_reaches_target() -> None:
+    ctx = AppContext(theater=Theater("Film", 10, 10))
+    n = fill_to_occupancy(ctx, BookingService(), 0.5, WorkloadModel(), random.Random(3))
+    assert n == len(ctx.bookings) > 0
+    assert ctx.theater.available() == 50
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"party_sizes": (1, 2), "party_weights": (1.0,)},
+        {"party_sizes": (0,), "party_weights": (1.0,)},
+        {"reseat_probability": 1.5},
+    ],
+)
+def test_invalid_model_rejected(kwargs: dict) -> None:
+    with pytest.raises(ValueError):
+        WorkloadModel(**kwargs)